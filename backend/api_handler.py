@@ -9,6 +9,7 @@ from ariadne import (
     gql,
     graphql_sync,
 )
+from botocore.exceptions import ClientError
 
 from dataall.base.api import bootstrap as bootstrap_schema, get_executable_schema
 from dataall.core.tasks.service_handlers import Worker
@@ -20,6 +21,8 @@ from dataall.core.permissions.db.tenant_policy_repositories import TenantPolicy
 from dataall.base.db import get_engine
 from dataall.core.permissions import permissions
 from dataall.base.loader import load_modules, ImportMode
+from dataall.base.utils import Parameter
+from dataall.base.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
@@ -34,9 +37,17 @@ SCHEMA = bootstrap_schema()
 TYPE_DEFS = gql(SCHEMA.gql(with_directives=False))
 REAUTH_TTL = int(os.environ.get('REAUTH_TTL', '5'))
 ENVNAME = os.getenv('envname', 'local')
+if ENVNAME not in ['local', 'pytest', 'dkrcompose']:
+    Parameter.prefetch(env=ENVNAME)
 ENGINE = get_engine(envname=ENVNAME)
 Worker.queue = SqsQueue.send
 
+# Warm container caches: the groups that already have a tenant policy and the list of ReAuth APIs
+BOOTSTRAP_CACHE_TTL = int(os.environ.get('BOOTSTRAP_CACHE_TTL', '300'))
+PROVISIONED_GROUPS = TTLCache(ttl=BOOTSTRAP_CACHE_TTL, name='provisioned_groups')
+REAUTH_APIS = TTLCache(ttl=BOOTSTRAP_CACHE_TTL, name='reauth_apis')
+COLD_START = True
+
 save_permissions_with_tenant(ENGINE)
 
 
@@ -79,6 +90,50 @@ def get_groups(claims):
     return groups
 
 
+def provision_groups(groups):
+    """Attaches TENANT_ALL permissions to the groups that don't have a tenant policy yet"""
+    uncached = [group for group in groups if not PROVISIONED_GROUPS.get(group)]
+    if not uncached:
+        return
+
+    with ENGINE.scoped_session() as session:
+        provisioned = TenantPolicy.find_groups_with_tenant_policy(session, uncached, 'dataall')
+        for group in uncached:
+            if group not in provisioned:
+                print(
+                    f'No policy found for Team {group}. Attaching TENANT_ALL permissions'
+                )
+                TenantPolicy.attach_group_tenant_policy(
+                    session=session,
+                    group=group,
+                    permissions=permissions.TENANT_ALL,
+                    tenant_name='dataall',
+                )
+    for group in uncached:
+        PROVISIONED_GROUPS.put(group, True)
+
+
+def get_reauth_apis():
+    """Determine if there are any Operations that Require ReAuth From SSM Parameter"""
+    def load():
+        try:
+            return ParameterStoreManager.client(region=os.getenv('AWS_REGION', 'eu-west-1')).get_parameter(
+                Name=f"/dataall/{ENVNAME}/reauth/apis"
+            )['Parameter']['Value'].split(',')
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ParameterNotFound':
+                raise
+            log.info("No ReAuth APIs Found in SSM")
+            return None
+
+    try:
+        return REAUTH_APIS.get_or_load('apis', load)
+    except Exception as e:
+        # not cached: a transient SSM error must not disable ReAuth until the cache expires
+        log.error(f"Failed to read the ReAuth APIs from SSM: {e}")
+        return None
+
+
 def handler(event, context):
     """Sample pure Lambda function
 
@@ -101,9 +156,15 @@ def handler(event, context):
         Return doc: https://docs.aws.amazon.com/apigateway/latest/developerguide/set-up-lambda-proxy-integrations.html
     """
 
+    global COLD_START
     log.info('Lambda Event %s', event)
     log.debug('Env name %s', ENVNAME)
     log.debug('Engine %s', ENGINE.engine.url)
+    log.info(
+        'Cold start: %s, bootstrap caches: %s, %s, parameter cache: %s, connection pool: %s',
+        COLD_START, PROVISIONED_GROUPS.stats(), REAUTH_APIS.stats(), Parameter.cache_stats(), ENGINE.pool_metrics()
+    )
+    COLD_START = False
 
     if event['httpMethod'] == 'OPTIONS':
         return {
@@ -126,21 +187,7 @@ def handler(event, context):
         try:
             groups = get_groups(claims)
             log.debug('groups are %s', ",".join(groups))
-            with ENGINE.scoped_session() as session:
-                for group in groups:
-                    policy = TenantPolicy.find_tenant_policy(
-                        session, group, 'dataall'
-                    )
-                    if not policy:
-                        print(
-                            f'No policy found for Team {group}. Attaching TENANT_ALL permissions'
-                        )
-                        TenantPolicy.attach_group_tenant_policy(
-                            session=session,
-                            group=group,
-                            permissions=permissions.TENANT_ALL,
-                            tenant_name='dataall',
-                        )
+            provision_groups(groups)
 
         except Exception as e:
             print(f'Error managing groups due to: {e}')
@@ -155,12 +202,7 @@ def handler(event, context):
             'schema': SCHEMA,
         }
 
-        # Determine if there are any Operations that Require ReAuth From SSM Parameter
-        try:
-            reauth_apis = ParameterStoreManager.get_parameter_value(region=os.getenv('AWS_REGION', 'eu-west-1'), parameter_path=f"/dataall/{ENVNAME}/reauth/apis").split(',')
-        except Exception as e:
-            log.info("No ReAuth APIs Found in SSM")
-            reauth_apis = None
+        reauth_apis = get_reauth_apis()
     else:
         raise Exception(f'Could not initialize user context from event {event}')
 
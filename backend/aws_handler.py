@@ -5,12 +5,15 @@ import os
 from dataall.core.tasks.service_handlers import Worker
 from dataall.base.db import get_engine
 from dataall.base.loader import load_modules, ImportMode
+from dataall.base.utils import Parameter
 
 logger = logging.getLogger()
 logger.setLevel(os.environ.get('LOG_LEVEL'))
 log = logging.getLogger(__name__)
 
 ENVNAME = os.getenv('envname', 'local')
+if ENVNAME not in ['local', 'pytest', 'dkrcompose']:
+    Parameter.prefetch(env=ENVNAME)
 
 engine = get_engine(envname=ENVNAME)
 
@@ -25,3 +28,4 @@ def handler(event, context=None):
         message = json.loads(record['body'])
         log.info(f'Extracted Message: {message}')
         Worker.process(engine=engine, task_ids=message)
+    log.info(f'Connection pool: {engine.pool_metrics()}')
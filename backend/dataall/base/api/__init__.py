@@ -11,6 +11,7 @@ from ariadne import (
 )
 
 from dataall.base.api import gql
+from dataall.base.api.batch_loader import register_siblings
 from dataall.base.api.constants import GraphQLEnumMapper
 
 
@@ -62,6 +63,7 @@ def resolver_adapter(resolver):
             source=obj or None,
             **kwargs,
         )
+        register_siblings(response)
         return response
 
     return adapted
@@ -0,0 +1,82 @@
+"""
+Batched resolution of nested GraphQL fields (DataLoader-style).
+
+GraphQL resolves the fields of a list item by item, so a field resolver that loads a related entity
+(e.g. the environment of every dataset of a page) does a DB round-trip per parent row.
+The resolver adapter registers every list returned by a resolver as a group of siblings.
+When a field resolver asks a BatchLoader for the entity of one parent, the loader fetches the entities
+of all the siblings of that parent with a single query and keeps them in a per-request cache
+keyed by the entity type and the URI.
+"""
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from dataall.base.context import find_context, get_context
+
+log = logging.getLogger(__name__)
+
+_SIBLINGS_KEY = 'batch_loader_siblings'
+_ENTITIES_KEY = 'batch_loader_entities'
+
+
+def _get_attribute(source, attribute: str) -> Optional[str]:
+    if isinstance(source, dict):
+        return source.get(attribute)
+    return getattr(source, attribute, None)
+
+
+def register_siblings(response) -> None:
+    """Remembers the items of a list (or of a page of items) returned by a resolver as siblings"""
+    context = find_context()
+    if context is None:
+        return
+
+    items = response.get('nodes') if isinstance(response, dict) else response
+    if not isinstance(items, list) or len(items) < 2:
+        return
+
+    siblings = context.cache.setdefault(_SIBLINGS_KEY, {})
+    for item in items:
+        if not isinstance(item, (str, int, float, bool)):
+            siblings[id(item)] = items
+
+
+class BatchLoader:
+    """
+    Loads entities of one type for a group of sibling parents at once.
+    batch_load receives a session and a dict {uri: parent} and returns a dict {uri: entity}
+    """
+
+    def __init__(self, entity: str, batch_load: Callable[[Any, Dict[str, Any]], Dict[str, Any]]):
+        self.entity = entity
+        self._batch_load = batch_load
+
+    def load(self, source, key: str):
+        """Returns the entity referenced by the attribute `key` of `source`"""
+        uri = _get_attribute(source, key)
+        if not uri:
+            return None
+
+        context = get_context()
+        cache: Dict[str, Any] = context.cache.setdefault(_ENTITIES_KEY, {}).setdefault(self.entity, {})
+        if uri not in cache:
+            pending = self._pending_sources(context, source, key, cache)
+            with context.db_engine.scoped_session() as session:
+                loaded = self._batch_load(session, pending)
+
+            log.debug(f'Batch loaded {len(pending)} {self.entity} entities')
+            for pending_uri in pending:
+                cache[pending_uri] = loaded.get(pending_uri)
+
+        return cache[uri]
+
+    @staticmethod
+    def _pending_sources(context, source, key: str, cache: Dict[str, Any]) -> Dict[str, Any]:
+        siblings: List[Any] = context.cache.get(_SIBLINGS_KEY, {}).get(id(source), [source])
+        pending = {}
+        for sibling in siblings:
+            uri = _get_attribute(sibling, key)
+            if uri and uri not in cache and uri not in pending:
+                pending[uri] = sibling
+        pending.setdefault(_get_attribute(source, key), source)
+        return pending
@@ -10,9 +10,10 @@ ID = Scalar(name='ID')
 String = Scalar(name='String')
 Boolean = Scalar(name='Boolean')
 Integer = Scalar(name='Int')
+Float = Scalar(name='Float')
 Number = Scalar(name='Number')
 Date = Scalar(name='Date')
 AWSDateTime = Scalar(name='String')
 
 
-scalars = (String, Boolean, Integer, Number, Date)
+scalars = (String, Boolean, Integer, Float, Number, Date)
@@ -3,6 +3,7 @@ import logging
 import boto3
 
 from dataall.base.utils.IdentityProvider import IdentityProvider
+from dataall.base.utils.parameter import Parameter
 
 log = logging.getLogger(__name__)
 
@@ -15,9 +16,7 @@ class Cognito(IdentityProvider):
     def get_user_emailids_from_group(self, groupName):
         try:
             envname = os.getenv('envname', 'local')
-            parameter_path = f'/dataall/{envname}/cognito/userpool'
-            ssm = boto3.client('ssm', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
-            user_pool_id = ssm.get_parameter(Name=parameter_path)['Parameter']['Value']
+            user_pool_id = Parameter.get_parameter(env=envname, path='cognito/userpool')
             cognito_user_list = self.client.list_users_in_group(UserPoolId=user_pool_id, GroupName=groupName)["Users"]
             group_email_ids = []
             attributes = []
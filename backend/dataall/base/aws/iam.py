@@ -9,8 +9,7 @@ log = logging.getLogger(__name__)
 class IAM:
     @staticmethod
     def client(account_id: str, role=None):
-        session = SessionHelper.remote_session(accountid=account_id, role=role)
-        return session.client('iam')
+        return SessionHelper.remote_client(account_id, 'iam', role=role)
 
     @staticmethod
     def get_role(account_id: str, role_arn: str, role=None):
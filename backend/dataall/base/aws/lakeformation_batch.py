@@ -0,0 +1,153 @@
+"""Grants Lake Formation permissions in batches, retrying only the entries that failed with a transient error."""
+import logging
+import os
+import time
+import uuid
+from typing import List, Optional
+
+from botocore.exceptions import ClientError
+
+log = logging.getLogger(__name__)
+
+# Maximum number of entries accepted by batch_grant_permissions/batch_revoke_permissions
+BATCH_MAX_ENTRIES = 20
+
+DEFAULT_MAX_ATTEMPTS = int(os.getenv('lf_batch_max_attempts', '5'))
+DEFAULT_BACKOFF_SECONDS = float(os.getenv('lf_batch_backoff_seconds', '0.5'))
+DEFAULT_WAIT_TIMEOUT_SECONDS = float(os.getenv('lf_grant_wait_timeout', '30'))
+_MAX_BACKOFF_SECONDS = 8.0
+
+RETRYABLE_ERRORS = {
+    'ConcurrentModificationException',
+    'InternalServiceException',
+    'OperationTimeoutException',
+    'ThrottlingException',
+    'TooManyRequestsException',
+}
+
+
+class LakeFormationBatchClient:
+    """Batch grants and permission polling on top of a boto3 lakeformation client"""
+
+    def __init__(
+        self,
+        client,
+        catalog_id: str,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff: float = DEFAULT_BACKOFF_SECONDS,
+    ):
+        self._client = client
+        self._catalog_id = catalog_id
+        self.max_attempts = max(max_attempts, 1)
+        self.backoff = backoff
+        self.calls = 0
+        self.retried = 0
+
+    @staticmethod
+    def table_entry(
+        principal: str,
+        database: str,
+        table: str,
+        permissions: List[str],
+        permissions_with_grant_option: Optional[List[str]] = None,
+        catalog_id: Optional[str] = None,
+    ) -> dict:
+        resource = {'DatabaseName': database, 'Name': table}
+        if catalog_id:
+            resource['CatalogId'] = catalog_id
+        return {
+            'Id': str(uuid.uuid4()),
+            'Principal': {'DataLakePrincipalIdentifier': principal},
+            'Resource': {'Table': resource},
+            'Permissions': permissions,
+            'PermissionsWithGrantOption': permissions_with_grant_option or [],
+        }
+
+    def grant(self, entries: List[dict]) -> List[dict]:
+        """
+        Grants all the entries and returns the failures that are not transient
+        (each failure is the batch API failure: {'RequestEntry': ..., 'Error': {'ErrorCode', 'ErrorMessage'}})
+        """
+        failures = []
+        for start in range(0, len(entries), BATCH_MAX_ENTRIES):
+            failures.extend(self._grant_chunk(entries[start : start + BATCH_MAX_ENTRIES]))
+
+        log.info(
+            f'Batch granted {len(entries) - len(failures)}/{len(entries)} entries '
+            f'in {self.calls} calls ({self.retried} entries retried)'
+        )
+        return failures
+
+    def _grant_chunk(self, chunk: List[dict]) -> List[dict]:
+        pending = chunk
+        permanent = []
+        for attempt in range(1, self.max_attempts + 1):
+            self.calls += 1
+            try:
+                response = self._client.batch_grant_permissions(CatalogId=self._catalog_id, Entries=pending)
+                failures = response.get('Failures') or []
+            except ClientError as e:
+                if e.response['Error']['Code'] not in RETRYABLE_ERRORS or attempt == self.max_attempts:
+                    raise e
+                error = {'ErrorCode': e.response['Error']['Code'], 'ErrorMessage': e.response['Error'].get('Message')}
+                failures = [{'RequestEntry': entry, 'Error': error} for entry in pending]
+
+            retryable = []
+            for failure in failures:
+                if failure.get('Error', {}).get('ErrorCode') in RETRYABLE_ERRORS:
+                    retryable.append(failure)
+                else:
+                    permanent.append(failure)
+
+            if not retryable:
+                return permanent
+            if attempt == self.max_attempts:
+                return permanent + retryable
+
+            by_id = {entry['Id']: entry for entry in pending}
+            pending = [by_id[failure['RequestEntry']['Id']] for failure in retryable]
+            self.retried += len(pending)
+            delay = min(self.backoff * 2 ** (attempt - 1), _MAX_BACKOFF_SECONDS)
+            log.info(f'Retrying {len(pending)} failed grant entries in {delay}s (attempt {attempt})')
+            time.sleep(delay)
+        return permanent
+
+    def wait_for_table_permissions(
+        self,
+        principal: str,
+        database: str,
+        table: str,
+        permissions: List[str],
+        catalog_id: Optional[str] = None,
+        timeout: float = DEFAULT_WAIT_TIMEOUT_SECONDS,
+    ) -> bool:
+        """
+        Polls list_permissions until the principal holds the permissions on the table.
+        Returns False if they are not visible before the timeout
+        """
+        resource = {'DatabaseName': database, 'Name': table, 'CatalogId': catalog_id or self._catalog_id}
+        deadline = time.monotonic() + timeout
+        delay = self.backoff
+        while True:
+            if set(permissions) <= self._list_table_permissions(principal, resource):
+                return True
+            if time.monotonic() + delay > deadline:
+                log.warning(f'Permissions {permissions} of {principal} on {database}.{table} are not visible yet')
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, _MAX_BACKOFF_SECONDS)
+
+    def _list_table_permissions(self, principal: str, resource: dict) -> set:
+        granted = set()
+        kwargs = dict(
+            CatalogId=self._catalog_id,
+            Principal={'DataLakePrincipalIdentifier': principal},
+            Resource={'Table': resource},
+        )
+        while True:
+            response = self._client.list_permissions(**kwargs)
+            for permission in response.get('PrincipalResourcePermissions', []):
+                granted.update(permission.get('Permissions', []))
+            if not response.get('NextToken'):
+                return granted
+            kwargs['NextToken'] = response['NextToken']
@@ -5,25 +5,54 @@ import boto3
 from botocore.exceptions import ClientError
 
 from .sts import SessionHelper
+from dataall.base.utils.ttl_cache import TTLCache
 
 log = logging.getLogger(__name__)
 
 _DEFAULT_REGION = os.environ.get('AWS_REGION', 'eu-west-1')
+_SECRET_CACHE_TTL = int(os.getenv('secret_cache_ttl', '300'))
 
 
 class SecretsManager:
+    _central_clients = {}
+    _cache = TTLCache(ttl=_SECRET_CACHE_TTL, name='secrets')
+
     def __init__(self, account_id=None, region=_DEFAULT_REGION):
-        if account_id:
-            session = SessionHelper.remote_session(account_id)
-            self._client = session.client('secretsmanager', region_name=region)
-        else:
-            self._client = boto3.client('secretsmanager', region_name=region)
+        self._account_id = account_id
+        self._region = region
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            if self._account_id:
+                session = SessionHelper.remote_session(self._account_id)
+                self._client = session.client('secretsmanager', region_name=self._region)
+            else:
+                if self._region not in SecretsManager._central_clients:
+                    SecretsManager._central_clients[self._region] = boto3.client(
+                        'secretsmanager', region_name=self._region
+                    )
+                self._client = SecretsManager._central_clients[self._region]
+        return self._client
 
     def get_secret_value(self, secret_id):
         if not secret_id:
             raise Exception('Secret name is None')
+
+        key = (self._account_id, self._region, secret_id)
+        secret_value = SecretsManager._cache.get(key)
+        if secret_value is not None:
+            return secret_value
+
         try:
-            secret_value = self._client.get_secret_value(SecretId=secret_id)['SecretString']
+            secret_value = self.client.get_secret_value(SecretId=secret_id)['SecretString']
         except ClientError as e:
             raise Exception(e)
+        SecretsManager._cache.put(key, secret_value)
         return secret_value
+
+    @staticmethod
+    def cache_stats():
+        """Hits are the Secrets Manager calls saved by the cache"""
+        return SecretsManager._cache.stats()
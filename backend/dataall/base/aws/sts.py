@@ -1,12 +1,15 @@
+import datetime
 import json
 import logging
 import os
+import threading
 import urllib
 
 import boto3
 from botocore.client import Config
 from botocore.exceptions import ClientError
 
+from dataall.base.utils.parameter import Parameter
 from dataall.version import __version__, __pkg_name__
 
 try:
@@ -19,10 +22,19 @@ except ImportError:
 
 log = logging.getLogger(__name__)
 
+# Assumed role sessions are reused until their credentials are about to expire
+_SESSION_REFRESH_MARGIN = datetime.timedelta(seconds=int(os.getenv('assume_role_refresh_margin', '300')))
+
 
 class SessionHelper:
     """SessionHelpers is a class simplifying common aws boto3 session tasks and helpers"""
 
+    # (accountid, role_arn) -> credentials of the assumed role
+    _remote_credentials = {}
+    # boto3 sessions are not thread-safe, every thread keeps its own sessions and the clients created with them
+    _local = threading.local()
+    _lock = threading.Lock()
+
     @classmethod
     def get_session(cls, base_session=None, role_arn=None):
         """Returns a boto3 session fo the given role
@@ -35,39 +47,46 @@ class SessionHelper:
                     If role_arn is provided, base_session should be a boto3 session on the aws accountid is defined
         """
         if role_arn:
-            external_id_secret = cls.get_external_id_secret()
-            if external_id_secret:
-                assume_role_dict = dict(
-                    RoleArn=role_arn,
-                    RoleSessionName=role_arn.split('/')[1],
-                    ExternalId=external_id_secret,
-                )
-            else:
-                assume_role_dict = dict(
-                    RoleArn=role_arn,
-                    RoleSessionName=role_arn.split('/')[1],
-                )
-            try:
-                region = os.getenv('AWS_REGION', 'eu-west-1')
-                sts = base_session.client(
-                    'sts',
-                    config=Config(user_agent_extra=f'{__pkg_name__}/{__version__}'),
-                    region_name=region,
-                    endpoint_url=f"https://sts.{region}.amazonaws.com"
-                )
-                response = sts.assume_role(**assume_role_dict)
-                return boto3.Session(
-                    aws_access_key_id=response['Credentials']['AccessKeyId'],
-                    aws_secret_access_key=response['Credentials']['SecretAccessKey'],
-                    aws_session_token=response['Credentials']['SessionToken'],
-                )
-            except ClientError as e:
-                log.error(f'Failed to assume role {role_arn} due to: {e} ')
-                raise e
-
+            return cls._session_from_credentials(cls._assume_role(base_session, role_arn))
         else:
             return boto3.Session()
 
+    @classmethod
+    def _assume_role(cls, base_session, role_arn):
+        """Assumes the role and returns its temporary credentials"""
+        external_id_secret = cls.get_external_id_secret()
+        if external_id_secret:
+            assume_role_dict = dict(
+                RoleArn=role_arn,
+                RoleSessionName=role_arn.split('/')[1],
+                ExternalId=external_id_secret,
+            )
+        else:
+            assume_role_dict = dict(
+                RoleArn=role_arn,
+                RoleSessionName=role_arn.split('/')[1],
+            )
+        try:
+            region = os.getenv('AWS_REGION', 'eu-west-1')
+            sts = base_session.client(
+                'sts',
+                config=Config(user_agent_extra=f'{__pkg_name__}/{__version__}'),
+                region_name=region,
+                endpoint_url=f"https://sts.{region}.amazonaws.com"
+            )
+            return sts.assume_role(**assume_role_dict)['Credentials']
+        except ClientError as e:
+            log.error(f'Failed to assume role {role_arn} due to: {e} ')
+            raise e
+
+    @staticmethod
+    def _session_from_credentials(credentials):
+        return boto3.Session(
+            aws_access_key_id=credentials['AccessKeyId'],
+            aws_secret_access_key=credentials['SecretAccessKey'],
+            aws_session_token=credentials['SessionToken'],
+        )
+
     @classmethod
     def _get_parameter_value(cls, parameter_path=None):
         """
@@ -76,13 +95,10 @@ class SessionHelper:
         :rtype:
         """
         parameter_value = None
-        region = os.getenv('AWS_REGION', 'eu-west-1')
         if not parameter_path:
             raise Exception('Parameter name is None')
         try:
-            session = SessionHelper.get_session()
-            client = session.client('ssm', region_name=region)
-            parameter_value = client.get_parameter(Name=parameter_path)['Parameter']['Value']
+            parameter_value = Parameter.get_parameter_by_name(parameter_path)
             log.debug(f'Found Parameter {parameter_path}|{parameter_value}')
         except ClientError as e:
             log.warning(f'Parameter {parameter_path} not found: {e}')
@@ -201,16 +217,75 @@ class SessionHelper:
         Returns :
             boto3.session.Session: boto3 Session, on the target aws accountid, assuming the delegation role or a provided role
         """
-        base_session = cls.get_session()
+        key, credentials = cls._remote_credentials_for(accountid, role)
+        return cls._thread_session(key, credentials)
+
+    @classmethod
+    def remote_client(cls, accountid, service_name, region_name=None, role=None):
+        """Returns a boto3 client on the remote AWS account. Clients are reused while their session is valid"""
+        session = cls.remote_session(accountid=accountid, role=role)
+        clients = cls._thread_cache('clients')
+        key = (accountid, role, service_name, region_name)
+        cached = clients.get(key)
+        if cached and cached[0] is session:
+            return cached[1]
+
+        client = session.client(service_name, region_name=region_name)
+        clients[key] = (session, client)
+        return client
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._lock:
+            cls._remote_credentials.clear()
+        cls._thread_cache('sessions').clear()
+        cls._thread_cache('clients').clear()
+
+    @classmethod
+    def _remote_credentials_for(cls, accountid, role=None):
+        """Returns the credentials of the role, they are assumed again when they are about to expire"""
+        role_arn = role or cls.get_delegation_role_arn(accountid=accountid)
+        key = (accountid, role_arn)
+        with cls._lock:
+            credentials = cls._remote_credentials.get(key)
+        if credentials and not cls._is_expiring(credentials.get('Expiration')):
+            return key, credentials
+
         if role:
             log.info(f"Remote boto3 session using role={role} for account={accountid}")
-            role_arn = role
         else:
             log.info(f"Remote boto3 session using pivot role for account= {accountid}")
-            role_arn = cls.get_delegation_role_arn(accountid=accountid)
-        session = SessionHelper.get_session(base_session=base_session, role_arn=role_arn)
+        credentials = cls._assume_role(cls.get_session(), role_arn)
+        with cls._lock:
+            cls._remote_credentials[key] = credentials
+        return key, credentials
+
+    @classmethod
+    def _thread_cache(cls, name) -> dict:
+        cache = getattr(cls._local, name, None)
+        if cache is None:
+            cache = {}
+            setattr(cls._local, name, cache)
+        return cache
+
+    @classmethod
+    def _thread_session(cls, key, credentials):
+        sessions = cls._thread_cache('sessions')
+        cached = sessions.get(key)
+        if cached and cached[0] is credentials:
+            return cached[1]
+
+        session = cls._session_from_credentials(credentials)
+        sessions[key] = (credentials, session)
         return session
 
+    @staticmethod
+    def _is_expiring(expiration) -> bool:
+        if expiration is None:
+            return True
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return expiration - _SESSION_REFRESH_MARGIN <= now
+
     @classmethod
     def get_account(cls, session=None):
         """Returns the aws account id associated with the default session, or the provided session
@@ -247,8 +322,7 @@ class SessionHelper:
 
     @staticmethod
     def get_role_id(accountid, name):
-        session = SessionHelper.remote_session(accountid=accountid)
-        client = session.client('iam')
+        client = SessionHelper.remote_client(accountid, 'iam')
         try:
             response = client.get_role(RoleName=name)
             return response['Role']['RoleId']
@@ -6,8 +6,10 @@
 import ast
 import logging
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 from abc import abstractmethod
 from typing import Dict
 
@@ -16,6 +18,8 @@ from botocore.exceptions import ClientError
 
 from dataall.core.stacks.db.stack_models import Stack
 from dataall.base.aws.sts import SessionHelper
+from dataall.base.cdkproxy import warm_synth
+from dataall.base.cdkproxy.stack_fingerprint import DeployMetrics, fingerprint_cloud_assembly
 from dataall.base.db import Engine
 from dataall.base.utils.alarm_service import AlarmService
 from dataall.base.utils.shell_utils import CommandSanitizer
@@ -24,6 +28,13 @@ logger = logging.getLogger('cdksass')
 
 ENVNAME = os.getenv('envname', 'local')
 
+# The stack is synthesized first and the deployment is skipped if the synthesized stack didn't change
+SKIP_UNCHANGED_DEPLOYS = os.getenv('cdk_skip_unchanged_deploys', 'true').lower() == 'true'
+# A deployment is only skipped if the last one left the CloudFormation stack in one of these states
+SKIPPABLE_STACK_STATUSES = {'CREATE_COMPLETE', 'UPDATE_COMPLETE', 'IMPORT_COMPLETE'}
+
+DEPLOY_METRICS = DeployMetrics()
+
 
 class CDKCliWrapperExtension:
     def __init__(self):
@@ -143,61 +154,52 @@ def deploy_cdk_stack(engine: Engine, stackid: str, app_path: str = None, path: s
 
             CommandSanitizer(input_args)
 
-            cmd = [
-                '' '. ~/.nvm/nvm.sh &&',
-                'cdk',
-                'deploy --all',
-                '--require-approval',
-                ' never',
-                '-c',
-                f"appid='{stack.name}'",
-                # the target accountid
-                '-c',
-                f"account='{stack.accountid}'",
-                # the target region
-                '-c',
-                f"region='{stack.region}'",
-                # the predefined stack
-                '-c',
-                f"stack='{stack.stack}'",
-                # the payload for the stack with additional parameters
-                '-c',
-                f"target_uri='{stack.targetUri}'",
-                '-c',
-                "data='{}'",
-                # skips synth step when no changes apply
-                '--app',
-                f'"{sys.executable} {app_path}"',
-                '--verbose',
-            ]
-            logger.info(f"Running command : \n {' '.join(cmd)}")
-
-            # This command is too complex to be executed as a list of commands. We need to run it with shell=True
-            # However, the input arguments have to be sanitized with the CommandSanitizer
-
-            process = subprocess.run(  # nosemgrep
-                ' '.join(cmd),  # nosemgrep
-                text=True,  # nosemgrep
-                shell=True,  # nosec  # nosemgrep
-                encoding='utf-8',  # nosemgrep
-                env=env,  # nosemgrep
-                cwd=cwd,  # nosemgrep
-            )
+            app = f'"{sys.executable} {app_path}"'
+            fingerprint = None
+            out_dir = tempfile.mkdtemp(prefix='cdk.out.')
+            try:
+                # the stacks of the extensions are synthesized by their own app
+                pool = None if extension else warm_synth.get_pool()
+                if SKIP_UNCHANGED_DEPLOYS or pool:
+                    fingerprint = synth_fingerprint(stack, app, out_dir, env, cwd, pool)
+                if (
+                    SKIP_UNCHANGED_DEPLOYS
+                    and fingerprint
+                    and fingerprint == stack.templateHash
+                    and refresh_unchanged_stack(session, stack)
+                ):
+                    logger.info(f'Stack {stack.name} is unchanged, skipping deployment')
+                    logger.info(f'Deploy metrics: {DEPLOY_METRICS.to_dict()}')
+                    process = None
+                else:
+                    # the synthesized cloud assembly is deployed as is, it's not synthesized again
+                    process = run_cdk_command(
+                        stack, 'deploy --all --require-approval never', f'"{out_dir}"' if fingerprint else app, env, cwd
+                    )
+            finally:
+                shutil.rmtree(out_dir, ignore_errors=True)
 
             if extension:
                 _CDK_CLI_WRAPPER_EXTENSIONS[stack.stack].post_deployment()
             else:
                 logger.info(f'There is no CDK deployment extension for {stack.stack}. Proceeding further with the post-deployment')
 
+            if process is None:
+                return
             if process.returncode == 0:
                 meta = describe_stack(stack)
                 stack.stackid = meta['StackId']
                 stack.status = meta['StackStatus']
+                stack.templateHash = fingerprint
                 update_stack_output(session, stack)
+                DEPLOY_METRICS.record('deployed')
             else:
                 stack.status = 'CREATE_FAILED'
+                stack.templateHash = None
+                DEPLOY_METRICS.record('failed')
                 logger.error(f'Failed to deploy stack {stackid} due to {str(process.stderr)}')
                 AlarmService().trigger_stack_deployment_failure_alarm(stack=stack)
+            logger.info(f'Deploy metrics: {DEPLOY_METRICS.to_dict()}')
 
         except Exception as e:
             logger.error(f'Failed to deploy stack {stackid} due to {e}')
@@ -205,6 +207,92 @@ def deploy_cdk_stack(engine: Engine, stackid: str, app_path: str = None, path: s
             raise e
 
 
+def run_cdk_command(stack, action, app, env, cwd, extra_args=None):
+    cmd = [
+        '' '. ~/.nvm/nvm.sh &&',
+        'cdk',
+        action,
+        '-c',
+        f"appid='{stack.name}'",
+        # the target accountid
+        '-c',
+        f"account='{stack.accountid}'",
+        # the target region
+        '-c',
+        f"region='{stack.region}'",
+        # the predefined stack
+        '-c',
+        f"stack='{stack.stack}'",
+        # the payload for the stack with additional parameters
+        '-c',
+        f"target_uri='{stack.targetUri}'",
+        '-c',
+        "data='{}'",
+        # the python app, or the directory of an already synthesized cloud assembly
+        '--app',
+        app,
+        '--verbose',
+        *(extra_args or []),
+    ]
+    logger.info(f"Running command : \n {' '.join(cmd)}")
+
+    # This command is too complex to be executed as a list of commands. We need to run it with shell=True
+    # However, the input arguments have to be sanitized with the CommandSanitizer
+
+    return subprocess.run(  # nosemgrep
+        ' '.join(cmd),  # nosemgrep
+        text=True,  # nosemgrep
+        shell=True,  # nosec  # nosemgrep
+        encoding='utf-8',  # nosemgrep
+        env=env,  # nosemgrep
+        cwd=cwd,  # nosemgrep
+    )
+
+
+def synth_fingerprint(stack, app, out_dir, env, cwd, pool=None):
+    """
+    Synthesizes the stack to out_dir and returns its fingerprint, or None if it could not be synthesized.
+    The stack is synthesized by a warm process of the pool if there is one, and by cdk synth otherwise
+    """
+    synthesized = False
+    if pool:
+        try:
+            pool.synthesize(stack, out_dir, env)
+            synthesized = True
+        except Exception as e:
+            logger.warning(f'Warm synthesis of stack {stack.name} failed, running cdk synth due to: {e}')
+    if not synthesized:
+        process = run_cdk_command(stack, 'synth --quiet', app, env, cwd, extra_args=['--output', f'"{out_dir}"'])
+        if process.returncode != 0:
+            logger.warning(f'Failed to synthesize stack {stack.name}, deploying without fingerprint')
+            return None
+    DEPLOY_METRICS.record('synthesized')
+    try:
+        return fingerprint_cloud_assembly(out_dir)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f'Failed to fingerprint the cloud assembly of stack {stack.name} due to: {e}')
+        return None
+
+
+def refresh_unchanged_stack(session, stack) -> bool:
+    """
+    Refreshes the status and outputs of a stack whose deployment is skipped.
+    Returns False if the CloudFormation stack is not in a state where the deployment can be skipped
+    """
+    try:
+        meta = describe_stack(stack)
+    except ClientError as e:
+        logger.warning(f'Failed to describe unchanged stack {stack.name} due to: {e}')
+        return False
+    if meta['StackStatus'] not in SKIPPABLE_STACK_STATUSES:
+        return False
+    stack.stackid = meta['StackId']
+    stack.status = meta['StackStatus']
+    update_stack_output(session, stack)
+    DEPLOY_METRICS.record('skipped')
+    return True
+
+
 def describe_stack(stack, engine: Engine = None, stackid: str = None):
     if not stack:
         with engine.scoped_session() as session:
@@ -3,6 +3,7 @@
 # GET / : returns 200 to notify the server is up
 # POST /stack/{stackid} : deploys or updates the stack as found in the dataall database in the stack table
 # GET /stack/{stackid} : returns metadata for the stack
+# GET /deploy-metrics : returns the number of deployments done and skipped because the stack was unchanged
 # DELETE /Stack/{stackid} : deletes the stack
 # To run the server locally, simply run
 # uvicorn dataall.base.cdkproxy.main:app --host 0.0.0.0 --port 8080
@@ -47,6 +48,20 @@ def connect():
 app = FastAPI()
 
 
+@app.on_event('startup')
+def start_warm_synthesis():
+    # the stacks are synthesized by preloaded processes, the cdk CLI is only started to deploy them
+    if os.getenv('cdk_warm_synth', 'true').lower() == 'true':
+        wrapper.warm_synth.start_pool()
+
+
+@app.on_event('shutdown')
+def stop_warm_synthesis():
+    pool = wrapper.warm_synth.get_pool()
+    if pool:
+        pool.shutdown()
+
+
 @app.get('/', status_code=status.HTTP_200_OK)
 def up(response: Response):
     logger.info('GET /')
@@ -122,6 +137,19 @@ def check_cdk_installed(response: Response):
         }
 
 
+@app.get('/deploy-metrics', status_code=status.HTTP_200_OK)
+def deploy_metrics(response: Response):
+    logger.info('GET /deploy-metrics')
+    return {
+        '_ts': datetime.now().isoformat(),
+        'message': 'Deployments since the service started',
+        'data': {
+            **wrapper.DEPLOY_METRICS.to_dict(),
+            'warm_synth': wrapper.warm_synth.get_pool().stats if wrapper.warm_synth.get_pool() else None,
+        },
+    }
+
+
 @app.post('/stack/{stackid}', status_code=status.HTTP_202_ACCEPTED)
 async def create_stack(
     stackid: str, background_tasks: BackgroundTasks, response: Response
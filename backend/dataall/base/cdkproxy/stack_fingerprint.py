@@ -0,0 +1,65 @@
+"""
+Fingerprints the cloud assembly synthesized by cdk synth.
+The fingerprint covers the templates of the stacks, their stack tags (the tags added by TagsUtil are applied
+to the stacks and their resources) and the hashes of the file and docker image assets. Two synthesized
+assemblies with the same fingerprint deploy the same resources, so a deployment can be skipped
+when the fingerprint of the last successful deployment is unchanged.
+"""
+import hashlib
+import json
+import os
+import threading
+
+MANIFEST_FILE = 'manifest.json'
+STACK_ARTIFACT = 'aws:cloudformation:stack'
+ASSET_MANIFEST_ARTIFACT = 'cdk:asset-manifest'
+
+
+def fingerprint_cloud_assembly(out_dir: str) -> str:
+    """Returns the sha256 of the canonical content of the stacks and assets of the cloud assembly"""
+    manifest = _read_json(out_dir, MANIFEST_FILE)
+    digest = hashlib.sha256()
+    for artifact_id, artifact in sorted(manifest.get('artifacts', {}).items()):
+        properties = artifact.get('properties', {})
+        if artifact.get('type') == STACK_ARTIFACT:
+            content = {
+                'environment': artifact.get('environment'),
+                'tags': properties.get('tags', {}),
+                'parameters': properties.get('parameters', {}),
+                'template': _read_json(out_dir, properties['templateFile']),
+            }
+        elif artifact.get('type') == ASSET_MANIFEST_ARTIFACT:
+            assets = _read_json(out_dir, properties['file'])
+            content = {
+                'files': sorted(assets.get('files', {})),
+                'dockerImages': sorted(assets.get('dockerImages', {})),
+            }
+        else:
+            continue
+        digest.update(artifact_id.encode('utf-8'))
+        digest.update(json.dumps(content, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _read_json(out_dir, file_name):
+    with open(os.path.join(out_dir, file_name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+class DeployMetrics:
+    """Thread-safe counters of the deployments, the cdkproxy service keeps them for its lifetime"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {'synthesized': 0, 'deployed': 0, 'skipped': 0, 'failed': 0}
+
+    def record(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+    def to_dict(self):
+        with self._lock:
+            counters = dict(self.counters)
+        decided = counters['deployed'] + counters['skipped']
+        counters['skipped_ratio'] = round(counters['skipped'] / decided, 4) if decided else 0.0
+        return counters
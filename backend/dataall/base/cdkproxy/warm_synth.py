@@ -0,0 +1,161 @@
+"""Synthesizes the stacks in a pool of preloaded Python processes of the cdkproxy service."""
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+log = logging.getLogger('cdksass')
+
+WARM_SYNTH_WORKERS = int(os.getenv('cdk_warm_synth_workers', '2'))
+WARM_SYNTH_MAX_TASKS = int(os.getenv('cdk_warm_synth_max_tasks', '50'))
+WARM_SYNTH_TIMEOUT = int(os.getenv('cdk_warm_synth_timeout', '900'))
+
+CDK_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cdk.json')
+# values of the context lookups (VPCs, KMS keys...) saved by the cdk CLI
+CDK_CONTEXT_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cdk.context.json')
+
+# context set by the cdk CLI, the synthesized templates are the same as the ones of cdk synth
+CLI_CONTEXT = {
+    'aws:cdk:enable-path-metadata': True,
+    'aws:cdk:enable-asset-metadata': True,
+    'aws:cdk:version-reporting': True,
+}
+
+
+def _init_worker():
+    # the configuration is read when dataall is imported, as in the processes started by the cdk CLI
+    os.environ.setdefault('config_location', '/config.json')
+    from dataall.base.loader import load_modules, ImportMode
+
+    load_modules(modes={ImportMode.CDK})
+    log.info(f'Warm synthesis worker {os.getpid()} ready')
+
+
+class MissingContextError(Exception):
+    """
+    The stack uses context lookups that are not in cdk.context.json: the synthesized assembly contains
+    placeholder values, the stack must be synthesized by the cdk CLI that runs the lookups
+    """
+
+
+def _read_json(path) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _synth(params: dict, out_dir: str, env: dict) -> str:
+    from aws_cdk import App, Environment
+    from dataall.base.cdkproxy.stacks import instanciate_stack
+
+    os.environ.update({key: value for key, value in env.items() if value is not None})
+    context = dict(_read_json(CDK_JSON).get('context', {}))
+    context.update(_read_json(CDK_CONTEXT_JSON))
+    context.update(CLI_CONTEXT)
+    context.update(params)
+
+    app = App(outdir=out_dir, context=context)
+    instanciate_stack(
+        params['stack'],
+        app,
+        params['appid'],
+        env=Environment(account=params['account'], region=params['region']),
+        target_uri=params['target_uri'],
+    )
+    app.synth()
+
+    missing = [entry['key'] for entry in _read_json(os.path.join(out_dir, 'manifest.json')).get('missing', [])]
+    if missing:
+        raise MissingContextError(f'Missing context lookups: {missing}')
+    return out_dir
+
+
+class WarmSynthPool:
+    """Pool of preloaded processes that synthesize the stacks queued by the deployments"""
+
+    def __init__(self, max_workers: int = WARM_SYNTH_WORKERS, max_tasks: int = WARM_SYNTH_MAX_TASKS):
+        self.max_workers = max(max_workers, 1)
+        self.max_tasks = max(max_tasks, 1)
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._submitted = 0
+        self.stats = {'synthesized': 0, 'failed': 0, 'recycled': 0}
+
+    def start(self) -> None:
+        """Starts the workers, so they are warm when the first stack is queued"""
+        with self._lock:
+            executor = self._get_executor()
+            for _ in range(self.max_workers):
+                executor.submit(_ping)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def synthesize(self, stack, out_dir: str, env: dict, timeout: int = WARM_SYNTH_TIMEOUT) -> str:
+        """Synthesizes the stack into the out_dir cloud assembly, the call blocks until a worker synthesized it"""
+        params = {
+            'appid': stack.name,
+            'account': stack.accountid,
+            'region': stack.region,
+            'stack': stack.stack,
+            'target_uri': stack.targetUri,
+            'data': '{}',
+        }
+        with self._lock:
+            executor = self._get_executor()
+            self._submitted += 1
+            future = executor.submit(_synth, params, out_dir, env)
+        try:
+            result = future.result(timeout=timeout)
+        except Exception:
+            self._record('failed')
+            raise
+        self._record('synthesized')
+        return result
+
+    def _record(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor and self._submitted >= self.max_tasks:
+            # the queued stacks are still synthesized by the old workers
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self.stats['recycled'] += 1
+        if self._executor is None:
+            # the workers are spawned: the jsii runtime of this process must not be shared with forked processes
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+            )
+            self._submitted = 0
+        return self._executor
+
+
+_POOL: Optional[WarmSynthPool] = None
+
+
+def start_pool(max_workers: int = WARM_SYNTH_WORKERS) -> WarmSynthPool:
+    """Starts the warm synthesis of the service, the stack deployments of this process use it from then on"""
+    global _POOL
+    if _POOL is None:
+        _POOL = WarmSynthPool(max_workers=max_workers)
+        _POOL.start()
+    return _POOL
+
+
+def get_pool() -> Optional[WarmSynthPool]:
+    return _POOL
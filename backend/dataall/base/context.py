@@ -7,8 +7,8 @@ The class uses Flask's approach to handle request: ThreadLocal
 That approach should work fine for AWS Lambdas and local server that uses Flask app
 """
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from dataall.base.db.connection import Engine
 from threading import local
@@ -23,6 +23,8 @@ class RequestContext:
     db_engine: Engine
     username: str
     groups: List[str]
+    # Per-request storage for lookups that are memoized for the duration of the request (e.g. permissions)
+    cache: Dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
 
 
 def get_context() -> RequestContext:
@@ -30,6 +32,11 @@ def get_context() -> RequestContext:
     return _request_storage.context
 
 
+def find_context() -> Optional[RequestContext]:
+    """Retrieves context associated with a request or None if the code runs outside of a request (e.g. tasks)"""
+    return getattr(_request_storage, 'context', None)
+
+
 def set_context(context: RequestContext) -> None:
     """Retrieves context associated with a request"""
     _request_storage.context = context
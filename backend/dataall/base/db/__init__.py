@@ -10,4 +10,4 @@ from .connection import (
     drop_schema_if_exists,
 )
 from .dbconfig import DbConfig
-from .paginator import paginate
+from .paginator import paginate, paginate_keyset, is_cursor_request
@@ -1,15 +1,18 @@
+import asyncio
 import json
 import logging
 import os
+import threading
 from contextlib import contextmanager
 
 import sqlalchemy
 from sqlalchemy.engine import reflection
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 
 from dataall.base.aws.secrets_manager import SecretsManager
 from dataall.base.db import Base
 from dataall.base.db.dbconfig import DbConfig
+from dataall.base.db.pool import MeteredQueuePool
 from dataall.base.utils import Parameter
 from dataall.base.aws.sts import SessionHelper
 
@@ -21,6 +24,17 @@ except ImportError:
 log = logging.getLogger(__name__)
 ENVNAME = os.getenv('envname', 'local')
 
+_SCOPE_DEPTH = 'scope_depth'
+
+
+def _session_scope():
+    """A session is shared by a thread, or by an asyncio task when it runs inside an event loop"""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return threading.get_ident(), id(task) if task else None
+
 
 class Engine:
     def __init__(self, dbconfig: DbConfig):
@@ -28,7 +42,12 @@ class Engine:
         self.engine = sqlalchemy.create_engine(
             dbconfig.url,
             echo=False,
-            pool_size=1,
+            poolclass=MeteredQueuePool,
+            pool_size=dbconfig.pool_size,
+            max_overflow=dbconfig.max_overflow,
+            pool_recycle=dbconfig.pool_recycle,
+            pool_timeout=dbconfig.pool_timeout,
+            pool_pre_ping=dbconfig.pool_pre_ping,
             connect_args={'options': f"-csearch_path={dbconfig.schema}"},
         )
         try:
@@ -45,20 +64,24 @@ class Engine:
         except Exception as e:
             log.error(f'Could not create schema: {e}')
 
-        self.sessions = {}
-        self._session = None
+        self._sessions = scoped_session(
+            sessionmaker(bind=self.engine, autoflush=True, expire_on_commit=False),
+            scopefunc=_session_scope,
+        )
 
     def session(self):
-        if self._session is None:
-            self._session = sessionmaker(
-                bind=self.engine, autoflush=True, expire_on_commit=False
-            )()
-
-        return self._session
+        """Returns the session of the current thread (or asyncio task)"""
+        return self._sessions()
 
     @contextmanager
     def scoped_session(self):
+        """
+        Nested scopes of the same thread share one session.
+        The outermost scope releases the session from the registry, so the connection goes back to the pool
+        """
         s = self.session()
+        depth = s.info.get(_SCOPE_DEPTH, 0)
+        s.info[_SCOPE_DEPTH] = depth + 1
         try:
             yield s
             s.commit()
@@ -66,9 +89,17 @@ class Engine:
             s.rollback()
             raise e
         finally:
+            s.info[_SCOPE_DEPTH] = depth
             s.close()
+            if depth == 0:
+                self._sessions.remove()
+
+    def pool_metrics(self) -> dict:
+        """Returns the state of the connection pool: checked out connections, overflow and checkout wait time"""
+        return self.engine.pool.stats()
 
     def dispose(self):
+        self._sessions.remove()
         self.engine.dispose()
 
 
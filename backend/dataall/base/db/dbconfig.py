@@ -11,8 +11,25 @@ _MAX_HOST_LENGTH = 253
 _envname = os.getenv('envname', 'local')
 
 
+def _int_env(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
 class DbConfig:
-    def __init__(self, user: str, pwd: str, host: str, db: str, schema: str):
+    def __init__(
+        self,
+        user: str,
+        pwd: str,
+        host: str,
+        db: str,
+        schema: str,
+        pool_size: int = None,
+        max_overflow: int = None,
+        pool_recycle: int = None,
+        pool_timeout: int = None,
+        pool_pre_ping: bool = None,
+    ):
         for param in (user, db, schema):
             if len(param) > _POSTGRES_MAX_LEN:
                 raise ValueError(
@@ -33,6 +50,21 @@ class DbConfig:
         pwd = self._sanitize_and_compare(_SANITIZE_PWD_REGEX, pwd, "password")
         self.url = f"postgresql+pygresql://{self.user}:{pwd}@{self.host}/{self.db}"
 
+        # Connection pool settings. A Lambda serves one request at a time and needs a single connection,
+        # while long-running ECS tasks or the threaded local server can size the pool with the env variables
+        self.pool_size = pool_size if pool_size is not None else _int_env('db_pool_size', 1)
+        self.max_overflow = max_overflow if max_overflow is not None else _int_env('db_max_overflow', 10)
+        self.pool_recycle = pool_recycle if pool_recycle is not None else _int_env('db_pool_recycle', -1)
+        self.pool_timeout = pool_timeout if pool_timeout is not None else _int_env('db_pool_timeout', 30)
+        if pool_pre_ping is None:
+            pool_pre_ping = os.getenv('db_pool_pre_ping', 'false').lower() == 'true'
+        self.pool_pre_ping = pool_pre_ping
+
+        if self.pool_size < 1 or self.max_overflow < 0:
+            raise ValueError(
+                f"Invalid connection pool size: pool_size={self.pool_size}, max_overflow={self.max_overflow}"
+            )
+
     def __str__(self):
         lines = ['  DbConfig >']
         hr = ' '.join(['+', ''.ljust(10, '-'), '+', ''.ljust(65, '-'), '+'])
@@ -45,6 +77,8 @@ class DbConfig:
         lines.append(' '.join(['|', "db".ljust(10), '|', self.db.ljust(65), '|']))
         lines.append(' '.join(['|', "user".ljust(10), '|', self.user.ljust(65), '|']))
         lines.append(' '.join(['|', "pwd".ljust(10), '|', "*****".ljust(65), '|']))
+        pool = f"size={self.pool_size} overflow={self.max_overflow} recycle={self.pool_recycle} pre_ping={self.pool_pre_ping}"
+        lines.append(' '.join(['|', "pool".ljust(10), '|', pool.ljust(65), '|']))
 
         hr = ' '.join(['+', ''.ljust(10, '-'), '+', ''.ljust(65, '-'), '+'])
         lines.append(hr)
@@ -1,7 +1,19 @@
+import base64
+import json
 import math
+import os
+from datetime import date, datetime
+from typing import Any, Hashable, List, Optional
+
+from sqlalchemy import tuple_
+
+from dataall.base.db import exceptions
+from dataall.base.utils.ttl_cache import TTLCache
 
 __version__ = '0.0.2'
 
+_TOTALS_CACHE = TTLCache(ttl=float(os.getenv('pagination_total_cache_ttl', '60')), name='pagination_totals')
+
 
 class Page(object):
     def __init__(self, items, page, page_size, total):
@@ -42,3 +54,140 @@ def paginate(query, page, page_size):
     items = query.limit(page_size).offset((page - 1) * page_size).all()
     total = query.order_by(None).count()
     return Page(items, page, page_size, total)
+
+
+class CursorPage(object):
+    """
+    Page of a keyset (cursor) pagination. The cursors are opaque strings pointing to the first and the last items.
+    The total is optional, because counting all the rows is what makes deep pages expensive
+    """
+
+    def __init__(self, items, page_size, start_cursor, end_cursor, has_next, has_previous, total=None):
+        self.items = items
+        self.page_size = page_size
+        self.start_cursor = start_cursor
+        self.end_cursor = end_cursor
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.total = total
+
+    def to_dict(self):
+        return {
+            'count': self.total,
+            'pages': int(math.ceil(self.total / float(self.page_size))) if self.total is not None else None,
+            'pageSize': self.page_size,
+            'nodes': self.items,
+            'hasNext': self.has_next,
+            'hasPrevious': self.has_previous,
+            'startCursor': self.start_cursor,
+            'endCursor': self.end_cursor,
+        }
+
+
+def is_cursor_request(data: Optional[dict]) -> bool:
+    """Checks if a GraphQL filter opted into the cursor pagination"""
+    if not data:
+        return False
+    return bool(data.get('cursorPagination')) or data.get('after') is not None or data.get('before') is not None
+
+
+def encode_cursor(values: List[Any]) -> str:
+    encoded = []
+    for value in values:
+        if isinstance(value, datetime):
+            encoded.append({'dt': value.isoformat()})
+        elif isinstance(value, date):
+            encoded.append({'d': value.isoformat()})
+        else:
+            encoded.append(value)
+    return base64.urlsafe_b64encode(json.dumps(encoded).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError(f'expected {size} values')
+
+        decoded = []
+        for value in values:
+            if isinstance(value, dict) and 'dt' in value:
+                decoded.append(datetime.fromisoformat(value['dt']))
+            elif isinstance(value, dict) and 'd' in value:
+                decoded.append(date.fromisoformat(value['d']))
+            else:
+                decoded.append(value)
+        return decoded
+    except (ValueError, TypeError) as e:
+        raise exceptions.InvalidInput('cursor', cursor, f'a cursor returned by a previous page ({e})')
+
+
+def paginate_keyset(
+    query,
+    sort_keys: list,
+    page_size: int,
+    after: str = None,
+    before: str = None,
+    descending: bool = False,
+    with_total: bool = False,
+    total_cache_key: Hashable = None,
+) -> CursorPage:
+    """
+    Paginates with WHERE (sort keys) > (cursor) ORDER BY sort keys LIMIT page_size instead of OFFSET,
+    so every page costs the same. The sort keys must be unique together (end with the primary key).
+    The total is counted only with with_total, and is cached for a short time if total_cache_key is provided
+    """
+    if page_size <= 0:
+        raise AttributeError('page_size needs to be >= 1')
+    if after and before:
+        raise exceptions.InvalidInput('before', before, 'empty when after is provided')
+
+    backward = bool(before)
+    cursor = before if backward else after
+    reverse = descending != backward
+    key = tuple_(*sort_keys) if len(sort_keys) > 1 else sort_keys[0]
+
+    total = None
+    if with_total:
+        count = lambda: query.order_by(None).count()  # noqa: E731
+        total = _TOTALS_CACHE.get_or_load(total_cache_key, count) if total_cache_key else count()
+
+    page_query = query.order_by(None)
+    bound = None
+    if cursor:
+        values = decode_cursor(cursor, len(sort_keys))
+        bound = tuple_(*values) if len(values) > 1 else values[0]
+        page_query = page_query.filter(key < bound if reverse else key > bound)
+
+    rows = (
+        page_query.order_by(*[k.desc() if reverse else k.asc() for k in sort_keys])
+        .limit(page_size + 1)
+        .all()
+    )
+    has_more = len(rows) > page_size
+    items = rows[:page_size]
+
+    def _cursor(item):
+        return encode_cursor([getattr(item, k.key) for k in sort_keys])
+
+    has_next = has_more
+    if backward:
+        items.reverse()
+        # the rows after the page: after its last row, or from the before cursor if the page is empty
+        if items:
+            values = [getattr(items[-1], k.key) for k in sort_keys]
+            last = tuple_(*values) if len(values) > 1 else values[0]
+            following = key < last if descending else key > last
+        else:
+            following = key <= bound if descending else key >= bound
+        has_next = query.order_by(None).filter(following).first() is not None
+
+    return CursorPage(
+        items=items,
+        page_size=page_size,
+        start_cursor=_cursor(items[0]) if items else None,
+        end_cursor=_cursor(items[-1]) if items else None,
+        has_next=has_next,
+        has_previous=has_more if backward else bool(after),
+        total=total,
+    )
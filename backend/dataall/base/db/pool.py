@@ -0,0 +1,61 @@
+"""
+Connection pool that records how long the callers wait for a connection.
+The metrics are used to size the database connections for concurrent Lambdas and long-running ECS tasks
+"""
+import threading
+import time
+
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """Thread-safe counters of connection checkouts"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                'checkouts': self.checkouts,
+                'total_wait_seconds': round(self.total_wait, 6),
+                'avg_wait_seconds': round(self.total_wait / self.checkouts, 6) if self.checkouts else 0.0,
+                'max_wait_seconds': round(self.max_wait, 6),
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that measures the wait time of every checkout"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        connection = super()._do_get()
+        self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def stats(self):
+        return {
+            'size': self.size(),
+            'checked_in': self.checkedin(),
+            'checked_out': self.checkedout(),
+            'overflow': max(self.overflow(), 0),
+            **self.metrics.to_dict(),
+        }
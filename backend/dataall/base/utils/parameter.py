@@ -5,16 +5,29 @@ import os
 import boto3
 from botocore.exceptions import ClientError
 
+from dataall.base.utils.ttl_cache import TTLCache
+
 log = logging.getLogger('utils:Parameter')
 
+# Parameters rarely change, the values are kept by warm Lambdas and ECS tasks for parameter_cache_ttl seconds
+_PARAMETER_CACHE_TTL = int(os.getenv('parameter_cache_ttl', '300'))
+# Missing parameters are cached for a shorter time, so a newly created one is picked up quickly
+_MISSING_PARAMETER_TTL = int(os.getenv('missing_parameter_cache_ttl', '60'))
+
+_NOT_CACHED = object()
+
 
 class Parameter:
     prefix = 'dataall'
+    _clients = {}
+    _cache = TTLCache(ttl=_PARAMETER_CACHE_TTL, name='ssm_parameters')
 
     @classmethod
     def ssm(cls):
-        client = boto3.client('ssm', region_name=os.getenv('AWS_REGION', 'eu-west-1'))
-        return client
+        region = os.getenv('AWS_REGION', 'eu-west-1')
+        if region not in cls._clients:
+            cls._clients[region] = boto3.client('ssm', region_name=region)
+        return cls._clients[region]
 
     @classmethod
     def get_parameter_name(cls, env, path=''):
@@ -34,33 +47,65 @@ class Parameter:
             Type='String',
             Overwrite=True,
         )
+        cls._cache.invalidate(pname)
         return Parameter.get_parameter(env, path)
 
     @classmethod
     def get_parameter(cls, env, path=''):
-        pname = cls.get_parameter_name(env, path)
-        ssm = cls.ssm()
+        return cls.get_parameter_by_name(cls.get_parameter_name(env, path))
+
+    @classmethod
+    def get_parameter_by_name(cls, pname):
+        """Reads a parameter by its full name. Values (and missing parameters) are cached"""
+        cached = cls._cache.get(pname, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return cached
+
         try:
-            param_value = ssm.get_parameter(Name=pname)['Parameter']['Value']
+            param_value = cls.ssm().get_parameter(Name=pname)['Parameter']['Value']
+            cls._cache.put(pname, param_value)
             return param_value
         except ClientError as e:
             if e.response['Error']['Code'] == 'ParameterNotFound':
-                log.warning(
-                    'Parameter `{}` not found for env `{}`, defaulting to None'.format(
-                        path, env
-                    )
-                )
+                log.warning(f'Parameter `{pname}` not found, defaulting to None')
+                cls._cache.put(pname, None, ttl=_MISSING_PARAMETER_TTL)
                 return None
             else:
                 log.error('Error trying to retrieve parameter from SSM')
                 raise e
 
+    @classmethod
+    def prefetch(cls, env, prefix=None):
+        """Loads all the parameters of the environment with get_parameters_by_path and caches them"""
+        pname = cls.get_parameter_name(env, prefix or '')
+        paginator = cls.ssm().get_paginator('get_parameters_by_path')
+        count = 0
+        try:
+            for page in paginator.paginate(Path=pname, Recursive=True):
+                for p in page['Parameters']:
+                    cls._cache.put(p['Name'], p['Value'])
+                    count += 1
+        except ClientError as e:
+            log.warning(f'Failed to prefetch parameters from {pname} due to: {e}')
+        log.info(f'Prefetched {count} parameters from {pname}')
+        return count
+
+    @classmethod
+    def cache_stats(cls):
+        """Hits are the SSM calls saved by the cache"""
+        return cls._cache.stats()
+
+    @classmethod
+    def clear_cache(cls):
+        cls._cache.invalidate()
+
     @classmethod
     def clean_environment(cls, env):
         params = cls.get_parameters(env=env)
         for p in params[env]:
             pname = Parameter.get_parameter_name(env=env, path=p['Name'])
             cls.ssm().delete_parameter(Name=pname)
+        cls.clear_cache()
 
     @classmethod
     def get_parameters(cls, env, prefix=None):
@@ -0,0 +1,93 @@
+"""
+In-memory cache with time-to-live entries.
+Lambdas and ECS tasks keep module level objects between invocations (warm containers),
+so the cache saves repeated lookups of data that rarely changes (SSM parameters, provisioned groups, etc.)
+"""
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe key/value cache that forgets the entries after ttl seconds.
+    If max_size is set, the oldest entry is evicted when a new key is added to a full cache
+    """
+
+    def __init__(self, ttl: float, name: str = 'cache', max_size: int = None):
+        self.ttl = ttl
+        self.name = name
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default=None) -> Any:
+        with self._lock:
+            value = self._get_alive(key)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def contains(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._get_alive(key) is not _MISSING
+
+    def put(self, key: Hashable, value: Any, ttl: float = None) -> None:
+        with self._lock:
+            if self.max_size and key not in self._entries and len(self._entries) >= self.max_size:
+                self._evict()
+            self._entries[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: float = None) -> Any:
+        """Returns the cached value or loads it. None is a valid value and is cached as well"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.put(key, value, ttl)
+        return value
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Removes an entry, or all entries if no key is provided"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def invalidate_matching(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Removes the entries whose key matches the predicate and returns how many were removed"""
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'name': self.name, 'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    def _get_alive(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        return value
+
+    def _evict(self):
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        if len(self._entries) >= self.max_size:
+            # the entries are kept in insertion order, the first one is the oldest
+            del self._entries[next(iter(self._entries))]
@@ -0,0 +1,13 @@
+"""Batch loaders of the environment entities for the nested GraphQL fields"""
+from dataall.base.api.batch_loader import BatchLoader
+from dataall.core.environment.db.environment_repositories import EnvironmentRepository
+
+
+def _load_environments(session, sources):
+    return {
+        env.environmentUri: env
+        for env in EnvironmentRepository.list_environments_by_uris(session, list(sources.keys()))
+    }
+
+
+environment_loader = BatchLoader('Environment', _load_environments)
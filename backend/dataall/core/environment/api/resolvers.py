@@ -15,6 +15,8 @@ from dataall.core.environment.db.environment_models import EnvironmentGroup
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResourceManager
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.environment.api.enums import EnvironmentPermission
+from dataall.core.environment.api.loaders import environment_loader
+from dataall.core.organizations.api.loaders import organization_loader
 from dataall.core.permissions.db.resource_policy_repositories import ResourcePolicy
 from dataall.core.stacks.api import stack_helper
 from dataall.core.stacks.aws.cloudformation import CloudFormation
@@ -309,8 +311,7 @@ def list_environment_networks(
 
 
 def get_parent_organization(context: Context, source, **kwargs):
-    org = get_organization(context, source, organizationUri=source.organizationUri)
-    return org
+    return organization_loader.load(source, 'organizationUri')
 
 
 def resolve_vpc_list(context: Context, source, **kwargs):
@@ -680,8 +681,7 @@ def resolve_environment(context, source, **kwargs):
     """Resolves the environment for a environmental resource"""
     if not source:
         return None
-    with context.engine.scoped_session() as session:
-        return session.query(Environment).get(source.environmentUri)
+    return environment_loader.load(source, 'environmentUri')
 
 
 def resolve_parameters(context, source: Environment, **kwargs):
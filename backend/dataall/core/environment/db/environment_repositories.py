@@ -44,3 +44,7 @@ class EnvironmentRepository:
         if not environment:
             raise exceptions.ObjectNotFound(Environment.__name__, uri)
         return environment
+
+    @staticmethod
+    def list_environments_by_uris(session, uris):
+        return session.query(Environment).filter(Environment.environmentUri.in_(uris)).all()
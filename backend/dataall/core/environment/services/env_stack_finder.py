@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import List
+from typing import Dict, List, Optional
 
 
 class StackFinder(ABC):
@@ -15,3 +15,10 @@ class StackFinder(ABC):
     def find_stack_uris(self, session) -> List[str]:
         """Finds stacks to update"""
         raise NotImplementedError("find_stack_uris is not implemented")
+
+    def find_stack_environments(self, session) -> Dict[str, Optional[str]]:
+        """
+        Maps the stacks to update to the URI of the environment they are deployed in.
+        The stacks are updated once their environment stack is updated, the stacks without environment right away
+        """
+        return {uri: None for uri in self.find_stack_uris(session)}
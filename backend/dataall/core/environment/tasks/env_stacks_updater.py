@@ -2,6 +2,10 @@ import logging
 import os
 import sys
 import time
+from collections import Counter, defaultdict, deque
+from typing import Dict, List, Optional
+
+from botocore.exceptions import ClientError
 
 from dataall.base.loader import ImportMode, load_modules
 from dataall.core.environment.db.environment_models import Environment
@@ -21,48 +25,160 @@ log = logging.getLogger(__name__)
 RETRIES = 30
 SLEEP_TIME = 30
 
+MAX_CONCURRENT_UPDATES = int(os.getenv('stack_updater_max_concurrent', '10'))
+MAX_UPDATES_PER_ACCOUNT = int(os.getenv('stack_updater_max_per_account', '3'))
+
+THROTTLING_ERRORS = {'ThrottlingException', 'Throttling', 'TooManyRequestsException'}
+
+
+class _StackUpdate:
+    def __init__(self, stack, depends_on: Optional[str] = None):
+        self.stack = stack
+        self.depends_on = depends_on
+        self.task_arn = None
+        self.started = None
+
+    @property
+    def started_by(self):
+        return f'awsworker-{self.stack.stackUri}'
+
+
+class StackUpdateScheduler:
+    """
+    Runs the cdkproxy tasks of the stacks with a limit of concurrent tasks overall and per AWS account.
+    A stack added with depends_on waits until the update of the stack of that target is finished
+    (successful, failed or timed out)
+    """
+
+    def __init__(
+        self,
+        session,
+        envname,
+        max_concurrent: int = MAX_CONCURRENT_UPDATES,
+        max_per_account: int = MAX_UPDATES_PER_ACCOUNT,
+        poll_interval: int = SLEEP_TIME,
+        timeout: int = RETRIES * SLEEP_TIME,
+    ):
+        self.session = session
+        self.max_concurrent = max(max_concurrent, 1)
+        self.max_per_account = max(max_per_account, 1)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
+        self._ready = deque()
+        self._waiting: Dict[str, List[_StackUpdate]] = defaultdict(list)
+        self._in_flight: Dict[str, _StackUpdate] = {}
+        self._per_account = Counter()
+        self._finished = set()
+        self.stats = {'started': 0, 'already_running': 0, 'completed': 0, 'timed_out': 0, 'failed': 0}
+
+    def add(self, target_uri: str, depends_on: Optional[str] = None) -> None:
+        stack = Stack.find_stack_by_target_uri(self.session, target_uri=target_uri)
+        if not stack:
+            log.warning(f'No stack found for target {target_uri}, skipping...')
+            return
+        update = _StackUpdate(stack, depends_on)
+        if depends_on and depends_on not in self._finished:
+            self._waiting[depends_on].append(update)
+        else:
+            self._ready.append(update)
+
+    def run(self) -> dict:
+        # the dependencies that are not scheduled would never finish
+        scheduled = {update.stack.targetUri for update in self._ready}
+        for target_uri in list(self._waiting):
+            if target_uri not in scheduled:
+                self._ready.extend(self._waiting.pop(target_uri))
+
+        running = Ecs.list_running_tasks(cluster_name=self.cluster_name)
+        while True:
+            self._launch(running)
+            running = {}
+            if not self._ready and not self._in_flight:
+                break
+            time.sleep(self.poll_interval)
+            if self._in_flight:
+                self._poll()
+
+        log.info(f'Stack updates finished: {self.stats}')
+        return self.stats
+
+    def _launch(self, running: dict) -> None:
+        postponed = deque()
+        while self._ready and len(self._in_flight) < self.max_concurrent:
+            update = self._ready.popleft()
+            account = update.stack.accountid
+            if self._per_account[account] >= self.max_per_account:
+                postponed.append(update)
+                continue
+
+            if update.started_by in running:
+                log.info(f'Stack update is already running... Waiting for {update.stack.name}//{update.stack.stackUri}')
+                update.task_arn = running[update.started_by]
+                self.stats['already_running'] += 1
+            else:
+                try:
+                    update.task_arn = Ecs.run_cdkproxy_task(stack_uri=update.stack.stackUri)
+                except ClientError as e:
+                    if e.response['Error']['Code'] in THROTTLING_ERRORS:
+                        log.info(f'Throttled while starting {update.stack.stackUri}, retrying at the next poll')
+                        postponed.append(update)
+                        break
+                    log.error(f'Failed to start the update of {update.stack.name}//{update.stack.stackUri}: {e}')
+                    self.stats['failed'] += 1
+                    self._finish(update)
+                    continue
+                update.stack.EcsTaskArn = update.task_arn
+                self.stats['started'] += 1
+
+            update.started = time.monotonic()
+            self._in_flight[update.task_arn] = update
+            self._per_account[account] += 1
+        self._ready.extendleft(reversed(postponed))
+        self.session.commit()
+
+    def _poll(self) -> None:
+        statuses = Ecs.describe_task_statuses(cluster_name=self.cluster_name, task_arns=list(self._in_flight))
+        now = time.monotonic()
+        for task_arn, update in list(self._in_flight.items()):
+            if statuses.get(task_arn, 'STOPPED') == 'STOPPED':
+                log.info(f'Update for {update.stack.name}//{update.stack.stackUri} COMPLETE')
+                self.stats['completed'] += 1
+            elif now - update.started > self.timeout:
+                log.info(f'Update for {update.stack.name}//{update.stack.stackUri} not complete after {self.timeout}s')
+                self.stats['timed_out'] += 1
+            else:
+                continue
+            del self._in_flight[task_arn]
+            self._per_account[update.stack.accountid] -= 1
+            self._finish(update)
+
+    def _finish(self, update: _StackUpdate) -> None:
+        target_uri = update.stack.targetUri
+        self._finished.add(target_uri)
+        self._ready.extend(self._waiting.pop(target_uri, []))
+
 
 def update_stacks(engine, envname):
     with engine.scoped_session() as session:
         all_environments: [Environment] = EnvironmentService.list_all_active_environments(session)
-        additional_stacks = []
+        additional_stacks = {}
         for finder in StackFinder.all():
-            additional_stacks.extend(finder.find_stack_uris(session))
+            additional_stacks.update(finder.find_stack_environments(session))
 
         log.info(f'Found {len(all_environments)} environments, triggering update stack tasks...')
+        scheduler = StackUpdateScheduler(session=session, envname=envname)
         environment: Environment
         for environment in all_environments:
-            update_stack(session=session, envname=envname, target_uri=environment.environmentUri, wait=True)
+            scheduler.add(environment.environmentUri)
 
-        for stack_uri in additional_stacks:
-            update_stack(session=session, envname=envname, target_uri=stack_uri, wait=False)
+        for stack_uri, environment_uri in additional_stacks.items():
+            scheduler.add(stack_uri, depends_on=environment_uri)
 
+        scheduler.run()
         return len(all_environments), len(additional_stacks)
 
 
-def update_stack(session, envname, target_uri, wait=False):
-    stack = Stack.get_stack_by_target_uri(
-        session, target_uri=target_uri
-    )
-    cluster_name = Parameter().get_parameter(env=envname, path='ecs/cluster/name')
-    if not Ecs.is_task_running(cluster_name=cluster_name, started_by=f'awsworker-{stack.stackUri}'):
-        stack.EcsTaskArn = Ecs.run_cdkproxy_task(stack_uri=stack.stackUri)
-        if wait:
-            retries = 1
-            while Ecs.is_task_running(cluster_name=cluster_name, started_by=f'awsworker-{stack.stackUri}'):
-                log.info(f"Update for {stack.name}//{stack.stackUri} is not complete, waiting for {SLEEP_TIME} seconds...")
-                time.sleep(SLEEP_TIME)
-                retries = retries + 1
-                if retries > RETRIES:
-                    log.info(f"Maximum number of retries exceeded ({RETRIES} retries), continuing task...")
-                    break
-            log.info(f"Update for {stack.name}//{stack.stackUri} COMPLETE or maximum number of retries exceeded ({RETRIES} retries)")
-    else:
-        log.info(
-            f'Stack update is already running... Skipping stack {stack.name}//{stack.stackUri}'
-        )
-
-
 if __name__ == '__main__':
     envname = os.environ.get('envname', 'local')
     engine = get_engine(envname=envname)
@@ -0,0 +1,13 @@
+"""Batch loaders of the organization entities for the nested GraphQL fields"""
+from dataall.base.api.batch_loader import BatchLoader
+from dataall.core.organizations.db.organization_repositories import Organization
+
+
+def _load_organizations(session, sources):
+    return {
+        org.organizationUri: org
+        for org in Organization.list_organizations_by_uris(session, list(sources.keys()))
+    }
+
+
+organization_loader = BatchLoader('Organization', _load_organizations)
@@ -0,0 +1,108 @@
+"""
+Request-scoped permission resolver.
+Loads all the grants of the caller's groups once per request and answers the subsequent permission checks
+from memory instead of running the policy joins for every decorated method.
+"""
+import logging
+from typing import List, Optional, Set, Tuple
+
+from dataall.base.context import RequestContext, find_context
+from dataall.core.permissions.db import permission_models as models
+
+logger = logging.getLogger(__name__)
+
+_CACHE_KEY = 'permission_resolver'
+
+
+class PermissionResolver:
+    """Holds resource and tenant grants of the groups of a single request"""
+
+    def __init__(self, groups: List[str]):
+        self._groups = list(groups or [])
+        self._resource_grants: Optional[Set[Tuple[str, str]]] = None
+        self._tenant_grants: Optional[Set[Tuple[str, str]]] = None
+
+    @staticmethod
+    def for_context(context: RequestContext) -> 'PermissionResolver':
+        resolver = context.cache.get(_CACHE_KEY)
+        if resolver is None:
+            resolver = PermissionResolver(context.groups)
+            context.cache[_CACHE_KEY] = resolver
+        return resolver
+
+    @staticmethod
+    def invalidate_current():
+        """Drops the grants loaded in the current request (if any), so the next check reads them again"""
+        context = find_context()
+        if context and _CACHE_KEY in context.cache:
+            context.cache[_CACHE_KEY].invalidate()
+
+    def invalidate(self):
+        self._resource_grants = None
+        self._tenant_grants = None
+
+    def has_resource_permission(self, session, resource_uri: str, permission_name: str) -> bool:
+        if not permission_name or not resource_uri:
+            return False
+
+        if self._resource_grants is None:
+            self._resource_grants = self._load_resource_grants(session)
+        return (resource_uri, permission_name) in self._resource_grants
+
+    def has_tenant_permission(self, session, tenant_name: str, permission_name: str) -> bool:
+        if not permission_name:
+            return False
+
+        if self._tenant_grants is None:
+            self._tenant_grants = self._load_tenant_grants(session)
+        return (tenant_name, permission_name) in self._tenant_grants
+
+    def _load_resource_grants(self, session) -> Set[Tuple[str, str]]:
+        if not self._groups:
+            return set()
+
+        grants = (
+            session.query(models.ResourcePolicy.resourceUri, models.Permission.name)
+            .join(
+                models.ResourcePolicyPermission,
+                models.ResourcePolicy.sid == models.ResourcePolicyPermission.sid,
+            )
+            .join(
+                models.Permission,
+                models.Permission.permissionUri == models.ResourcePolicyPermission.permissionUri,
+            )
+            .filter(
+                models.ResourcePolicy.principalId.in_(self._groups),
+                models.ResourcePolicy.principalType == 'GROUP',
+            )
+            .distinct()
+            .all()
+        )
+        logger.debug(f'Loaded {len(grants)} resource grants for groups {self._groups}')
+        return {(uri, name) for uri, name in grants}
+
+    def _load_tenant_grants(self, session) -> Set[Tuple[str, str]]:
+        if not self._groups:
+            return set()
+
+        grants = (
+            session.query(models.Tenant.name, models.Permission.name)
+            .select_from(models.TenantPolicy)
+            .join(
+                models.TenantPolicyPermission,
+                models.TenantPolicy.sid == models.TenantPolicyPermission.sid,
+            )
+            .join(
+                models.Tenant,
+                models.Tenant.tenantUri == models.TenantPolicy.tenantUri,
+            )
+            .join(
+                models.Permission,
+                models.Permission.permissionUri == models.TenantPolicyPermission.permissionUri,
+            )
+            .filter(models.TenantPolicy.principalId.in_(self._groups))
+            .distinct()
+            .all()
+        )
+        logger.debug(f'Loaded {len(grants)} tenant grants for groups {self._groups}')
+        return {(tenant, name) for tenant, name in grants}
@@ -5,6 +5,7 @@ from sqlalchemy.sql import and_
 
 from dataall.core.permissions.db.permission_repositories import Permission
 from dataall.core.permissions.db.permission_models import PermissionType
+from dataall.core.permissions.db.permission_resolver import PermissionResolver
 from dataall.base.db import exceptions
 from dataall.core.permissions.db import permission_models as models
 
@@ -143,6 +144,7 @@ class ResourcePolicy:
             session, group, permissions, resource_uri, policy
         )
 
+        PermissionResolver.invalidate_current()
         return policy
 
     @staticmethod
@@ -162,6 +164,7 @@ class ResourcePolicy:
                 session.delete(permission)
             session.delete(policy)
             session.commit()
+            PermissionResolver.invalidate_current()
 
         return True
 
@@ -7,6 +7,7 @@ from dataall.base.db import exceptions, paginate
 from dataall.core.permissions import permissions
 from dataall.core.permissions.db import permission_models as models
 from dataall.core.permissions.db.permission_repositories import Permission
+from dataall.core.permissions.db.permission_resolver import PermissionResolver
 from dataall.core.permissions.db.tenant_repositories import Tenant as TenantService
 
 logger = logging.getLogger(__name__)
@@ -136,6 +137,27 @@ class TenantPolicy:
         )
         return tenant_policy
 
+    @staticmethod
+    def find_groups_with_tenant_policy(session, groups: [str], tenant_name: str) -> set:
+        """Returns the subset of groups that already have a policy in the tenant"""
+        if not groups:
+            return set()
+
+        rows = (
+            session.query(models.TenantPolicy.principalId)
+            .join(
+                models.Tenant, models.Tenant.tenantUri == models.TenantPolicy.tenantUri
+            )
+            .filter(
+                and_(
+                    models.TenantPolicy.principalId.in_(groups),
+                    models.Tenant.name == tenant_name,
+                )
+            )
+            .all()
+        )
+        return {row.principalId for row in rows}
+
     @staticmethod
     def validate_find_tenant_policy(group_uri, tenant_name):
         if not group_uri:
@@ -159,6 +181,7 @@ class TenantPolicy:
             session, group, permissions, tenant_name, policy
         )
 
+        PermissionResolver.invalidate_current()
         return policy
 
     @staticmethod
@@ -271,6 +294,7 @@ class TenantPolicy:
                 session.delete(permission)
             session.delete(policy)
             session.commit()
+            PermissionResolver.invalidate_current()
 
         return True
 
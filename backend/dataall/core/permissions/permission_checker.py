@@ -5,7 +5,8 @@ and interact with resources or do some actions in the app
 from typing import Protocol, Callable
 
 from dataall.base.context import RequestContext, get_context
-from dataall.core.permissions.db.resource_policy_repositories import ResourcePolicy
+from dataall.base.db import exceptions
+from dataall.core.permissions.db.permission_resolver import PermissionResolver
 from dataall.core.permissions.db.tenant_policy_repositories import TenantPolicy
 from dataall.base.utils.decorator_utls import process_func
 
@@ -18,24 +19,27 @@ class Identifiable(Protocol):
 
 def _check_tenant_permission(session, permission):
     context: RequestContext = get_context()
-    TenantPolicy.check_user_tenant_permission(
-        session=session,
-        username=context.username,
-        groups=context.groups,
-        tenant_name='dataall',
-        permission_name=permission
-    )
+    if TenantPolicy.is_tenant_admin(context.groups):
+        return
+
+    resolver = PermissionResolver.for_context(context)
+    if not context.username or not resolver.has_tenant_permission(session, 'dataall', permission):
+        raise exceptions.TenantUnauthorized(
+            username=context.username,
+            action=permission,
+            tenant_name='dataall',
+        )
 
 
 def _check_resource_permission(session, uri, permission):
     context: RequestContext = get_context()
-    ResourcePolicy.check_user_resource_permission(
-        session=session,
-        username=context.username,
-        groups=context.groups,
-        resource_uri=uri,
-        permission_name=permission,
-    )
+    resolver = PermissionResolver.for_context(context)
+    if not context.username or not resolver.has_resource_permission(session, uri, permission):
+        raise exceptions.ResourceUnauthorized(
+            username=context.username,
+            action=permission,
+            resource_uri=uri,
+        )
 
 
 def has_resource_permission(
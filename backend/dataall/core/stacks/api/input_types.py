@@ -17,3 +17,11 @@ UpdateKeyValueTagsInput = gql.InputType(
         gql.Argument(name='tags', type=gql.ArrayType(gql.Ref('KeyValueTagInput'))),
     ],
 )
+
+StackEventFilter = gql.InputType(
+    name='StackEventFilter',
+    arguments=[
+        gql.Argument(name='page', type=gql.Integer),
+        gql.Argument(name='pageSize', type=gql.Integer),
+    ],
+)
@@ -3,11 +3,10 @@ import logging
 import os
 
 from dataall.base.api.context import Context
-from dataall.core.environment.db.environment_models import Environment
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.stacks.api import stack_helper
-from dataall.core.stacks.aws.cloudformation import CloudFormation
 from dataall.core.stacks.aws.cloudwatch import CloudWatch
+from dataall.core.stacks.db.stack_event_repositories import StackEventRepository
 from dataall.core.stacks.db.stack_models import Stack as StackModel
 from dataall.core.stacks.db.keyvaluetag_repositories import KeyValueTag
 from dataall.core.stacks.db.stack_repositories import Stack
@@ -16,20 +15,23 @@ from dataall.base.utils import Parameter
 
 log = logging.getLogger(__name__)
 
+# Number of events returned by the events field, the stackEvents field pages through all the stored events
+EVENTS_LIMIT = 100
+
 
 def get_stack(
     context: Context, source, environmentUri: str = None, stackUri: str = None
 ):
     with context.engine.scoped_session() as session:
-        env: Environment = session.query(Environment).get(environmentUri)
-        stack: StackModel = session.query(StackModel).get(stackUri)
-        cfn_task = stack_helper.save_describe_stack_task(session, env, stack, None)
-        CloudFormation.describe_stack_resources(engine=context.engine, task=cfn_task)
-        return EnvironmentService.get_stack(
+        stack: StackModel = EnvironmentService.get_stack(
             session=session,
             uri=environmentUri,
             stack_uri=stackUri,
         )
+        if stack:
+            # the stack is served from the database, a refresh is queued if it's stale
+            stack_helper.get_stacks_with_cfn_resources(session, {stack.targetUri: environmentUri})
+        return stack
 
 
 def resolve_link(context, source, **kwargs):
@@ -59,7 +61,19 @@ def resolve_error(context, source: StackModel, **kwargs):
 def resolve_events(context, source: StackModel, **kwargs):
     if not source:
         return None
-    return json.dumps(source.events or {})
+    with context.engine.scoped_session() as session:
+        events = StackEventRepository.query_stack_events(session, source.stackUri).limit(EVENTS_LIMIT).all()
+        if not events:
+            # stacks that were not refreshed since the event store was added
+            return json.dumps(source.events or {})
+        return json.dumps({'events': [StackEventRepository.to_dict(event) for event in events]})
+
+
+def resolve_stack_events(context, source: StackModel, filter: dict = None):
+    if not source:
+        return None
+    with context.engine.scoped_session() as session:
+        return StackEventRepository.paginated_stack_events(session, source.stackUri, filter)
 
 
 def resolve_task_id(context, source: StackModel, **kwargs):
@@ -1,44 +1,96 @@
+import datetime
 import os
+from typing import Dict
 
 import requests
 
 from dataall.core.tasks.service_handlers import Worker
+from dataall.base.api.batch_loader import BatchLoader
 from dataall.base.config import config
 from dataall.base.context import get_context
 from dataall.core.environment.db.environment_models import Environment
+from dataall.core.environment.db.environment_repositories import EnvironmentRepository
 from dataall.core.stacks.aws.ecs import Ecs
 from dataall.core.stacks.db.stack_repositories import Stack
 from dataall.core.stacks.db.stack_models import Stack as StackModel
 from dataall.core.tasks.db.task_models import Task
 from dataall.base.utils import Parameter
 
+# The stacks are served from the database, and refreshed in the background when older than stack_status_ttl seconds
+STACK_STATUS_TTL = int(os.getenv('stack_status_ttl', '60'))
+# A refresh that did not complete after this time (e.g. a failed worker) can be requested again
+STACK_REFRESH_TIMEOUT = int(os.getenv('stack_refresh_timeout', '300'))
+
 
 def get_stack_with_cfn_resources(targetUri: str, environmentUri: str):
     context = get_context()
     with context.db_engine.scoped_session() as session:
-        env: Environment = session.query(Environment).get(environmentUri)
-        stack: StackModel = Stack.find_stack_by_target_uri(
-            session, target_uri=targetUri
+        return get_stacks_with_cfn_resources(session, {targetUri: environmentUri})[targetUri]
+
+
+def get_stacks_with_cfn_resources(session, targets: Dict[str, str]) -> Dict[str, StackModel]:
+    """
+    Reads the stacks of several targets at once and queues a single worker call
+    that describes the cloudformation resources of the stale stacks. targets is a dict {targetUri: environmentUri}
+    """
+    environments = {
+        env.environmentUri: env
+        for env in EnvironmentRepository.list_environments_by_uris(session, list(set(targets.values())))
+    }
+    stacks = {
+        stack.targetUri: stack
+        for stack in Stack.find_stacks_by_target_uris(session, list(targets.keys()))
+    }
+
+    now = datetime.datetime.now()
+    refresh = set(
+        Stack.claim_status_refresh(
+            session,
+            [stack.stackUri for stack in stacks.values()],
+            now=now,
+            stale_before=now - datetime.timedelta(seconds=STACK_STATUS_TTL),
+            requested_before=now - datetime.timedelta(seconds=STACK_REFRESH_TIMEOUT),
         )
+    )
+
+    result = {}
+    cfn_tasks = []
+    for target_uri, environment_uri in targets.items():
+        env: Environment = environments.get(environment_uri)
+        stack: StackModel = stacks.get(target_uri)
         if not stack:
-            stack = StackModel(
+            result[target_uri] = StackModel(
                 stack='environment',
                 payload={},
-                targetUri=targetUri,
+                targetUri=target_uri,
                 accountid=env.AwsAccountId if env else 'UNKNOWN',
                 region=env.region if env else 'UNKNOWN',
                 resources=str({}),
                 error=str({}),
                 outputs=str({}),
             )
-            return stack
+            continue
 
-        cfn_task = save_describe_stack_task(session, env, stack, targetUri)
-        Worker.queue(engine=context.db_engine, task_ids=[cfn_task.taskUri])
-    return stack
+        if stack.stackUri in refresh:
+            cfn_tasks.append(save_describe_stack_task(session, env, stack, target_uri, commit=False))
+        result[target_uri] = stack
 
+    session.commit()
+    if cfn_tasks:
+        Worker.queue(engine=get_context().db_engine, task_ids=[task.taskUri for task in cfn_tasks])
+    return result
+
+
+def _load_stacks(session, sources):
+    return get_stacks_with_cfn_resources(
+        session, {target_uri: source.environmentUri for target_uri, source in sources.items()}
+    )
 
-def save_describe_stack_task(session, environment, stack, target_uri):
+
+stack_loader = BatchLoader('Stack', _load_stacks)
+
+
+def save_describe_stack_task(session, environment, stack, target_uri, commit=True):
     cfn_task = Task(
         targetUri=stack.stackUri,
         action='cloudformation.stack.describe_resources',
@@ -52,7 +104,8 @@ def save_describe_stack_task(session, environment, stack, target_uri):
         },
     )
     session.add(cfn_task)
-    session.commit()
+    if commit:
+        session.commit()
     return cfn_task
 
 
@@ -1,6 +1,7 @@
 from dataall.base.api import gql
 from dataall.core.stacks.api.resolvers import (
-    resolve_link, resolve_resources, resolve_outputs, resolve_events, resolve_task_id, resolve_error
+    resolve_link, resolve_resources, resolve_outputs, resolve_events, resolve_task_id, resolve_error,
+    resolve_stack_events,
 )
 
 Stack = gql.ObjectType(
@@ -20,8 +21,45 @@ Stack = gql.ObjectType(
         gql.Field(name='resources', type=gql.String, resolver=resolve_resources),
         gql.Field(name='error', type=gql.String, resolver=resolve_error),
         gql.Field(name='events', type=gql.String, resolver=resolve_events),
+        gql.Field(
+            name='stackEvents',
+            args=[gql.Argument(name='filter', type=gql.Ref('StackEventFilter'))],
+            type=gql.Ref('StackEventSearchResult'),
+            resolver=resolve_stack_events,
+        ),
         gql.Field(name='EcsTaskArn', type=gql.String),
         gql.Field(name='EcsTaskId', type=gql.String, resolver=resolve_task_id),
+        gql.Field(name='lastRefreshed', type=gql.String),
+    ],
+)
+
+StackEvent = gql.ObjectType(
+    name='StackEvent',
+    fields=[
+        gql.Field(name='EventId', type=gql.ID),
+        gql.Field(name='Timestamp', type=gql.String),
+        gql.Field(name='ResourceStatus', type=gql.String),
+        gql.Field(name='ResourceStatusReason', type=gql.String),
+        gql.Field(name='LogicalResourceId', type=gql.String),
+        gql.Field(name='PhysicalResourceId', type=gql.String),
+        gql.Field(name='ResourceType', type=gql.String),
+        gql.Field(name='StackName', type=gql.String),
+        gql.Field(name='StackId', type=gql.String),
+    ],
+)
+
+StackEventSearchResult = gql.ObjectType(
+    name='StackEventSearchResult',
+    fields=[
+        gql.Field(name='count', type=gql.Integer),
+        gql.Field(name='nodes', type=gql.ArrayType(StackEvent)),
+        gql.Field(name='pageSize', type=gql.Integer),
+        gql.Field(name='nextPage', type=gql.Integer),
+        gql.Field(name='pages', type=gql.Integer),
+        gql.Field(name='page', type=gql.Integer),
+        gql.Field(name='previousPage', type=gql.Integer),
+        gql.Field(name='hasNext', type=gql.Boolean),
+        gql.Field(name='hasPrevious', type=gql.Boolean),
     ],
 )
 
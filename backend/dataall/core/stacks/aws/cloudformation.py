@@ -1,9 +1,11 @@
+import datetime
 import logging
 import uuid
 
 from botocore.exceptions import ClientError
 
 from dataall.base.aws.sts import SessionHelper
+from dataall.core.stacks.db.stack_event_repositories import StackEventRepository
 from dataall.core.stacks.db.stack_models import Stack
 from dataall.core.tasks.db.task_models import Task
 from dataall.base.utils import json_utils
@@ -17,8 +19,7 @@ class CloudFormation:
 
     @staticmethod
     def client(AwsAccountId, region, role=None):
-        session = SessionHelper.remote_session(accountid=AwsAccountId, role=role)
-        return session.client('cloudformation', region_name=region)
+        return SessionHelper.remote_client(AwsAccountId, 'cloudformation', region_name=region, role=role)
 
     @staticmethod
     def check_existing_cdk_toolkit_stack(AwsAccountId, region):
@@ -58,13 +59,10 @@ class CloudFormation:
             raise e
 
     @staticmethod
-    def _get_stack(**data) -> dict:
+    def _get_stack(client=None, **data) -> dict:
         try:
-            accountid = data['accountid']
-            region = data['region']
             stack_name = data['stack_name']
-            aws_session = SessionHelper.remote_session(accountid=accountid)
-            cfnclient = aws_session.client('cloudformation', region_name=region)
+            cfnclient = client or CloudFormation.client(data['accountid'], data['region'])
             response = cfnclient.describe_stacks(StackName=stack_name)
             return response['Stacks'][0]
         except ClientError as e:
@@ -72,62 +70,54 @@ class CloudFormation:
 
     @staticmethod
     def describe_stack_resources(engine, task: Task):
+        """
+        Reads the status, outputs, resources and events of the stack with a single assumed session
+        and stores them on the Stack row with the refresh timestamp, the new events are added to the event store
+        """
         try:
             filtered_resources = []
-            filtered_events = []
             filtered_outputs = {}
             data = {
                 'accountid': task.payload['accountid'],
                 'region': task.payload['region'],
                 'stack_name': task.payload['stack_name'],
             }
+            client = CloudFormation.client(data['accountid'], data['region'])
 
-            cfn_stack = CloudFormation._get_stack(**data)
+            cfn_stack = CloudFormation._get_stack(client=client, **data)
             stack_arn = cfn_stack['StackId']
             status = cfn_stack['StackStatus']
             stack_outputs = cfn_stack.get('Outputs', [])
             if stack_outputs:
                 for output in stack_outputs:
-                    print(output)
                     filtered_outputs[output['OutputKey']] = output['OutputValue']
-            resources = CloudFormation._describe_stack_resources(**data)[
+            resources = CloudFormation._describe_stack_resources(client=client, **data)[
                 'StackResources'
             ]
-            events = CloudFormation._describe_stack_events(**data)['StackEvents']
+            for resource in resources:
+                filtered_resources.append(
+                    {
+                        'ResourceStatus': resource.get('ResourceStatus'),
+                        'LogicalResourceId': resource.get('LogicalResourceId'),
+                        'PhysicalResourceId': resource.get('PhysicalResourceId'),
+                        'ResourceType': resource.get('ResourceType'),
+                        'StackName': resource.get('StackName'),
+                        'StackId': resource.get('StackId'),
+                    }
+                )
             with engine.scoped_session() as session:
                 stack: Stack = session.query(Stack).get(
                     task.payload['stackUri']
                 )
-                stack.status = status
-                stack.stackid = stack_arn
-                stack.outputs = filtered_outputs
-                for resource in resources:
-                    filtered_resources.append(
-                        {
-                            'ResourceStatus': resource.get('ResourceStatus'),
-                            'LogicalResourceId': resource.get('LogicalResourceId'),
-                            'PhysicalResourceId': resource.get('PhysicalResourceId'),
-                            'ResourceType': resource.get('ResourceType'),
-                            'StackName': resource.get('StackName'),
-                            'StackId': resource.get('StackId'),
-                        }
-                    )
-                stack.resources = {'resources': filtered_resources}
-                for event in events:
-                    filtered_events.append(
-                        {
-                            'ResourceStatus': event.get('ResourceStatus'),
-                            'LogicalResourceId': event.get('LogicalResourceId'),
-                            'PhysicalResourceId': event.get('PhysicalResourceId'),
-                            'ResourceType': event.get('ResourceType'),
-                            'StackName': event.get('StackName'),
-                            'StackId': event.get('StackId'),
-                            'EventId': event.get('EventId'),
-                            'ResourceStatusReason': event.get('ResourceStatusReason'),
-                        }
-                    )
-                stack.events = {'events': filtered_events}
-                stack.error = None
+                # only the changed columns are written
+                CloudFormation._set_if_changed(stack, 'status', status)
+                CloudFormation._set_if_changed(stack, 'stackid', stack_arn)
+                CloudFormation._set_if_changed(stack, 'outputs', filtered_outputs)
+                CloudFormation._set_if_changed(stack, 'resources', {'resources': filtered_resources})
+                CloudFormation._set_if_changed(stack, 'error', None)
+                # only the events newer than the stored ones are read
+                StackEventRepository.ingest_events(session, stack.stackUri, client, data['stack_name'])
+                stack.lastRefreshed = datetime.datetime.now()
                 session.commit()
         except ClientError as e:
             with engine.scoped_session() as session:
@@ -138,32 +128,22 @@ class CloudFormation:
                     stack.error = {
                         'error': json_utils.to_string(e.response['Error']['Message'])
                     }
+                stack.lastRefreshed = datetime.datetime.now()
                 session.commit()
 
     @staticmethod
-    def _describe_stack_resources(**data):
-        accountid = data['accountid']
+    def _set_if_changed(stack: Stack, field, value):
+        if getattr(stack, field) != value:
+            setattr(stack, field, value)
+
+    @staticmethod
+    def _describe_stack_resources(client=None, **data):
         region = data.get('region', 'eu-west-1')
         stack_name = data['stack_name']
-        aws_session = SessionHelper.remote_session(accountid=accountid)
-        client = aws_session.client('cloudformation', region_name=region)
+        client = client or CloudFormation.client(data['accountid'], region)
         try:
             stack_resources = client.describe_stack_resources(StackName=stack_name)
             log.info(f'Stack describe resources response : {stack_resources}')
             return stack_resources
         except ClientError as e:
             log.error(e, exc_info=True)
-
-    @staticmethod
-    def _describe_stack_events(**data):
-        accountid = data['accountid']
-        region = data.get('region', 'eu-west-1')
-        stack_name = data['stack_name']
-        aws_session = SessionHelper.remote_session(accountid=accountid)
-        client = aws_session.client('cloudformation', region_name=region)
-        try:
-            stack_events = client.describe_stack_events(StackName=stack_name)
-            log.info(f'Stack describe events response : {stack_events}')
-            return stack_events
-        except ClientError as e:
-            log.error(e, exc_info=True)
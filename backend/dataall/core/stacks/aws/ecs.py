@@ -8,6 +8,9 @@ from dataall.base.utils import Parameter
 
 log = logging.getLogger('aws:ecs')
 
+# Maximum number of tasks accepted by describe_tasks
+DESCRIBE_TASKS_MAX = 100
+
 
 class Ecs:
     def __init__(self):
@@ -106,3 +109,41 @@ class Ecs:
         except ClientError as e:
             log.error(e)
             raise e
+
+    @staticmethod
+    def list_running_tasks(cluster_name) -> dict:
+        """Returns {startedBy: taskArn} of all the running tasks of the cluster with one paginated list_tasks"""
+        try:
+            client = boto3.client('ecs')
+            task_arns = []
+            for page in client.get_paginator('list_tasks').paginate(cluster=cluster_name, desiredStatus='RUNNING'):
+                task_arns.extend(page.get('taskArns', []))
+            return {
+                task['startedBy']: task['taskArn']
+                for task in Ecs._describe_tasks(client, cluster_name, task_arns)
+                if task.get('startedBy')
+            }
+        except ClientError as e:
+            log.error(e)
+            raise e
+
+    @staticmethod
+    def describe_task_statuses(cluster_name, task_arns) -> dict:
+        """Returns {taskArn: lastStatus} of the tasks, the tasks that ECS doesn't know anymore are not returned"""
+        try:
+            client = boto3.client('ecs')
+            return {
+                task['taskArn']: task.get('lastStatus')
+                for task in Ecs._describe_tasks(client, cluster_name, list(task_arns))
+            }
+        except ClientError as e:
+            log.error(e)
+            raise e
+
+    @staticmethod
+    def _describe_tasks(client, cluster_name, task_arns):
+        tasks = []
+        for start in range(0, len(task_arns), DESCRIBE_TASKS_MAX):
+            response = client.describe_tasks(cluster=cluster_name, tasks=task_arns[start : start + DESCRIBE_TASKS_MAX])
+            tasks.extend(response.get('tasks', []))
+        return tasks
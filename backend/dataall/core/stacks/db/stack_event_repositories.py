@@ -0,0 +1,127 @@
+"""Stores the CloudFormation events of the stacks once per EventId."""
+import datetime
+import logging
+import os
+
+from sqlalchemy.dialects.postgresql import insert
+
+from dataall.base.db import paginate
+from dataall.core.stacks.db.stack_models import StackEvent
+
+log = logging.getLogger(__name__)
+
+# Number of events kept per stack
+MAX_STACK_EVENTS = int(os.getenv('stack_events_max', '500'))
+
+EVENT_FIELDS = [
+    'EventId',
+    'ResourceStatus',
+    'ResourceStatusReason',
+    'LogicalResourceId',
+    'PhysicalResourceId',
+    'ResourceType',
+    'StackName',
+    'StackId',
+]
+
+
+class StackEventRepository:
+    _DEFAULT_PAGE = 1
+    _DEFAULT_PAGE_SIZE = 100
+
+    @staticmethod
+    def ingest_events(session, stack_uri, client, stack_name, max_events=MAX_STACK_EVENTS) -> int:
+        """
+        Pages through describe_stack_events (newest first) until an event that is already stored is found,
+        stores the new events and returns how many were added
+        """
+        new_events = []
+        kwargs = {'StackName': stack_name}
+        while len(new_events) < max_events:
+            response = client.describe_stack_events(**kwargs)
+            page = response.get('StackEvents', [])
+            known = StackEventRepository._find_known_event_ids(session, [e['EventId'] for e in page])
+            for event in page:
+                if event['EventId'] in known:
+                    break
+                new_events.append(event)
+            else:
+                if response.get('NextToken'):
+                    kwargs['NextToken'] = response['NextToken']
+                    continue
+            break
+
+        new_events = new_events[:max_events]
+        inserted = 0
+        if new_events:
+            # a concurrent refresh of the same stack may store the same events first
+            statement = (
+                insert(StackEvent)
+                .values(
+                    [
+                        dict(
+                            stackUri=stack_uri,
+                            Timestamp=_to_naive_utc(event['Timestamp']),
+                            **{field: event.get(field) for field in EVENT_FIELDS},
+                        )
+                        for event in new_events
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=['EventId'])
+            )
+            inserted = session.execute(statement).rowcount
+        StackEventRepository.delete_old_events(session, stack_uri, keep=max_events)
+        log.info(f'Stored {inserted} new events of stack {stack_uri}')
+        return inserted
+
+    @staticmethod
+    def delete_old_events(session, stack_uri, keep) -> int:
+        recent = (
+            session.query(StackEvent.EventId)
+            .filter(StackEvent.stackUri == stack_uri)
+            .order_by(StackEvent.Timestamp.desc(), StackEvent.EventId.desc())
+            .limit(keep)
+        )
+        return (
+            session.query(StackEvent)
+            .filter(StackEvent.stackUri == stack_uri, StackEvent.EventId.notin_(recent.subquery()))
+            .delete(synchronize_session=False)
+        )
+
+    @staticmethod
+    def query_stack_events(session, stack_uri):
+        return (
+            session.query(StackEvent)
+            .filter(StackEvent.stackUri == stack_uri)
+            .order_by(StackEvent.Timestamp.desc(), StackEvent.EventId.desc())
+        )
+
+    @staticmethod
+    def paginated_stack_events(session, stack_uri, data=None) -> dict:
+        data = data or {}
+        return paginate(
+            query=StackEventRepository.query_stack_events(session, stack_uri),
+            page=data.get('page', StackEventRepository._DEFAULT_PAGE),
+            page_size=data.get('pageSize', StackEventRepository._DEFAULT_PAGE_SIZE),
+        ).to_dict()
+
+    @staticmethod
+    def to_dict(event: StackEvent) -> dict:
+        data = {field: getattr(event, field) for field in EVENT_FIELDS}
+        data['Timestamp'] = event.Timestamp.isoformat() if event.Timestamp else None
+        return data
+
+    @staticmethod
+    def _find_known_event_ids(session, event_ids) -> set:
+        if not event_ids:
+            return set()
+        return {
+            row[0]
+            for row in session.query(StackEvent.EventId).filter(StackEvent.EventId.in_(event_ids)).all()
+        }
+
+
+def _to_naive_utc(timestamp):
+    if isinstance(timestamp, datetime.datetime) and timestamp.tzinfo:
+        return timestamp.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return timestamp
@@ -31,6 +31,25 @@ class Stack(Base):
         DateTime, default=lambda: datetime.datetime(year=1900, month=1, day=1)
     )
     EcsTaskArn = Column(String, nullable=True)
+    # when the CloudFormation status, outputs, resources and events were last read, and the last refresh request
+    lastRefreshed = Column(DateTime, nullable=True)
+    refreshRequested = Column(DateTime, nullable=True)
+    # fingerprint of the synthesized stack of the last successful deployment
+    templateHash = Column(String, nullable=True)
+
+
+class StackEvent(Base):
+    __tablename__ = 'stack_event'
+    EventId = Column(String, primary_key=True)
+    stackUri = Column(String, nullable=False, index=True)
+    Timestamp = Column(DateTime, nullable=False)
+    ResourceStatus = Column(String, nullable=True)
+    ResourceStatusReason = Column(String, nullable=True)
+    LogicalResourceId = Column(String, nullable=True)
+    PhysicalResourceId = Column(String, nullable=True)
+    ResourceType = Column(String, nullable=True)
+    StackName = Column(String, nullable=True)
+    StackId = Column(String, nullable=True)
 
 
 class KeyValueTag(Base):
@@ -1,5 +1,7 @@
 import logging
 
+from sqlalchemy import and_, or_
+
 from dataall.base.context import get_context
 from dataall.core.environment.db.environment_models import Environment
 from dataall.core.permissions.db.resource_policy_repositories import ResourcePolicy
@@ -31,6 +33,42 @@ class Stack:
         )
         return stack
 
+    @staticmethod
+    def find_stacks_by_target_uris(session, target_uris) -> [models.Stack]:
+        return (
+            session.query(models.Stack)
+            .filter(models.Stack.targetUri.in_(target_uris))
+            .all()
+        )
+
+    @staticmethod
+    def claim_status_refresh(session, stack_uris, now, stale_before, requested_before) -> [str]:
+        """
+        Marks the refresh of the stale stacks as requested with a single UPDATE ... RETURNING and returns their URIs.
+        A stack whose refresh was requested after requested_before and has not completed yet is skipped,
+        so concurrent page views queue a single refresh
+        """
+        if not stack_uris:
+            return []
+        table = models.Stack.__table__
+        rows = session.execute(
+            table.update()
+            .where(
+                and_(
+                    table.c.stackUri.in_(list(stack_uris)),
+                    or_(table.c.lastRefreshed.is_(None), table.c.lastRefreshed < stale_before),
+                    or_(
+                        table.c.refreshRequested.is_(None),
+                        table.c.refreshRequested < requested_before,
+                        table.c.refreshRequested <= table.c.lastRefreshed,
+                    ),
+                )
+            )
+            .values(refreshRequested=now)
+            .returning(table.c.stackUri)
+        ).fetchall()
+        return [row[0] for row in rows]
+
     @staticmethod
     def get_stack_by_uri(session, stack_uri):
         stack = Stack.find_stack_by_uri(session, stack_uri)
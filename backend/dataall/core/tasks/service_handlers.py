@@ -1,8 +1,11 @@
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
+from sqlalchemy import and_
+
 from dataall.core.tasks.db.task_models import Task
 from dataall.base.utils.json_utils import to_json
 
@@ -22,6 +25,7 @@ class WorkerHandler:
     def __init__(self):
         self.handlers = {}
         self.enabled = True
+        self.max_workers = int(os.getenv('worker_max_threads', '1'))
 
     def queue(self, engine, task_ids: [str]):
         log.info(f'Queuing Task Ids: {task_ids}')
@@ -34,52 +38,74 @@ class WorkerHandler:
         return decorator
 
     def process(self, engine, task_ids: [str], save_response=True):
-        tasks_responses = []
-        if self.enabled:
-            for taskid in task_ids:
-                try:
-                    log.info(f'Processing Task: {taskid}')
-                    handler, task = self.get_task_handler(engine, taskid)
-
-                    error, response, status = self.handle_task(engine, task, handler)
-                    if save_response:
-                        WorkerHandler.update_task(
-                            engine, taskid, error, to_json(response), status
-                        )
-
-                    else:
-                        WorkerHandler.update_task(engine, taskid, error, {}, status)
-                    tasks_responses.append(
-                        {
-                            'taskUri': taskid,
-                            'response': response,
-                            'error': error,
-                            'status': status,
-                        }
-                    )
-                    return tasks_responses
-                except Exception as e:
-                    log.exception('Error in process')
-                    log.error(f'Task processing failed {e} : {taskid}')
-        else:
+        """
+        Processes all the tasks of a batch. The pending tasks are claimed at once, the others are skipped.
+        Handlers run in a thread pool when more than one worker thread is configured (I/O-bound handlers)
+        """
+        if not self.enabled:
             log.info(f'Worker disabled, tasks {task_ids} wont be processed')
+            return []
+
+        tasks = self.claim_tasks(engine, task_ids)
+        if not tasks:
+            return []
+
+        max_workers = min(self.max_workers, len(tasks))
+        if max_workers <= 1:
+            return [self.process_task(engine, task, save_response) for task in tasks]
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='worker') as executor:
+            return list(executor.map(lambda task: self.process_task(engine, task, save_response), tasks))
+
+    def process_task(self, engine, task: Task, save_response=True):
+        log.info(f'Processing Task: {task.taskUri}')
+        start = time.perf_counter()
+        handler = self.handlers.get(task.action)
+        if handler:
+            log.info(f' found handler {handler} for task action {task.action}|{task.taskUri}')
+            error, response, status = self.handle_task(engine, task, handler)
+        else:
+            log.error(f'No handler defined for {task.action}')
+            error, response, status = {'message': f'No handler defined for {task.action}'}, {}, 'failed'
 
-    def get_task_handler(self, engine, taskid):
-        with engine.scoped_session() as session:
-            task = session.query(Task).get(taskid)
-            handler = self.handlers.get(task.action)
-            log.info(
-                f' found handler {handler} for task action {task.action}|{task.taskUri}'
+        duration = round(time.perf_counter() - start, 3)
+        log.info(f'Task {task.taskUri} ({task.action}) {status} in {duration}s')
+        try:
+            WorkerHandler.update_task(
+                engine, task.taskUri, error, to_json(response) if save_response else {}, status
             )
-            if task.status != 'pending':
-                raise Exception(
-                    f'Could not start task {task.taskUri} as its status is {task.status}'
-                )
-            if not handler:
-                raise Exception(f'No handler defined for {task.action}')
-            task.status = 'started'
+        except Exception as e:
+            log.exception(f'Task processing failed {e} : {task.taskUri}')
+
+        return {
+            'taskUri': task.taskUri,
+            'response': response,
+            'error': error,
+            'status': status,
+            'duration': duration,
+        }
+
+    @staticmethod
+    def claim_tasks(engine, task_ids: [str]) -> [Task]:
+        """Marks the pending tasks as started with a single UPDATE ... RETURNING and returns them in the given order"""
+        if not task_ids:
+            return []
+
+        table = Task.__table__
+        with engine.scoped_session() as session:
+            rows = session.execute(
+                table.update()
+                .where(and_(table.c.taskUri.in_(task_ids), table.c.status == 'pending'))
+                .values(status='started')
+                .returning(*table.c)
+            ).fetchall()
             session.commit()
-        return handler, task
+
+        claimed = {row['taskUri']: Task(**dict(row)) for row in rows}
+        for taskid in task_ids:
+            if taskid not in claimed:
+                log.error(f'Could not start task {taskid} as it does not exist or is not pending')
+        return [claimed[taskid] for taskid in dict.fromkeys(task_ids) if taskid in claimed]
 
     @staticmethod
     def handle_task(engine, task: Task, handler):
@@ -99,12 +125,11 @@ class WorkerHandler:
     @staticmethod
     def update_task(engine, taskid, error, response, status):
         with engine.scoped_session() as session:
-            task = session.query(Task).get(taskid)
-            task.status = status
-            task.error = error
-            task.response = response
+            session.query(Task).filter(Task.taskUri == taskid).update(
+                {Task.status: status, Task.error: error, Task.response: response},
+                synchronize_session=False,
+            )
             session.commit()
-            return task
 
     @classmethod
     def retry(cls, exception, tries=4, delay=3, backoff=2, logger=None):
@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from sqlalchemy import Column, String, DateTime
+
+from dataall.base.db import Base
+
+
+class CatalogIndexerState(Base):
+    """Progress of the catalog indexer task: objects changed after the high-water mark are not indexed yet"""
+    __tablename__ = 'catalog_indexer_state'
+    indexerName = Column(String, primary_key=True)
+    highWaterMark = Column(DateTime, nullable=True)
+    updated = Column(DateTime, default=datetime.now, onupdate=datetime.now)
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Optional
+
+from dataall.modules.catalog.db.catalog_indexer_models import CatalogIndexerState
+
+
+class CatalogIndexerStateRepository:
+
+    @staticmethod
+    def get_high_water_mark(session, indexer_name: str) -> Optional[datetime]:
+        state = session.query(CatalogIndexerState).get(indexer_name)
+        return state.highWaterMark if state else None
+
+    @staticmethod
+    def save_high_water_mark(session, indexer_name: str, high_water_mark: datetime) -> None:
+        state = session.query(CatalogIndexerState).get(indexer_name)
+        if state is None:
+            state = CatalogIndexerState(indexerName=indexer_name)
+            session.add(state)
+        state.highWaterMark = high_water_mark
@@ -364,6 +364,25 @@ class GlossaryRepository:
         GlossaryRepository._reindex(session, linkUri=linkUri)
         return updated
 
+    @staticmethod
+    def find_targets_with_glossary_changes(session, since) -> set:
+        """Returns URIs of the objects whose term links or linked terms changed after `since`"""
+        targets = (
+            session.query(TermLink.targetUri)
+            .join(GlossaryNode, GlossaryNode.nodeUri == TermLink.nodeUri)
+            .filter(
+                or_(
+                    TermLink.created > since,
+                    TermLink.updated > since,
+                    TermLink.deleted > since,
+                    GlossaryNode.updated > since,
+                    GlossaryNode.deleted > since,
+                )
+            )
+            .distinct()
+        )
+        return {target_uri for target_uri, in targets}
+
     @staticmethod
     def _verify_term_association_approver_role(session, username, groups, link):
         glossary_node = session.query(GlossaryNode).get(link.nodeUri)
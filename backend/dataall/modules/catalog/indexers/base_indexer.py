@@ -1,16 +1,23 @@
 import logging
 import os
+import threading
+from collections import defaultdict
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Dict, List
 from operator import and_
 
 from sqlalchemy.orm import with_expression
 
 from dataall.modules.catalog.db.glossary_models import GlossaryNode, TermLink
+from dataall.modules.catalog.indexers.bulk_indexer import BulkIndexer
 from dataall.base.searchproxy import connect
 
 log = logging.getLogger(__name__)
 
+_bulk_state = threading.local()
+
 
 class BaseIndexer(ABC):
     """API to work with OpenSearch"""
@@ -33,16 +40,58 @@ class BaseIndexer(ABC):
     def upsert(session, target_id):
         raise NotImplementedError("Method upsert is not implemented")
 
+    @classmethod
+    @contextmanager
+    def bulk(cls, **limits):
+        """
+        Switches the indexers of the current thread to the bulk mode.
+        The documents are buffered and sent with the _bulk API, the remaining ones are sent at the exit.
+        Nested calls reuse the outer buffer
+        """
+        current = cls.current_bulk()
+        if current is not None:
+            yield current
+            return
+
+        bulk = BulkIndexer(cls.es, cls._INDEX, **limits)
+        _bulk_state.indexer = bulk
+        try:
+            yield bulk
+            bulk.flush()
+        finally:
+            _bulk_state.indexer = None
+            log.info(f'Bulk indexing finished: {bulk.stats()}')
+
+    @staticmethod
+    def current_bulk():
+        return getattr(_bulk_state, 'indexer', None)
+
+    @classmethod
+    def indexed_in_bulk(cls, doc_id) -> bool:
+        """Checks if the document has already been indexed by the current bulk run"""
+        bulk = cls.current_bulk()
+        return bulk is not None and bulk.contains(doc_id)
+
     @classmethod
     def delete_doc(cls, doc_id):
+        bulk = cls.current_bulk()
+        if bulk is not None:
+            bulk.delete(doc_id)
+            return True
+
         es = cls.es()
         es.delete(index=cls._INDEX, id=doc_id, ignore=[400, 404])
         return True
 
     @classmethod
     def _index(cls, doc_id, doc):
-        es = cls.es()
         doc['_indexed'] = datetime.now()
+        bulk = cls.current_bulk()
+        if bulk is not None:
+            bulk.index(doc_id, doc)
+            return True
+
+        es = cls.es()
         if es:
             res = es.index(index=cls._INDEX, id=doc_id, body=doc)
             log.info(f'doc {doc} for id {doc_id} indexed with response {res}')
@@ -71,3 +120,26 @@ class BaseIndexer(ABC):
             )
         )
         return [t.path for t in q]
+
+    @staticmethod
+    def _get_targets_glossary_terms(session, target_uris) -> Dict[str, List[str]]:
+        """Returns the paths of the approved glossary terms linked to each of the targets"""
+        terms = defaultdict(list)
+        if not target_uris:
+            return terms
+
+        q = (
+            session.query(TermLink.targetUri, GlossaryNode.path)
+            .join(
+                GlossaryNode, GlossaryNode.nodeUri == TermLink.nodeUri
+            )
+            .filter(
+                and_(
+                    TermLink.targetUri.in_(target_uris),
+                    TermLink.approvedBySteward.is_(True),
+                )
+            )
+        )
+        for target_uri, path in q:
+            terms[target_uri].append(path)
+        return terms
@@ -0,0 +1,131 @@
+"""
+Buffers catalog documents and sends them to OpenSearch with the _bulk API.
+Used by the catalog indexer task that reindexes every object: one request per batch of documents
+instead of one request per document. The batches are bounded by the number of documents and by their size.
+"""
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_DOCS = int(os.getenv('catalog_bulk_max_docs', '500'))
+DEFAULT_MAX_BYTES = int(os.getenv('catalog_bulk_max_bytes', str(5 * 1024 * 1024)))
+_MAX_LOGGED_ERRORS = 10
+
+
+class BulkIndexer:
+    """
+    Collects index/delete actions and flushes them when a batch is full.
+    The connection is a callable returning the OpenSearch client, it's called only when a batch is sent.
+    A document that is indexed several times before a flush is sent only once (the last version wins).
+    """
+
+    def __init__(
+        self,
+        connection: Callable[[], Any],
+        index: str,
+        max_docs: int = DEFAULT_MAX_DOCS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        if max_docs < 1 or max_bytes < 1:
+            raise ValueError(f'Invalid bulk limits max_docs={max_docs}, max_bytes={max_bytes}')
+
+        self._connection = connection
+        self._index = index
+        self.max_docs = max_docs
+        self.max_bytes = max_bytes
+        self._pending: Dict[str, Tuple[str, Optional[dict], int]] = {}
+        self._pending_bytes = 0
+        self._seen = set()
+
+        self.batches = 0
+        self.sent = 0
+        self.failed = 0
+        self.deduplicated = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.errors: List[Dict[str, Any]] = []
+
+    def index(self, doc_id: str, doc: dict) -> None:
+        self._add(doc_id, 'index', doc, len(json.dumps(doc, default=str)))
+
+    def delete(self, doc_id: str) -> None:
+        self._add(doc_id, 'delete', None, 0)
+
+    def contains(self, doc_id: str) -> bool:
+        """Checks if a document was already indexed (or is waiting to be indexed) during this run"""
+        return doc_id in self._seen
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+
+        body = []
+        for doc_id, (action, doc, _) in self._pending.items():
+            body.append({action: {'_index': self._index, '_id': doc_id}})
+            if doc is not None:
+                body.append(doc)
+
+        count = len(self._pending)
+        self._pending = {}
+        self._pending_bytes = 0
+
+        start = time.perf_counter()
+        response = self._connection().bulk(body=body)
+        latency = time.perf_counter() - start
+
+        failed = self._collect_errors(response)
+        self.batches += 1
+        self.sent += count
+        self.failed += failed
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        log.info(f'Bulk batch #{self.batches}: {count} documents sent in {latency:.3f}s, {failed} failed')
+
+    def stats(self) -> dict:
+        return {
+            'batches': self.batches,
+            'sent': self.sent,
+            'failed': self.failed,
+            'deduplicated': self.deduplicated,
+            'total_latency_seconds': round(self.total_latency, 3),
+            'avg_latency_seconds': round(self.total_latency / self.batches, 3) if self.batches else 0.0,
+            'max_latency_seconds': round(self.max_latency, 3),
+        }
+
+    def _add(self, doc_id: str, action: str, doc: Optional[dict], size: int) -> None:
+        previous = self._pending.pop(doc_id, None)
+        if previous:
+            self.deduplicated += 1
+            self._pending_bytes -= previous[2]
+
+        if self._pending and self._pending_bytes + size > self.max_bytes:
+            self.flush()
+
+        self._pending[doc_id] = (action, doc, size)
+        self._pending_bytes += size
+        self._seen.add(doc_id)
+
+        if len(self._pending) >= self.max_docs or self._pending_bytes >= self.max_bytes:
+            self.flush()
+
+    def _collect_errors(self, response) -> int:
+        if not response or not response.get('errors'):
+            return 0
+
+        failed = 0
+        for item in response.get('items', []):
+            for action, result in item.items():
+                if result.get('error') is None:
+                    continue
+                if action == 'delete' and result.get('status') == 404:
+                    continue
+
+                failed += 1
+                if len(self.errors) < _MAX_LOGGED_ERRORS:
+                    self.errors.append({'id': result.get('_id'), 'action': action, 'error': result.get('error')})
+                    log.error(f'Failed to {action} document {result.get("_id")}: {result.get("error")}')
+        return failed
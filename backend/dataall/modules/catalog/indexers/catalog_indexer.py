@@ -1,4 +1,5 @@
 from abc import ABC
+from datetime import datetime
 from typing import List
 
 
@@ -14,3 +15,10 @@ class CatalogIndexer(ABC):
 
     def index(self, session) -> int:
         raise NotImplementedError("index is not implemented")
+
+    def index_changes(self, session, since: datetime) -> int:
+        """
+        Indexes the objects changed after `since` and removes the documents of the deleted ones.
+        Indexers that don't track changes reindex everything
+        """
+        return self.index(session)
@@ -1,7 +1,11 @@
+import argparse
 import logging
 import os
 import sys
+from datetime import datetime, timedelta
 
+from dataall.modules.catalog.db.catalog_indexer_repositories import CatalogIndexerStateRepository
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
 from dataall.base.db import get_engine
 from dataall.base.loader import load_modules, ImportMode
@@ -13,15 +17,44 @@ if not root.hasHandlers():
     root.addHandler(logging.StreamHandler(sys.stdout))
 log = logging.getLogger(__name__)
 
+INDEXER_NAME = 'catalog'
+# Rows committed by transactions that started before the previous run may carry older timestamps
+HIGH_WATER_MARK_OVERLAP = timedelta(minutes=5)
 
-def index_objects(engine):
+
+def index_objects(engine, full=False):
+    """
+    Indexes the objects changed since the previous successful run.
+    Everything is reindexed if full is set or if there is no previous run
+    """
     try:
         indexed_objects_counter = 0
+        run_started = datetime.now()
         with engine.scoped_session() as session:
-            for indexer in CatalogIndexer.all():
-                indexed_objects_counter += indexer.index(session)
+            high_water_mark = None
+            if not full:
+                high_water_mark = CatalogIndexerStateRepository.get_high_water_mark(session, INDEXER_NAME)
+
+            with BaseIndexer.bulk() as bulk:
+                if high_water_mark is None:
+                    log.info('Reindexing all the objects')
+                    for indexer in CatalogIndexer.all():
+                        indexed_objects_counter += indexer.index(session)
+                else:
+                    since = high_water_mark - HIGH_WATER_MARK_OVERLAP
+                    log.info(f'Indexing the objects changed since {since}')
+                    for indexer in CatalogIndexer.all():
+                        indexed_objects_counter += indexer.index_changes(session, since)
 
-            log.info(f'Successfully indexed {indexed_objects_counter} objects')
+            if bulk.failed:
+                log.error(f'Failed to index {bulk.failed} documents: {bulk.errors}')
+                AlarmService().trigger_catalog_indexing_failure_alarm(
+                    error=f'{bulk.failed} documents failed to be indexed, first errors: {bulk.errors}'
+                )
+            else:
+                CatalogIndexerStateRepository.save_high_water_mark(session, INDEXER_NAME, run_started)
+
+            log.info(f'Successfully indexed {indexed_objects_counter} objects, bulk stats: {bulk.stats()}')
             return indexed_objects_counter
     except Exception as e:
         AlarmService().trigger_catalog_indexing_failure_alarm(error=str(e))
@@ -29,8 +62,12 @@ def index_objects(engine):
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Indexes the catalog objects in OpenSearch')
+    parser.add_argument('--full', action='store_true', help='reindex all the objects instead of the changed ones')
+    ARGS = parser.parse_args()
+
     ENVNAME = os.environ.get('envname', 'local')
     ENGINE = get_engine(envname=ENVNAME)
 
     load_modules({ImportMode.CATALOG_INDEXER_TASK})
-    index_objects(engine=ENGINE)
+    index_objects(engine=ENGINE, full=ARGS.full)
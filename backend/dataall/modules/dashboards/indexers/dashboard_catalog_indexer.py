@@ -1,5 +1,9 @@
 import logging
+from datetime import datetime
 
+from sqlalchemy import or_
+
+from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
 from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
 from dataall.modules.dashboards import Dashboard
 from dataall.modules.dashboards.indexers.dashboard_indexer import DashboardIndexer
@@ -17,3 +21,16 @@ class DashboardCatalogIndexer(CatalogIndexer):
             DashboardIndexer.upsert(session=session, dashboard_uri=dashboard.dashboardUri)
 
         return len(all_dashboards)
+
+    def index_changes(self, session, since: datetime) -> int:
+        glossary_targets = GlossaryRepository.find_targets_with_glossary_changes(session, since)
+        conditions = [Dashboard.created > since, Dashboard.updated > since]
+        if glossary_targets:
+            conditions.append(Dashboard.dashboardUri.in_(list(glossary_targets)))
+
+        changed_dashboards: [Dashboard] = session.query(Dashboard).filter(or_(*conditions)).all()
+        log.info(f'Found {len(changed_dashboards)} dashboards changed since {since}')
+        for dashboard in changed_dashboards:
+            DashboardIndexer.upsert(session=session, dashboard_uri=dashboard.dashboardUri)
+
+        return len(changed_dashboards)
@@ -69,6 +69,10 @@ ShareableObjectFilter = gql.InputType(
         gql.Argument(name='isRevokable', type=gql.Boolean),
         gql.Argument('page', gql.Integer),
         gql.Argument('pageSize', gql.Integer),
+        gql.Argument('after', gql.String),
+        gql.Argument('before', gql.String),
+        gql.Argument('cursorPagination', gql.Boolean),
+        gql.Argument('withCount', gql.Boolean),
     ],
 )
 
@@ -74,6 +74,8 @@ SharedItemSearchResult = gql.ObjectType(
         gql.Field(name='hasNext', type=gql.Boolean),
         gql.Field(name='hasPrevious', type=gql.Boolean),
         gql.Field(name='nodes', type=gql.ArrayType(gql.Ref('ShareItem'))),
+        gql.Field(name='startCursor', type=gql.String),
+        gql.Field(name='endCursor', type=gql.String),
     ],
 )
 
@@ -9,8 +9,7 @@ class KmsClient:
     _DEFAULT_POLICY_NAME = "default"
 
     def __init__(self, account_id: str, region: str):
-        session = SessionHelper.remote_session(accountid=account_id)
-        self._client = session.client('kms', region_name=region)
+        self._client = SessionHelper.remote_client(account_id, 'kms', region_name=region)
         self._account_id = account_id
 
     def put_key_policy(self, key_id: str, policy: str):
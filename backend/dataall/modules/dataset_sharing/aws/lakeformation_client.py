@@ -3,6 +3,7 @@ import uuid
 
 from botocore.exceptions import ClientError
 
+from dataall.base.aws.lakeformation_batch import LakeFormationBatchClient
 from dataall.base.aws.sts import SessionHelper
 
 log = logging.getLogger('aws:lakeformation')
@@ -15,9 +16,7 @@ class LakeFormationClient:
     @staticmethod
     def grant_pivot_role_all_database_permissions(accountid, region, database):
         LakeFormationClient.grant_permissions_to_database(
-            client=SessionHelper.remote_session(accountid=accountid).client(
-                'lakeformation', region_name=region
-            ),
+            client=SessionHelper.remote_client(accountid, 'lakeformation', region_name=region),
             principals=[SessionHelper.get_delegation_role_arn(accountid)],
             database_name=database,
             permissions=['ALL'],
@@ -100,10 +99,26 @@ class LakeFormationClient:
         :param table:
         :return:
         """
+        LakeFormationClient.revoke_iamallowedgroups_super_permission_from_tables(
+            client, accountid, database, [table]
+        )
+
+    @staticmethod
+    def revoke_iamallowedgroups_super_permission_from_tables(
+        client, accountid, database, tables
+    ):
+        """
+        Revokes the IAMAllowedGroups Super permission of several tables of a database with batched requests
+        :param client:
+        :param accountid:
+        :param database:
+        :param tables:
+        :return:
+        """
         try:
             log.info(
                 f'Revoking IAMAllowedGroups Super '
-                f'permission for table {database}|{table}'
+                f'permission for tables {database}|{tables}'
             )
             LakeFormationClient.batch_revoke_permissions(
                 client,
@@ -122,14 +137,31 @@ class LakeFormationClient:
                         'Permissions': ['ALL'],
                         'PermissionsWithGrantOption': [],
                     }
+                    for table in tables
                 ],
             )
         except ClientError as e:
             log.debug(
                 f'Could not revoke IAMAllowedGroups Super '
-                f'permission on table {database}|{table} due to {e}'
+                f'permission on tables {database}|{tables} due to {e}'
             )
 
+    @staticmethod
+    def batch_grant_permissions(client, accountid, entries):
+        """
+        Batch grant permissions to entries
+        Entries failing with throttling or concurrent modification errors are retried with backoff
+        :param client:
+        :param accountid:
+        :param entries:
+        :return: the failures of the entries that could not be granted
+        """
+        log.info(f'Batch Granting {len(entries)} entries')
+        failures = LakeFormationBatchClient(client, accountid).grant(entries)
+        if failures:
+            log.warning(f'Batch Grant ended with failures: {failures}')
+        return failures
+
     @staticmethod
     def batch_revoke_permissions(client, accountid, entries):
         """
@@ -7,7 +7,7 @@ from sqlalchemy.orm import Query
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
 from dataall.core.environment.services.environment_resource_manager import EnvironmentResource
 from dataall.core.organizations.db.organization_models import Organization
-from dataall.base.db import exceptions, paginate
+from dataall.base.db import exceptions, paginate, paginate_keyset, is_cursor_request
 from dataall.modules.dataset_sharing.db.enums import ShareObjectActions, ShareObjectStatus, ShareItemActions, \
     ShareItemStatus, ShareableType, PrincipalType
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObjectItem, ShareObject
@@ -569,6 +569,15 @@ class ShareObjectRepository:
                 is_shared = data.get('isShared')
                 query = query.filter(shareable_objects.c.isShared == is_shared)
 
+        if is_cursor_request(data):
+            return paginate_keyset(
+                query=query,
+                sort_keys=[shareable_objects.c.itemUri],
+                page_size=data.get('pageSize', 10),
+                after=data.get('after'),
+                before=data.get('before'),
+                with_total=data.get('withCount', False),
+            ).to_dict()
         return paginate(query, data.get('page', 1), data.get('pageSize', 10)).to_dict()
 
     @staticmethod
@@ -937,8 +946,19 @@ class ShareObjectRepository:
     def paginated_user_datasets(
             session, username, groups, data=None
     ) -> dict:
+        query = ShareObjectRepository._query_user_datasets(session, username, groups, data)
+        if is_cursor_request(data):
+            return paginate_keyset(
+                query=query,
+                sort_keys=[Dataset.datasetUri],
+                page_size=data.get('pageSize', 10),
+                after=data.get('after'),
+                before=data.get('before'),
+                with_total=data.get('withCount', False),
+                total_cache_key=('user_datasets', username, tuple(sorted(groups)), data.get('term')),
+            ).to_dict()
         return paginate(
-            query=ShareObjectRepository._query_user_datasets(session, username, groups, data),
+            query=query,
             page=data.get('page', 1),
             page_size=data.get('pageSize', 10),
         ).to_dict()
@@ -1105,6 +1125,15 @@ class ShareObjectRepository:
             .all()
         )
 
+    @staticmethod
+    def find_share_items_by_item_uris(session, item_uris) -> dict:
+        """Returns the share items of every item URI (item URI -> list of share items)"""
+        share_items = {uri: [] for uri in item_uris}
+        if item_uris:
+            for item in session.query(ShareObjectItem).filter(ShareObjectItem.itemUri.in_(list(item_uris))).all():
+                share_items[item.itemUri].append(item)
+        return share_items
+
     @staticmethod
     def get_approved_share_object(session, item):
         share_object: ShareObject = (
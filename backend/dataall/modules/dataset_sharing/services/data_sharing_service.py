@@ -7,6 +7,7 @@ from dataall.modules.dataset_sharing.services.share_processors.lf_process_same_a
 from dataall.modules.dataset_sharing.services.share_processors.s3_access_point_process_share import \
     ProcessS3AccessPointShare
 from dataall.modules.dataset_sharing.services.share_processors.s3_bucket_process_share import ProcessS3BucketShare
+from dataall.modules.dataset_sharing.services.share_execution_plan import ShareExecutionPlan
 
 from dataall.base.db import Engine
 from dataall.modules.dataset_sharing.db.enums import (ShareObjectActions, ShareItemStatus, ShareableType,
@@ -26,10 +27,10 @@ class DataSharingService:
         """
         1) Updates share object State Machine with the Action: Start
         2) Retrieves share data and items in Share_Approved state
-        3) Calls sharing folders processor to grant share
-        4) Calls sharing buckets processor to grant share
-        5) Calls sharing tables processor for same or cross account sharing to grant share
-        6) Updates share object State Machine with the Action: Finish
+        3) Plans the buckets and folders share: the changes are grouped by the AWS resource they modify
+        4) Executes the plan, the resources are updated concurrently
+           while the sharing tables processor for same or cross account sharing grants share
+        5) Updates share object State Machine with the Action: Finish
 
         Parameters
         ----------
@@ -61,33 +62,34 @@ class DataSharingService:
                 shared_buckets
             ) = ShareObjectRepository.get_share_data_items(session, share_uri, ShareItemStatus.Share_Approved.value)
 
-        log.info(f'Granting permissions to folders: {shared_folders}')
+        plan = ShareExecutionPlan()
 
-        approved_folders_succeed = ProcessS3AccessPointShare.process_approved_shares(
+        # buckets are planned first: their read of the bucket policy falls back to a default policy
+        log.info('Planning permissions to S3 buckets')
+        ProcessS3BucketShare.plan_approved_shares(
+            plan,
             session,
             dataset,
             share,
-            shared_folders,
+            shared_buckets,
             source_environment,
             target_environment,
             source_env_group,
             env_group
         )
-        log.info(f'sharing folders succeeded = {approved_folders_succeed}')
 
-        log.info('Granting permissions to S3 buckets')
-
-        approved_s3_buckets_succeed = ProcessS3BucketShare.process_approved_shares(
+        log.info(f'Planning permissions to folders: {shared_folders}')
+        ProcessS3AccessPointShare.plan_approved_shares(
+            plan,
             session,
             dataset,
             share,
-            shared_buckets,
+            shared_folders,
             source_environment,
             target_environment,
             source_env_group,
             env_group
         )
-        log.info(f'sharing s3 buckets succeeded = {approved_s3_buckets_succeed}')
 
         if source_environment.AwsAccountId != target_environment.AwsAccountId:
             processor = ProcessLFCrossAccountShare(
@@ -112,26 +114,27 @@ class DataSharingService:
                 env_group
             )
 
-        log.info(f'Granting permissions to tables: {shared_tables}')
-        approved_tables_succeed = processor.process_approved_shares()
+        log.info(f'Granting permissions to tables: {shared_tables} while S3 resources are updated')
+        approved_s3_succeed, approved_tables_succeed = plan.execute(inline=processor.process_approved_shares)
+        log.info(f'sharing folders and s3 buckets succeeded = {approved_s3_succeed}')
         log.info(f'sharing tables succeeded = {approved_tables_succeed}')
 
         new_share_state = share_sm.run_transition(ShareObjectActions.Finish.value)
         share_sm.update_state(session, share, new_share_state)
 
-        return approved_folders_succeed and approved_s3_buckets_succeed and approved_tables_succeed
+        return approved_s3_succeed and approved_tables_succeed
 
     @classmethod
     def revoke_share(cls, engine: Engine, share_uri: str):
         """
         1) Updates share object State Machine with the Action: Start
         2) Retrieves share data and items in Revoke_Approved state
-        3) Calls sharing folders processor to revoke share
+        3) Plans and executes the folders revoke (one update of the access point policy),
+           while the sharing tables processor for same or cross account sharing revokes share
         4) Checks if remaining folders are shared and effectuates clean up with folders processor
-        5) Calls sharing tables processor for same or cross account sharing to revoke share
+        5) Calls sharing buckets processor to revoke share
         6) Checks if remaining tables are shared and effectuates clean up with tables processor
-        7) Calls sharing buckets processor to revoke share
-        8) Updates share object State Machine with the Action: Finish
+        7) Updates share object State Machine with the Action: Finish
 
         Parameters
         ----------
@@ -169,9 +172,32 @@ class DataSharingService:
             new_state = revoked_item_sm.run_transition(ShareObjectActions.Start.value)
             revoked_item_sm.update_state(session, share_uri, new_state)
 
-            log.info(f'Revoking permissions to folders: {revoked_folders}')
+            if source_environment.AwsAccountId != target_environment.AwsAccountId:
+                processor = ProcessLFCrossAccountShare(
+                    session,
+                    dataset,
+                    share,
+                    [],
+                    revoked_tables,
+                    source_environment,
+                    target_environment,
+                    env_group,
+                )
+            else:
+                processor = ProcessLFSameAccountShare(
+                    session,
+                    dataset,
+                    share,
+                    [],
+                    revoked_tables,
+                    source_environment,
+                    target_environment,
+                    env_group)
 
-            revoked_folders_succeed = ProcessS3AccessPointShare.process_revoked_shares(
+            log.info(f'Revoking permissions to folders: {revoked_folders}')
+            plan = ShareExecutionPlan()
+            ProcessS3AccessPointShare.plan_revoked_shares(
+                plan,
                 session,
                 dataset,
                 share,
@@ -181,7 +207,12 @@ class DataSharingService:
                 source_env_group,
                 env_group,
             )
+
+            log.info(f'Revoking permissions to tables: {revoked_tables} while folders are revoked')
+            revoked_folders_succeed, revoked_tables_succeed = plan.execute(inline=processor.process_revoked_shares)
             log.info(f'revoking folders succeeded = {revoked_folders_succeed}')
+            log.info(f'revoking tables succeeded = {revoked_tables_succeed}')
+
             existing_shared_folders = ShareObjectRepository.check_existing_shared_items_of_type(
                 session,
                 share_uri,
@@ -224,32 +255,6 @@ class DataSharingService:
             )
             log.info(f'revoking s3 buckets succeeded = {revoked_s3_buckets_succeed}')
 
-            if source_environment.AwsAccountId != target_environment.AwsAccountId:
-                processor = ProcessLFCrossAccountShare(
-                    session,
-                    dataset,
-                    share,
-                    [],
-                    revoked_tables,
-                    source_environment,
-                    target_environment,
-                    env_group,
-                )
-            else:
-                processor = ProcessLFSameAccountShare(
-                    session,
-                    dataset,
-                    share,
-                    [],
-                    revoked_tables,
-                    source_environment,
-                    target_environment,
-                    env_group)
-
-            log.info(f'Revoking permissions to tables: {revoked_tables}')
-            revoked_tables_succeed = processor.process_revoked_shares()
-            log.info(f'revoking tables succeeded = {revoked_tables_succeed}')
-
             existing_shared_items = ShareObjectRepository.check_existing_shared_items_of_type(
                 session,
                 share_uri,
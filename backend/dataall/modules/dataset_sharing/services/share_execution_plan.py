@@ -0,0 +1,181 @@
+"""Groups the AWS changes of a share request by the resource they mutate and runs the groups concurrently."""
+import copy
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dataall.modules.dataset_sharing.db.enums import ShareItemActions
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = int(os.getenv('share_plan_max_workers', '4'))
+
+
+class _ResourceGroup:
+    """The operations applied to one AWS resource, executed sequentially"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.calls: List[tuple] = []
+        self.read: Optional[Callable[[], Any]] = None
+        self.write: Optional[Callable[[Any], None]] = None
+        self.transforms: List[tuple] = []
+
+    def execute(self) -> Dict[str, Exception]:
+        errors: Dict[str, Exception] = {}
+        for fn, item_keys in self.calls:
+            try:
+                fn()
+            except Exception as e:
+                log.exception(f'Failed to update {self.key}')
+                for item_key in item_keys:
+                    errors.setdefault(item_key, e)
+
+        transforms = [(fn, keys) for fn, keys in self.transforms if not any(key in errors for key in keys)]
+        if not transforms:
+            return errors
+
+        try:
+            document = self.read()
+        except Exception as e:
+            log.exception(f'Failed to read {self.key}')
+            return self._fail(errors, transforms, e)
+
+        applied = []
+        changed = False
+        for fn, item_keys in transforms:
+            snapshot = copy.deepcopy(document)
+            try:
+                changed = bool(fn(document)) or changed
+                applied.append((fn, item_keys))
+            except Exception as e:
+                log.exception(f'Failed to prepare the update of {self.key}')
+                document = snapshot
+                for item_key in item_keys:
+                    errors.setdefault(item_key, e)
+
+        if changed:
+            try:
+                log.info(f'Writing {self.key} with the changes of {sum(len(keys) for _, keys in applied)} items')
+                self.write(document)
+            except Exception as e:
+                log.exception(f'Failed to write {self.key}')
+                return self._fail(errors, applied, e)
+        return errors
+
+    @staticmethod
+    def _fail(errors, transforms, error):
+        for _, item_keys in transforms:
+            for item_key in item_keys:
+                errors.setdefault(item_key, error)
+        return errors
+
+
+class ShareExecutionPlan:
+    """
+    Collects the share items and the operations on the AWS resources they need.
+    Every operation is registered for a resource key (e.g. bucket_policy:<account>/<bucket>) and the item keys it
+    serves: an item succeeds only if all of its operations succeed.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max(max_workers, 1)
+        self._groups: Dict[str, _ResourceGroup] = {}
+        self._items: Dict[str, tuple] = {}
+
+    def add_item(
+        self,
+        item_key: str,
+        on_success: Callable[[], None],
+        on_failure: Callable[[Exception], None],
+    ) -> None:
+        self._items[item_key] = (on_success, on_failure)
+
+    def add_share_item(self, session, item_key: str, share_item, item_sm, handle_failure: Callable) -> None:
+        """Adds an item whose ShareItemSM runs the Success or Failure transition once the plan is executed"""
+
+        def on_success():
+            new_state = item_sm.run_transition(ShareItemActions.Success.value)
+            item_sm.update_state_single_item(session, share_item, new_state)
+
+        def on_failure(error):
+            handle_failure(error)
+            new_state = item_sm.run_transition(ShareItemActions.Failure.value)
+            item_sm.update_state_single_item(session, share_item, new_state)
+
+        self.add_item(item_key, on_success, on_failure)
+
+    def call(self, resource_key: str, item_keys: List[str], fn: Callable[[], None]) -> None:
+        """Registers an operation that reads and writes the resource by itself"""
+        self._group(resource_key).calls.append((fn, list(item_keys)))
+
+    def update(
+        self,
+        resource_key: str,
+        item_keys: List[str],
+        transform: Callable[[Any], bool],
+        read: Callable[[], Any],
+        write: Callable[[Any], None],
+    ) -> None:
+        """
+        Registers a change of a resource document (policy). The document is read once, every transform
+        modifies it in place and returns True if it changed, and the document is written once.
+        The read and write functions of the first registration are used for the resource
+        """
+        group = self._group(resource_key)
+        if group.read is None:
+            group.read, group.write = read, write
+        group.transforms.append((transform, list(item_keys)))
+
+    def resources(self) -> List[str]:
+        return list(self._groups.keys())
+
+    def execute(self, inline: Optional[Callable[[], Any]] = None) -> Tuple[bool, Any]:
+        """
+        Executes the resource groups concurrently, then records the result of every item.
+        The inline function (e.g. the processing of tables, that uses the database session) runs in the calling
+        thread while the groups are executed. If it raises, the result of the items is still recorded
+        before its error is raised again.
+        Returns (True if all the items succeeded, result of the inline function)
+        """
+        groups = list(self._groups.values())
+        log.info(f'Executing share plan of {len(self._items)} items on {len(groups)} resources: {self.resources()}')
+
+        errors: Dict[str, Exception] = {}
+        inline_result = None
+        inline_error = None
+        if groups:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(groups))) as executor:
+                futures = [executor.submit(group.execute) for group in groups]
+                if inline:
+                    try:
+                        inline_result = inline()
+                    except Exception as e:
+                        # the resources are updated anyway, their items are recorded before the error is raised
+                        log.exception('Failed to run the inline processing of the share plan')
+                        inline_error = e
+                for future in futures:
+                    for item_key, error in future.result().items():
+                        errors.setdefault(item_key, error)
+        elif inline:
+            inline_result = inline()
+
+        success = True
+        for item_key, (on_success, on_failure) in self._items.items():
+            if item_key in errors:
+                on_failure(errors[item_key])
+                success = False
+            else:
+                on_success()
+
+        self._groups.clear()
+        self._items.clear()
+        if inline_error:
+            raise inline_error
+        return success, inline_result
+
+    def _group(self, resource_key: str) -> _ResourceGroup:
+        if resource_key not in self._groups:
+            self._groups[resource_key] = _ResourceGroup(resource_key)
+        return self._groups[resource_key]
@@ -1,7 +1,6 @@
 import abc
 import logging
 import uuid
-import time
 
 from botocore.exceptions import ClientError
 
@@ -11,6 +10,7 @@ from dataall.modules.dataset_sharing.aws.glue_client import GlueClient
 from dataall.modules.dataset_sharing.aws.lakeformation_client import LakeFormationClient
 from dataall.base.aws.quicksight import QuicksightClient
 from dataall.base.aws.iam import IAM
+from dataall.base.aws.lakeformation_batch import LakeFormationBatchClient
 from dataall.base.aws.sts import SessionHelper
 from dataall.base.db import exceptions
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable, Dataset
@@ -195,9 +195,9 @@ class LFShareManager:
         )
 
         LakeFormationClient.grant_permissions_to_database(
-            client=SessionHelper.remote_session(
-                accountid=target_environment.AwsAccountId
-            ).client('lakeformation', region_name=target_environment.region),
+            client=SessionHelper.remote_client(
+                target_environment.AwsAccountId, 'lakeformation', region_name=target_environment.region
+            ),
             principals=principals,
             database_name=shared_db_name,
             permissions=['DESCRIBE'],
@@ -296,8 +296,8 @@ class LFShareManager:
 
             )
             LakeFormationClient.batch_revoke_permissions(
-                SessionHelper.remote_session(self.target_environment.AwsAccountId).client(
-                    'lakeformation', region_name=self.target_environment.region
+                SessionHelper.remote_client(
+                    self.target_environment.AwsAccountId, 'lakeformation', region_name=self.target_environment.region
                 ),
                 self.target_environment.AwsAccountId,
                 [
@@ -372,51 +372,96 @@ class LFShareManager:
         :param data:
         :return:
         """
+        failed_tables = cls.share_tables_with_target_account([data])
+        if failed_tables:
+            raise failed_tables[data['source']['tablename']]
+        return True
+
+    @classmethod
+    def share_tables_with_target_account(cls, tables_data: [dict]) -> dict:
+        """
+        Shares tables of the same source database with the target account using Lake Formation
+        The grants are sent with batched requests, then the grants are polled until they are visible
+        (Lake Formation is eventually consistent) so that the RAM invitation can be accepted
+        :param tables_data: list of share data built with build_share_data
+        :return: dict of the tables that could not be shared, table name -> error
+        """
+        if not tables_data:
+            return {}
+
+        data = tables_data[0]
         source_accountid = data['source']['accountid']
         source_region = data['source']['region']
+        source_database = data['source']['database']
 
         target_accountid = data['target']['accountid']
         target_region = data['target']['region']
 
+        table_names = [table_data['source']['tablename'] for table_data in tables_data]
+
         source_session = SessionHelper.remote_session(accountid=source_accountid)
         source_lf_client = source_session.client(
             'lakeformation', region_name=source_region
         )
         try:
 
-            LakeFormationClient.revoke_iamallowedgroups_super_permission_from_table(
+            LakeFormationClient.revoke_iamallowedgroups_super_permission_from_tables(
                 source_lf_client,
                 source_accountid,
-                data['source']['database'],
-                data['source']['tablename'],
+                source_database,
+                table_names,
             )
-            time.sleep(1)
 
-            LakeFormationClient.grant_permissions_to_table(
+            failures = LakeFormationClient.batch_grant_permissions(
                 source_lf_client,
-                target_accountid,
-                data['source']['database'],
-                data['source']['tablename'],
-                ['DESCRIBE', 'SELECT'],
-                ['DESCRIBE', 'SELECT'],
-            )
-            time.sleep(2)
-
-            logger.info(
-                f"Granted access to table {data['source']['tablename']} "
-                f'to external account {target_accountid} '
+                source_accountid,
+                entries=[
+                    LakeFormationBatchClient.table_entry(
+                        target_accountid,
+                        source_database,
+                        table_name,
+                        ['DESCRIBE', 'SELECT'],
+                        ['DESCRIBE', 'SELECT'],
+                    )
+                    for table_name in table_names
+                ],
             )
-            return True
 
         except ClientError as e:
             logging.error(
-                f'Failed granting access to table {data["source"]["tablename"]} '
+                f'Failed granting access to tables {table_names} '
                 f'from {source_accountid} / {source_region} '
                 f'to external account{target_accountid}/{target_region}'
                 f'due to: {e}'
             )
             raise e
 
+        failed_tables = {}
+        for failure in failures:
+            table_name = failure['RequestEntry']['Resource']['Table']['Name']
+            failed_tables[table_name] = ClientError(
+                error_response={
+                    'Error': {
+                        'Code': failure['Error'].get('ErrorCode'),
+                        'Message': failure['Error'].get('ErrorMessage'),
+                    }
+                },
+                operation_name='LakeFormationClient.batch_grant_permissions',
+            )
+
+        batch_client = LakeFormationBatchClient(source_lf_client, source_accountid)
+        for table_name in table_names:
+            if table_name in failed_tables:
+                continue
+            batch_client.wait_for_table_permissions(
+                target_accountid, source_database, table_name, ['DESCRIBE', 'SELECT']
+            )
+            logger.info(
+                f"Granted access to table {table_name} "
+                f'to external account {target_accountid} '
+            )
+        return failed_tables
+
     def revoke_external_account_access_on_source_account(self, db_name, table_name) -> [dict]:
         """
         1) Revokes access to external account
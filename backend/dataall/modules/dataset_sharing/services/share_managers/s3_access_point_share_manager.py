@@ -91,11 +91,29 @@ class S3AccessPointShareManager:
             f'Manage Bucket policy for {self.bucket_name}'
         )
 
+        bucket_policy = self.read_bucket_policy()
+        if self.add_access_point_delegation(bucket_policy):
+            self.write_bucket_policy(bucket_policy)
+
+    def bucket_policy_resource(self) -> str:
+        return f'bucket_policy:{self.source_account_id}/{self.bucket_name}'
+
+    def read_bucket_policy(self) -> dict:
+        s3_client = S3Client(self.source_account_id, self.source_environment.region)
+        return json.loads(s3_client.get_bucket_policy(self.bucket_name))
+
+    def write_bucket_policy(self, bucket_policy: dict):
         s3_client = S3Client(self.source_account_id, self.source_environment.region)
-        bucket_policy = json.loads(s3_client.get_bucket_policy(self.bucket_name))
-        for statement in bucket_policy["Statement"]:
-            if statement.get("Sid") in ["DelegateAccessToAccessPoint"]:
-                return
+        s3_client.create_bucket_policy(self.bucket_name, json.dumps(bucket_policy))
+
+    def add_access_point_delegation(self, bucket_policy: dict) -> bool:
+        """
+        Adds the statements delegating the bucket access to the access points to the bucket policy
+        :return: True if the bucket policy was modified
+        """
+        sids = [statement.get("Sid") for statement in bucket_policy["Statement"]]
+        if "DelegateAccessToAccessPoint" in sids:
+            return False
         exceptions_roleId = [f'{item}:*' for item in SessionHelper.get_role_ids(
             self.source_account_id,
             [self.dataset_admin, self.source_env_admin, SessionHelper.get_delegation_role_arn(self.source_account_id)]
@@ -130,10 +148,10 @@ class S3AccessPointShareManager:
                 }
             }
         }
-        bucket_policy["Statement"].append(allow_owner_access)
+        if DATAALL_ALLOW_OWNER_SID not in sids:
+            bucket_policy["Statement"].append(allow_owner_access)
         bucket_policy["Statement"].append(delegated_to_accesspoint)
-        s3_client = S3Client(self.source_account_id, self.source_environment.region)
-        s3_client.create_bucket_policy(self.bucket_name, json.dumps(bucket_policy))
+        return True
 
     def grant_target_role_access_policy(self):
         """
@@ -236,11 +254,13 @@ class S3AccessPointShareManager:
             json.dumps(policy),
         )
 
-    def manage_access_point_and_policy(self):
+    def manage_access_point_and_policy(self, s3_prefixes: [str] = None):
         """
+        Creates the access point if needed and grants the requester access to the prefixes in the access point policy
+        :param s3_prefixes: prefixes of all the folders shared through the access point, by default the folder prefix
         :return:
         """
-
+        s3_prefixes = s3_prefixes or [self.s3_prefix]
         s3_client = S3ControlClient(self.source_account_id, self.source_environment.region)
         access_point_arn = s3_client.get_bucket_access_point_arn(self.access_point_name)
         if not access_point_arn:
@@ -264,30 +284,7 @@ class S3AccessPointShareManager:
             logger.info(
                 f'There is already an existing access point {access_point_arn} with an existing policy, updating policy...'
             )
-            existing_policy = json.loads(existing_policy)
-            statements = {item["Sid"]: item for item in existing_policy["Statement"]}
-            if f"{target_requester_id}0" in statements.keys():
-                prefix_list = statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"]
-                if isinstance(prefix_list, str):
-                    prefix_list = [prefix_list]
-                if f"{self.s3_prefix}/*" not in prefix_list:
-                    prefix_list.append(f"{self.s3_prefix}/*")
-                    statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"] = prefix_list
-                resource_list = statements[f"{target_requester_id}1"]["Resource"]
-                if isinstance(resource_list, str):
-                    resource_list = [resource_list]
-                if f"{access_point_arn}/object/{self.s3_prefix}/*" not in resource_list:
-                    resource_list.append(f"{access_point_arn}/object/{self.s3_prefix}/*")
-                    statements[f"{target_requester_id}1"]["Resource"] = resource_list
-                existing_policy["Statement"] = list(statements.values())
-            else:
-                additional_policy = S3ControlClient.generate_access_point_policy_template(
-                    target_requester_id,
-                    access_point_arn,
-                    self.s3_prefix,
-                )
-                existing_policy["Statement"].extend(additional_policy["Statement"])
-            access_point_policy = existing_policy
+            access_point_policy = json.loads(existing_policy)
         else:
             # First time to create access point policy
             logger.info(
@@ -296,7 +293,7 @@ class S3AccessPointShareManager:
             access_point_policy = S3ControlClient.generate_access_point_policy_template(
                 target_requester_id,
                 access_point_arn,
-                self.s3_prefix,
+                s3_prefixes[0],
             )
             exceptions_roleId = [f'{item}:*' for item in SessionHelper.get_role_ids(
                 self.source_account_id,
@@ -315,40 +312,78 @@ class S3AccessPointShareManager:
                 }
             }
             access_point_policy["Statement"].append(admin_statement)
+
+        for s3_prefix in s3_prefixes:
+            self._add_prefix_to_access_point_policy(access_point_policy, target_requester_id, access_point_arn, s3_prefix)
+
         s3_client.attach_access_point_policy(
             access_point_name=self.access_point_name, policy=json.dumps(access_point_policy)
         )
 
+    @staticmethod
+    def _add_prefix_to_access_point_policy(access_point_policy, target_requester_id, access_point_arn, s3_prefix):
+        statements = {item["Sid"]: item for item in access_point_policy["Statement"]}
+        if f"{target_requester_id}0" in statements.keys():
+            prefix_list = statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"]
+            if isinstance(prefix_list, str):
+                prefix_list = [prefix_list]
+            if f"{s3_prefix}/*" not in prefix_list:
+                prefix_list.append(f"{s3_prefix}/*")
+                statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"] = prefix_list
+            resource_list = statements[f"{target_requester_id}1"]["Resource"]
+            if isinstance(resource_list, str):
+                resource_list = [resource_list]
+            if f"{access_point_arn}/object/{s3_prefix}/*" not in resource_list:
+                resource_list.append(f"{access_point_arn}/object/{s3_prefix}/*")
+                statements[f"{target_requester_id}1"]["Resource"] = resource_list
+            access_point_policy["Statement"] = list(statements.values())
+        else:
+            additional_policy = S3ControlClient.generate_access_point_policy_template(
+                target_requester_id,
+                access_point_arn,
+                s3_prefix,
+            )
+            access_point_policy["Statement"].extend(additional_policy["Statement"])
+
     def update_dataset_bucket_key_policy(self):
         logger.info(
             'Updating dataset Bucket KMS key policy...'
         )
+        key_policy = self.read_key_policy()
+        if self.add_key_policy_statement(key_policy):
+            self.write_key_policy(key_policy)
+
+    def key_policy_resource(self) -> str:
+        return f'key_policy:{self.source_account_id}/{self.source_environment.region}/alias/{self.dataset.KmsAlias}'
+
+    def read_key_policy(self) -> dict:
         key_alias = f"alias/{self.dataset.KmsAlias}"
         kms_client = KmsClient(account_id=self.source_account_id, region=self.source_environment.region)
         kms_key_id = kms_client.get_key_id(key_alias)
         existing_policy = kms_client.get_key_policy(kms_key_id)
+        return {'KeyId': kms_key_id, 'Policy': json.loads(existing_policy) if existing_policy else None}
+
+    def write_key_policy(self, key_policy: dict):
+        kms_client = KmsClient(account_id=self.source_account_id, region=self.source_environment.region)
+        kms_client.put_key_policy(key_policy['KeyId'], json.dumps(key_policy['Policy']))
+
+    def add_key_policy_statement(self, key_policy: dict) -> bool:
         target_requester_id = SessionHelper.get_role_id(self.target_account_id, self.target_requester_IAMRoleName)
-        if existing_policy and f'{target_requester_id}:*' not in existing_policy:
-            policy = json.loads(existing_policy)
-            policy["Statement"].append(
-                {
-                    "Sid": f"{target_requester_id}",
-                    "Effect": "Allow",
-                    "Principal": {
-                        "AWS": "*"
-                    },
-                    "Action": "kms:Decrypt",
-                    "Resource": "*",
-                    "Condition": {
-                        "StringLike": {
-                            "aws:userId": f"{target_requester_id}:*"
-                        }
-                    }
-                }
-            )
-            kms_client.put_key_policy(kms_key_id, json.dumps(policy))
+        return ShareManagerUtils.add_key_decrypt_statement(key_policy['Policy'], target_requester_id)
 
-    def delete_access_point_policy(self):
+    def access_point_resource(self) -> str:
+        return f'access_point:{self.source_account_id}/{self.source_environment.region}/{self.access_point_name}'
+
+    def role_policy_resource(self) -> str:
+        return f'role_policy:{self.target_account_id}/{self.target_requester_IAMRoleName}/{IAM_ACCESS_POINT_ROLE_POLICY}'
+
+    def delete_access_point_policy(self, s3_prefixes: [str] = None):
+        """
+        Removes the requester access to the prefixes from the access point policy
+        :param s3_prefixes: prefixes of all the revoked folders, by default the folder prefix
+        :return:
+        """
+        s3_prefixes = s3_prefixes or [self.s3_prefix]
         logger.info(
             f'Deleting access point policy for access point {self.access_point_name}...'
         )
@@ -356,16 +391,17 @@ class S3AccessPointShareManager:
         access_point_policy = json.loads(s3_client.get_access_point_policy(self.access_point_name))
         access_point_arn = s3_client.get_bucket_access_point_arn(self.access_point_name)
         target_requester_id = SessionHelper.get_role_id(self.target_account_id, self.target_requester_IAMRoleName)
-        statements = {item["Sid"]: item for item in access_point_policy["Statement"]}
-        if f"{target_requester_id}0" in statements.keys():
-            prefix_list = statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"]
-            if isinstance(prefix_list, list) and f"{self.s3_prefix}/*" in prefix_list:
-                prefix_list.remove(f"{self.s3_prefix}/*")
-                statements[f"{target_requester_id}1"]["Resource"].remove(f"{access_point_arn}/object/{self.s3_prefix}/*")
-                access_point_policy["Statement"] = list(statements.values())
-            else:
-                access_point_policy["Statement"].remove(statements[f"{target_requester_id}0"])
-                access_point_policy["Statement"].remove(statements[f"{target_requester_id}1"])
+        for s3_prefix in s3_prefixes:
+            statements = {item["Sid"]: item for item in access_point_policy["Statement"]}
+            if f"{target_requester_id}0" in statements.keys():
+                prefix_list = statements[f"{target_requester_id}0"]["Condition"]["StringLike"]["s3:prefix"]
+                if isinstance(prefix_list, list) and f"{s3_prefix}/*" in prefix_list:
+                    prefix_list.remove(f"{s3_prefix}/*")
+                    statements[f"{target_requester_id}1"]["Resource"].remove(f"{access_point_arn}/object/{s3_prefix}/*")
+                    access_point_policy["Statement"] = list(statements.values())
+                else:
+                    access_point_policy["Statement"].remove(statements[f"{target_requester_id}0"])
+                    access_point_policy["Statement"].remove(statements[f"{target_requester_id}1"])
         s3_client.attach_access_point_policy(
             access_point_name=self.access_point_name,
             policy=json.dumps(access_point_policy)
@@ -203,29 +203,43 @@ class S3BucketShareManager:
             f'Granting access via Bucket policy for {self.bucket_name}'
         )
         try:
-            target_requester_arn = self.get_role_arn(self.target_account_id, self.target_requester_IAMRoleName)
             bucket_policy = self.get_bucket_policy_or_default()
-            counter = count()
-            statements = {item.get("Sid", next(counter)): item for item in bucket_policy.get("Statement", {})}
-            if DATAALL_READ_ONLY_SID in statements.keys():
-                logger.info(f'Bucket policy contains share statement {DATAALL_READ_ONLY_SID}, updating the current one')
-                statements[DATAALL_READ_ONLY_SID] = self.add_target_arn_to_statement_principal(statements[DATAALL_READ_ONLY_SID], target_requester_arn)
-            else:
-                logger.info(f'Bucket policy does not contain share statement {DATAALL_READ_ONLY_SID}, generating a new one')
-                statements[DATAALL_READ_ONLY_SID] = self.generate_default_bucket_read_policy_statement(self.bucket_name, target_requester_arn)
-
-            if DATAALL_ALLOW_OWNER_SID not in statements.keys():
-                statements[DATAALL_ALLOW_OWNER_SID] = self.generate_owner_access_statement(self.bucket_name, self.get_bucket_owner_roleid())
-
-            bucket_policy["Statement"] = list(statements.values())
-            s3_client = S3Client(self.source_account_id, self.source_environment.region)
-            s3_client.create_bucket_policy(self.bucket_name, json.dumps(bucket_policy))
+            self.add_target_role_to_bucket_policy(bucket_policy)
+            self.write_bucket_policy(bucket_policy)
         except Exception as e:
             logger.exception(
                 f'Failed during bucket policy management {e}'
             )
             raise e
 
+    def bucket_policy_resource(self) -> str:
+        return f'bucket_policy:{self.source_account_id}/{self.bucket_name}'
+
+    def write_bucket_policy(self, bucket_policy: dict):
+        s3_client = S3Client(self.source_account_id, self.source_environment.region)
+        s3_client.create_bucket_policy(self.bucket_name, json.dumps(bucket_policy))
+
+    def add_target_role_to_bucket_policy(self, bucket_policy: dict) -> bool:
+        """
+        Adds the requester role to the read only statement of the bucket policy
+        :return: True, the policy is always written (as when the items were processed one by one)
+        """
+        target_requester_arn = self.get_role_arn(self.target_account_id, self.target_requester_IAMRoleName)
+        counter = count()
+        statements = {item.get("Sid", next(counter)): item for item in bucket_policy.get("Statement", {})}
+        if DATAALL_READ_ONLY_SID in statements.keys():
+            logger.info(f'Bucket policy contains share statement {DATAALL_READ_ONLY_SID}, updating the current one')
+            statements[DATAALL_READ_ONLY_SID] = self.add_target_arn_to_statement_principal(statements[DATAALL_READ_ONLY_SID], target_requester_arn)
+        else:
+            logger.info(f'Bucket policy does not contain share statement {DATAALL_READ_ONLY_SID}, generating a new one')
+            statements[DATAALL_READ_ONLY_SID] = self.generate_default_bucket_read_policy_statement(self.bucket_name, target_requester_arn)
+
+        if DATAALL_ALLOW_OWNER_SID not in statements.keys():
+            statements[DATAALL_ALLOW_OWNER_SID] = self.generate_owner_access_statement(self.bucket_name, self.get_bucket_owner_roleid())
+
+        bucket_policy["Statement"] = list(statements.values())
+        return True
+
     def add_target_arn_to_statement_principal(self, statement, target_requester_arn):
         principal_list = self.get_principal_list(statement)
         if f"{target_requester_arn}" not in principal_list:
@@ -260,37 +274,40 @@ class S3BucketShareManager:
         return principal_list
 
     def grant_dataset_bucket_key_policy(self):
-        if (self.target_bucket.imported and self.target_bucket.importedKmsKey) or not self.target_bucket.imported:
+        if self.uses_kms_key():
             logger.info(
                 'Updating dataset Bucket KMS key policy...'
             )
-            key_alias = f"alias/{self.target_bucket.KmsAlias}"
-            kms_client = KmsClient(self.source_account_id, self.source_environment.region)
-            kms_key_id = kms_client.get_key_id(key_alias)
-            existing_policy = kms_client.get_key_policy(kms_key_id)
-            target_requester_id = SessionHelper.get_role_id(self.target_account_id, self.target_requester_IAMRoleName)
-            if existing_policy and f'{target_requester_id}:*' not in existing_policy:
-                policy = json.loads(existing_policy)
-                policy["Statement"].append(
-                    {
-                        "Sid": f"{target_requester_id}",
-                        "Effect": "Allow",
-                        "Principal": {
-                            "AWS": "*"
-                        },
-                        "Action": "kms:Decrypt",
-                        "Resource": "*",
-                        "Condition": {
-                            "StringLike": {
-                                "aws:userId": f"{target_requester_id}:*"
-                            }
-                        }
-                    }
-                )
-                kms_client.put_key_policy(
-                    kms_key_id,
-                    json.dumps(policy)
-                )
+            key_policy = self.read_key_policy()
+            if self.add_key_policy_statement(key_policy):
+                self.write_key_policy(key_policy)
+
+    def uses_kms_key(self) -> bool:
+        return (self.target_bucket.imported and self.target_bucket.importedKmsKey) or not self.target_bucket.imported
+
+    def key_policy_resource(self) -> str:
+        return f'key_policy:{self.source_account_id}/{self.source_environment.region}/alias/{self.target_bucket.KmsAlias}'
+
+    def read_key_policy(self) -> dict:
+        key_alias = f"alias/{self.target_bucket.KmsAlias}"
+        kms_client = KmsClient(self.source_account_id, self.source_environment.region)
+        kms_key_id = kms_client.get_key_id(key_alias)
+        existing_policy = kms_client.get_key_policy(kms_key_id)
+        return {'KeyId': kms_key_id, 'Policy': json.loads(existing_policy) if existing_policy else None}
+
+    def write_key_policy(self, key_policy: dict):
+        kms_client = KmsClient(self.source_account_id, self.source_environment.region)
+        kms_client.put_key_policy(
+            key_policy['KeyId'],
+            json.dumps(key_policy['Policy'])
+        )
+
+    def add_key_policy_statement(self, key_policy: dict) -> bool:
+        target_requester_id = SessionHelper.get_role_id(self.target_account_id, self.target_requester_IAMRoleName)
+        return ShareManagerUtils.add_key_decrypt_statement(key_policy['Policy'], target_requester_id)
+
+    def role_policy_resource(self) -> str:
+        return f'role_policy:{self.target_account_id}/{self.target_requester_IAMRoleName}/{IAM_S3BUCKET_ROLE_POLICY}'
 
     def delete_target_role_bucket_policy(self):
         logger.info(
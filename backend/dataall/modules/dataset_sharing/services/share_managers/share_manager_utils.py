@@ -1,4 +1,5 @@
 import abc
+import json
 import logging
 
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
@@ -62,3 +63,29 @@ class ShareManagerUtils:
         for target_resource in target_resources:
             if target_resource in policy_statement["Resource"]:
                 policy_statement["Resource"].remove(target_resource)
+
+    @staticmethod
+    def add_key_decrypt_statement(key_policy: dict, target_requester_id: str) -> bool:
+        """
+        Adds the statement allowing the requester role to decrypt with the KMS key if it's missing
+        :return: True if the key policy was modified
+        """
+        if not key_policy or f'{target_requester_id}:*' in json.dumps(key_policy):
+            return False
+        key_policy["Statement"].append(
+            {
+                "Sid": f"{target_requester_id}",
+                "Effect": "Allow",
+                "Principal": {
+                    "AWS": "*"
+                },
+                "Action": "kms:Decrypt",
+                "Resource": "*",
+                "Condition": {
+                    "StringLike": {
+                        "aws:userId": f"{target_requester_id}:*"
+                    }
+                }
+            }
+        )
+        return True
@@ -42,12 +42,14 @@ class ProcessLFCrossAccountShare(LFShareManager):
         4) For each shared table:
             a) update its status to SHARE_IN_PROGRESS with Action Start
             b) check if share item exists on glue catalog raise error if not and flag share item status to failed
-            c) grant external account (target account) access to table -> create RAM invitation and revoke_iamallowedgroups_super_permission_from_table
-            d) accept pending RAM invitation
-            e) create resource link for table in target account
-            f) grant permission to table for requester team IAM role in source account
-            g) grant permission to resource link table for requester team IAM role in target account
-            h) update share item status to SHARE_SUCCESSFUL with Action Success
+        5) Grant external account (target account) access to all the tables with batched requests
+           -> create RAM invitations and revoke_iamallowedgroups_super_permission_from_tables
+        6) For each granted table:
+            a) accept pending RAM invitation
+            b) create resource link for table in target account
+            c) grant permission to table for requester team IAM role in source account
+            d) grant permission to resource link table for requester team IAM role in target account
+            e) update share item status to SHARE_SUCCESSFUL with Action Success
 
         Returns
         -------
@@ -71,6 +73,7 @@ class ProcessLFCrossAccountShare(LFShareManager):
                 self.target_environment, self.dataset, shared_db_name, principals
             )
 
+            shared_items = []
             for table in self.shared_tables:
                 log.info(f"Sharing table {table.GlueTableName}...")
 
@@ -90,11 +93,24 @@ class ProcessLFCrossAccountShare(LFShareManager):
                 shared_item_SM.update_state_single_item(self.session, share_item, new_state)
 
                 try:
-
                     self.check_share_item_exists_on_glue_catalog(share_item, table)
+                    shared_items.append((table, share_item, shared_item_SM, self.build_share_data(table)))
+
+                except Exception as e:
+                    self._handle_share_item_failure(table, share_item, shared_item_SM, e)
+                    success = False
+
+            failed_tables = {}
+            if shared_items:
+                try:
+                    failed_tables = self.share_tables_with_target_account([data for *_, data in shared_items])
+                except Exception as e:
+                    failed_tables = {table.GlueTableName: e for table, *_ in shared_items}
 
-                    data = self.build_share_data(table)
-                    self.share_table_with_target_account(**data)
+            for table, share_item, shared_item_SM, data in shared_items:
+                try:
+                    if table.GlueTableName in failed_tables:
+                        raise failed_tables[table.GlueTableName]
 
                     (
                         retry_share_table,
@@ -111,13 +127,16 @@ class ProcessLFCrossAccountShare(LFShareManager):
                     shared_item_SM.update_state_single_item(self.session, share_item, new_state)
 
                 except Exception as e:
-                    self.handle_share_failure(table=table, share_item=share_item, error=e)
-                    new_state = shared_item_SM.run_transition(ShareItemActions.Failure.value)
-                    shared_item_SM.update_state_single_item(self.session, share_item, new_state)
+                    self._handle_share_item_failure(table, share_item, shared_item_SM, e)
                     success = False
 
         return success
 
+    def _handle_share_item_failure(self, table, share_item, shared_item_SM, error):
+        self.handle_share_failure(table=table, share_item=share_item, error=error)
+        new_state = shared_item_SM.run_transition(ShareItemActions.Failure.value)
+        shared_item_SM.update_state_single_item(self.session, share_item, new_state)
+
     def process_revoked_shares(self) -> bool:
         """
         For each revoked request item:
@@ -1,11 +1,13 @@
 import logging
+from functools import partial
 
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
 from dataall.modules.dataset_sharing.services.share_managers import S3AccessPointShareManager
 from dataall.modules.datasets_base.db.dataset_models import DatasetStorageLocation, Dataset
-from dataall.modules.dataset_sharing.db.enums import ShareItemStatus, ShareObjectActions, ShareItemActions
+from dataall.modules.dataset_sharing.db.enums import ShareItemStatus, ShareObjectActions
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObject
 from dataall.modules.dataset_sharing.db.share_object_repositories import ShareObjectRepository, ShareItemSM
+from dataall.modules.dataset_sharing.services.share_execution_plan import ShareExecutionPlan
 
 log = logging.getLogger(__name__)
 
@@ -49,21 +51,46 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
         env_group: EnvironmentGroup
     ) -> bool:
         """
-        1) update_share_item_status with Start action
-        2) (one time only) manage_bucket_policy - grants permission in the bucket policy
-        3) grant_target_role_access_policy
-        4) manage_access_point_and_policy
-        5) update_dataset_bucket_key_policy
-        6) update_share_item_status with Finish action
+        Plans the folders share (see plan_approved_shares) and executes it
 
         Returns
         -------
         True if share is granted successfully
         """
+        plan = ShareExecutionPlan()
+        cls.plan_approved_shares(
+            plan, session, dataset, share, share_folders, source_environment, target_environment,
+            source_env_group, env_group
+        )
+        success, _ = plan.execute()
+        return success
+
+    @classmethod
+    def plan_approved_shares(
+        cls,
+        plan: ShareExecutionPlan,
+        session,
+        dataset: Dataset,
+        share: ShareObject,
+        share_folders: [DatasetStorageLocation],
+        source_environment: Environment,
+        target_environment: Environment,
+        source_env_group: EnvironmentGroup,
+        env_group: EnvironmentGroup
+    ) -> None:
+        """
+        All the folders of a share are in the dataset bucket and are shared through the same access point
+        1) update_share_item_status with Start action
+        2) manage_bucket_policy - grants permission in the bucket policy (merged with the other bucket policy changes)
+        3) grant_target_role_access_policy (once for all folders)
+        4) manage_access_point_and_policy with the prefixes of all folders
+        5) update_dataset_bucket_key_policy (merged with the other key policy changes)
+        6) update_share_item_status with Success or Failure action when the plan is executed
+        """
         log.info(
-            '##### Starting Sharing folders #######'
+            '##### Planning Sharing folders #######'
         )
-        success = True
+        sharing_folders = []
         for folder in share_folders:
             log.info(f'sharing folder: {folder}')
             sharing_item = ShareObjectRepository.find_sharable_item(
@@ -85,23 +112,39 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
                 source_env_group,
                 env_group,
             )
+            plan.add_share_item(
+                session, folder.locationUri, sharing_item, shared_item_SM, sharing_folder.handle_share_failure
+            )
+            sharing_folders.append(sharing_folder)
 
-            try:
-                sharing_folder.manage_bucket_policy()
-                sharing_folder.grant_target_role_access_policy()
-                sharing_folder.manage_access_point_and_policy()
-                sharing_folder.update_dataset_bucket_key_policy()
-
-                new_state = shared_item_SM.run_transition(ShareItemActions.Success.value)
-                shared_item_SM.update_state_single_item(session, sharing_item, new_state)
-
-            except Exception as e:
-                sharing_folder.handle_share_failure(e)
-                new_state = shared_item_SM.run_transition(ShareItemActions.Failure.value)
-                shared_item_SM.update_state_single_item(session, sharing_item, new_state)
-                success = False
+        if not sharing_folders:
+            return
 
-        return success
+        manager = sharing_folders[0]
+        item_keys = [sharing_folder.target_folder.locationUri for sharing_folder in sharing_folders]
+        plan.update(
+            manager.bucket_policy_resource(),
+            item_keys,
+            manager.add_access_point_delegation,
+            read=manager.read_bucket_policy,
+            write=manager.write_bucket_policy,
+        )
+        plan.call(manager.role_policy_resource(), item_keys, manager.grant_target_role_access_policy)
+        plan.call(
+            manager.access_point_resource(),
+            item_keys,
+            partial(
+                manager.manage_access_point_and_policy,
+                [sharing_folder.s3_prefix for sharing_folder in sharing_folders],
+            ),
+        )
+        plan.update(
+            manager.key_policy_resource(),
+            item_keys,
+            manager.add_key_policy_statement,
+            read=manager.read_key_policy,
+            write=manager.write_key_policy,
+        )
 
     @classmethod
     def process_revoked_shares(
@@ -116,19 +159,43 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
             env_group: EnvironmentGroup,
     ) -> bool:
         """
-        1) update_share_item_status with Start action
-        2) delete_access_point_policy for folder
-        3) update_share_item_status with Finish action
+        Plans the folders revoke (see plan_revoked_shares) and executes it
 
         Returns
         -------
         True if share is revoked successfully
         """
+        plan = ShareExecutionPlan()
+        cls.plan_revoked_shares(
+            plan, session, dataset, share, revoke_folders, source_environment, target_environment,
+            source_env_group, env_group
+        )
+        success, _ = plan.execute()
+        return success
+
+    @classmethod
+    def plan_revoked_shares(
+            cls,
+            plan: ShareExecutionPlan,
+            session,
+            dataset: Dataset,
+            share: ShareObject,
+            revoke_folders: [DatasetStorageLocation],
+            source_environment: Environment,
+            target_environment: Environment,
+            source_env_group: EnvironmentGroup,
+            env_group: EnvironmentGroup,
+    ) -> None:
+        """
+        1) update_share_item_status with Start action
+        2) delete_access_point_policy with the prefixes of all folders
+        3) update_share_item_status with Success or Failure action when the plan is executed
+        """
 
         log.info(
-            '##### Starting Revoking folders #######'
+            '##### Planning Revoking folders #######'
         )
-        success = True
+        removing_folders = []
         for folder in revoke_folders:
             log.info(f'revoking access to folder: {folder}')
             removing_item = ShareObjectRepository.find_sharable_item(
@@ -151,20 +218,23 @@ class ProcessS3AccessPointShare(S3AccessPointShareManager):
                 source_env_group,
                 env_group,
             )
+            plan.add_share_item(
+                session, folder.locationUri, removing_item, revoked_item_SM, removing_folder.handle_revoke_failure
+            )
+            removing_folders.append(removing_folder)
 
-            try:
-                removing_folder.delete_access_point_policy()
-
-                new_state = revoked_item_SM.run_transition(ShareItemActions.Success.value)
-                revoked_item_SM.update_state_single_item(session, removing_item, new_state)
-
-            except Exception as e:
-                removing_folder.handle_revoke_failure(e)
-                new_state = revoked_item_SM.run_transition(ShareItemActions.Failure.value)
-                revoked_item_SM.update_state_single_item(session, removing_item, new_state)
-                success = False
+        if not removing_folders:
+            return
 
-        return success
+        manager = removing_folders[0]
+        plan.call(
+            manager.access_point_resource(),
+            [removing_folder.target_folder.locationUri for removing_folder in removing_folders],
+            partial(
+                manager.delete_access_point_policy,
+                [removing_folder.s3_prefix for removing_folder in removing_folders],
+            ),
+        )
 
     @classmethod
     def clean_up_share(
@@ -1,11 +1,13 @@
 import logging
+from functools import partial
 
 from dataall.core.environment.db.environment_models import Environment, EnvironmentGroup
 from dataall.modules.dataset_sharing.services.share_managers import S3BucketShareManager
 from dataall.modules.datasets_base.db.dataset_models import Dataset, DatasetBucket
-from dataall.modules.dataset_sharing.db.enums import ShareItemStatus, ShareObjectActions, ShareItemActions
+from dataall.modules.dataset_sharing.db.enums import ShareItemStatus, ShareObjectActions
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObject
 from dataall.modules.dataset_sharing.db.share_object_repositories import ShareObjectRepository, ShareItemSM
+from dataall.modules.dataset_sharing.services.share_execution_plan import ShareExecutionPlan
 
 
 log = logging.getLogger(__name__)
@@ -48,20 +50,43 @@ class ProcessS3BucketShare(S3BucketShareManager):
         env_group: EnvironmentGroup
     ) -> bool:
         """
-        1) update_share_item_status with Start action
-        2) manage_bucket_policy - grants permission in the bucket policy
-        3) grant_target_role_access_policy == done
-        4) update_dataset_bucket_key_policy == done
-        5) update_share_item_status with Finish action == done
+        Plans the S3 buckets share (see plan_approved_shares) and executes it
 
         Returns
         -------
         True if share is granted successfully
         """
+        plan = ShareExecutionPlan()
+        cls.plan_approved_shares(
+            plan, session, dataset, share, shared_buckets, source_environment, target_environment,
+            source_env_group, env_group
+        )
+        success, _ = plan.execute()
+        return success
+
+    @classmethod
+    def plan_approved_shares(
+        cls,
+        plan: ShareExecutionPlan,
+        session,
+        dataset: Dataset,
+        share: ShareObject,
+        shared_buckets: [DatasetBucket],
+        source_environment: Environment,
+        target_environment: Environment,
+        source_env_group: EnvironmentGroup,
+        env_group: EnvironmentGroup
+    ) -> None:
+        """
+        1) update_share_item_status with Start action
+        2) grant_role_bucket_policy - grants permission in the bucket policy (merged with the other bucket policy changes)
+        3) grant_s3_iam_access
+        4) grant_dataset_bucket_key_policy (merged with the other key policy changes)
+        5) update_share_item_status with Success or Failure action when the plan is executed
+        """
         log.info(
-            '##### Starting S3 bucket share #######'
+            '##### Planning S3 bucket share #######'
         )
-        success = True
         for shared_bucket in shared_buckets:
             sharing_item = ShareObjectRepository.find_sharable_item(
                 session,
@@ -82,19 +107,24 @@ class ProcessS3BucketShare(S3BucketShareManager):
                 source_env_group,
                 env_group
             )
-            try:
-                sharing_bucket.grant_role_bucket_policy()
-                sharing_bucket.grant_s3_iam_access()
-                sharing_bucket.grant_dataset_bucket_key_policy()
-                new_state = shared_item_SM.run_transition(ShareItemActions.Success.value)
-                shared_item_SM.update_state_single_item(session, sharing_item, new_state)
-
-            except Exception as e:
-                sharing_bucket.handle_share_failure(e)
-                new_state = shared_item_SM.run_transition(ShareItemActions.Failure.value)
-                shared_item_SM.update_state_single_item(session, sharing_item, new_state)
-                success = False
-        return success
+            item_key = shared_bucket.bucketUri
+            plan.add_share_item(session, item_key, sharing_item, shared_item_SM, sharing_bucket.handle_share_failure)
+            plan.update(
+                sharing_bucket.bucket_policy_resource(),
+                [item_key],
+                sharing_bucket.add_target_role_to_bucket_policy,
+                read=sharing_bucket.get_bucket_policy_or_default,
+                write=sharing_bucket.write_bucket_policy,
+            )
+            plan.call(sharing_bucket.role_policy_resource(), [item_key], sharing_bucket.grant_s3_iam_access)
+            if sharing_bucket.uses_kms_key():
+                plan.update(
+                    sharing_bucket.key_policy_resource(),
+                    [item_key],
+                    sharing_bucket.add_key_policy_statement,
+                    read=sharing_bucket.read_key_policy,
+                    write=sharing_bucket.write_key_policy,
+                )
 
     @classmethod
     def process_revoked_shares(
@@ -110,22 +140,46 @@ class ProcessS3BucketShare(S3BucketShareManager):
             existing_shared_folders: bool = False
     ) -> bool:
         """
-        1) update_share_item_status with Start action
-        2) remove access from bucket policy
-        3) remove access from key policy
-        4) remove access from IAM role policy
-        5) update_share_item_status with Finish action
+        Plans the S3 buckets revoke (see plan_revoked_shares) and executes it
 
         Returns
         -------
         True if share is revoked successfully
         False if revoke fails
         """
+        plan = ShareExecutionPlan()
+        cls.plan_revoked_shares(
+            plan, session, dataset, share, revoked_buckets, source_environment, target_environment,
+            source_env_group, env_group, existing_shared_folders
+        )
+        success, _ = plan.execute()
+        return success
+
+    @classmethod
+    def plan_revoked_shares(
+            cls,
+            plan: ShareExecutionPlan,
+            session,
+            dataset: Dataset,
+            share: ShareObject,
+            revoked_buckets: [DatasetBucket],
+            source_environment: Environment,
+            target_environment: Environment,
+            source_env_group: EnvironmentGroup,
+            env_group: EnvironmentGroup,
+            existing_shared_folders: bool = False
+    ) -> None:
+        """
+        1) update_share_item_status with Start action
+        2) remove access from bucket policy
+        3) remove access from key policy
+        4) remove access from IAM role policy
+        5) update_share_item_status with Success or Failure action when the plan is executed
+        """
 
         log.info(
-            '##### Starting Revoking S3 bucket share #######'
+            '##### Planning Revoking S3 bucket share #######'
         )
-        success = True
         for revoked_bucket in revoked_buckets:
             removing_item = ShareObjectRepository.find_sharable_item(
                 session,
@@ -146,26 +200,27 @@ class ProcessS3BucketShare(S3BucketShareManager):
                 source_env_group,
                 env_group
             )
-            try:
-                removing_bucket.delete_target_role_bucket_policy()
-                removing_bucket.delete_target_role_access_policy(
+            item_key = revoked_bucket.bucketUri
+            plan.add_share_item(session, item_key, removing_item, revoked_item_SM, removing_bucket.handle_revoke_failure)
+            plan.call(removing_bucket.bucket_policy_resource(), [item_key], removing_bucket.delete_target_role_bucket_policy)
+            plan.call(
+                removing_bucket.role_policy_resource(),
+                [item_key],
+                partial(
+                    removing_bucket.delete_target_role_access_policy,
                     share=share,
                     target_bucket=revoked_bucket,
                     target_environment=target_environment
-                )
-                if not existing_shared_folders:
-                    removing_bucket.delete_target_role_bucket_key_policy(
+                ),
+            )
+            if not existing_shared_folders:
+                plan.call(
+                    removing_bucket.key_policy_resource(),
+                    [item_key],
+                    partial(
+                        removing_bucket.delete_target_role_bucket_key_policy,
                         share=share,
                         target_bucket=revoked_bucket,
                         target_environment=target_environment
-                    )
-                new_state = revoked_item_SM.run_transition(ShareItemActions.Success.value)
-                revoked_item_SM.update_state_single_item(session, removing_item, new_state)
-
-            except Exception as e:
-                removing_bucket.handle_revoke_failure(e)
-                new_state = revoked_item_SM.run_transition(ShareItemActions.Failure.value)
-                revoked_item_SM.update_state_single_item(session, removing_item, new_state)
-                success = False
-
-        return success
+                    ),
+                )
@@ -65,6 +65,10 @@ DatasetFilter = gql.InputType(
         gql.Argument('sort', gql.ArrayType(DatasetSortCriteria)),
         gql.Argument('page', gql.Integer),
         gql.Argument('pageSize', gql.Integer),
+        gql.Argument('after', gql.String),
+        gql.Argument('before', gql.String),
+        gql.Argument('cursorPagination', gql.Boolean),
+        gql.Argument('withCount', gql.Boolean),
     ],
 )
 
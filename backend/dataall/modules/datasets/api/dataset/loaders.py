@@ -0,0 +1,10 @@
+"""Batch loaders of the dataset related entities for the nested GraphQL fields"""
+from dataall.base.api.batch_loader import BatchLoader
+from dataall.modules.datasets.services.dataset_service import DatasetService
+
+
+def _load_dataset_statistics(session, sources):
+    return DatasetService.get_datasets_statistics(session, list(sources.keys()))
+
+
+dataset_statistics_loader = BatchLoader('DatasetStatistics', _load_dataset_statistics)
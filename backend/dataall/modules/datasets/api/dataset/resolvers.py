@@ -1,15 +1,16 @@
 import logging
 
-from dataall.core.stacks.api import stack_helper
+from dataall.core.stacks.api.stack_helper import stack_loader
 from dataall.base.api.context import Context
 from dataall.base.feature_toggle_checker import is_feature_enabled
 from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
-from dataall.core.environment.services.environment_service import EnvironmentService
-from dataall.core.organizations.db.organization_repositories import Organization
+from dataall.core.environment.api.loaders import environment_loader
+from dataall.core.organizations.api.loaders import organization_loader
 from dataall.base.db.exceptions import RequiredParameter, InvalidInput
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObject
 from dataall.modules.datasets_base.db.dataset_models import Dataset
 from dataall.modules.datasets.api.dataset.enums import DatasetRole
+from dataall.modules.datasets.api.dataset.loaders import dataset_statistics_loader
 from dataall.modules.datasets.services.dataset_service import DatasetService
 
 log = logging.getLogger(__name__)
@@ -90,15 +91,13 @@ def list_tables(context, source: Dataset, filter: dict = None):
 def get_dataset_organization(context, source: Dataset, **kwargs):
     if not source:
         return None
-    with context.engine.scoped_session() as session:
-        return Organization.get_organization_by_uri(session, source.organizationUri)
+    return organization_loader.load(source, 'organizationUri')
 
 
 def get_dataset_environment(context, source: Dataset, **kwargs):
     if not source:
         return None
-    with context.engine.scoped_session() as session:
-        return EnvironmentService.get_environment_by_uri(session, source.environmentUri)
+    return environment_loader.load(source, 'environmentUri')
 
 
 def get_dataset_owners_group(context, source: Dataset, **kwargs):
@@ -120,7 +119,7 @@ def update_dataset(context, source, datasetUri: str = None, input: dict = None):
 def get_dataset_statistics(context: Context, source: Dataset, **kwargs):
     if not source:
         return None
-    return DatasetService.get_dataset_statistics(source)
+    return dataset_statistics_loader.load(source, 'datasetUri')
 
 
 @is_feature_enabled('modules.datasets.features.aws_actions')
@@ -149,10 +148,7 @@ def generate_dataset_access_token(context, source, datasetUri: str = None):
 def get_dataset_stack(context: Context, source: Dataset, **kwargs):
     if not source:
         return None
-    return stack_helper.get_stack_with_cfn_resources(
-        targetUri=source.datasetUri,
-        environmentUri=source.environmentUri,
-    )
+    return stack_loader.load(source, 'datasetUri')
 
 
 def delete_dataset(
@@ -166,6 +166,8 @@ DatasetSearchResult = gql.ObjectType(
         gql.Field(name='previousPage', type=gql.Integer),
         gql.Field(name='hasNext', type=gql.Boolean),
         gql.Field(name='hasPrevious', type=gql.Boolean),
+        gql.Field(name='startCursor', type=gql.String),
+        gql.Field(name='endCursor', type=gql.String),
     ],
 )
 
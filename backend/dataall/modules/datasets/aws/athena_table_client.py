@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 from pyathena import connect
 
 from botocore.exceptions import ClientError
@@ -8,11 +9,16 @@ from dataall.base.aws.sts import SessionHelper
 from dataall.core.environment.db.environment_models import Environment
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable
 from dataall.base.utils import json_utils, sql_utils
+from dataall.base.utils.ttl_cache import TTLCache
 
 log = logging.getLogger(__name__)
 
+# Reuse the results of an identical preview query run by Athena in the last N seconds (0 disables the reuse)
+_ATHENA_REUSE_SECONDS = int(os.getenv('table_preview_athena_reuse_seconds', '0'))
+
 
 class AthenaTableClient:
+    _work_groups = TTLCache(ttl=int(os.getenv('athena_work_group_cache_ttl', '900')), name='athena_work_groups')
 
     def __init__(self, env: Environment, table: DatasetTable):
         session = SessionHelper.remote_session(accountid=table.AWSAccountId)
@@ -26,29 +32,21 @@ class AthenaTableClient:
         table = self._table
         creds = self._creds
 
-        env_workgroup = {}
-        try:
-            env_workgroup = self._client.get_work_group(WorkGroup=env.EnvironmentDefaultAthenaWorkGroup)
-        except ClientError as e:
-            log.info(
-                f'Workgroup {env.EnvironmentDefaultAthenaWorkGroup} can not be found'
-                f'due to: {e}'
-            )
-
         connection = connect(
             aws_access_key_id=creds.access_key,
             aws_secret_access_key=creds.secret_key,
             aws_session_token=creds.token,
-            work_group=env_workgroup.get('WorkGroup', {}).get('Name', 'primary'),
+            work_group=self._get_work_group_name(),
             s3_staging_dir=f's3://{env.EnvironmentDefaultBucketName}/preview/{dataset_uri}/{table.tableUri}',
             region_name=table.region,
         )
         cursor = connection.cursor()
 
-        sql = 'select * from {table_identifier} limit 50'.format(
-            table_identifier=sql_utils.Identifier(table.GlueDatabaseName, table.GlueTableName)
-        )
-        cursor.execute(sql)  # nosemgrep
+        sql = AthenaTableClient.preview_sql(table)
+        if _ATHENA_REUSE_SECONDS:
+            cursor.execute(sql, cache_size=50, cache_expiration_time=_ATHENA_REUSE_SECONDS)  # nosemgrep
+        else:
+            cursor.execute(sql)  # nosemgrep
         # it is not possible to build the query string with the table.X parameters using Pyathena connect
         # to remediate sql injections we built the Identifier class that removes any malicious code from the string
         fields = []
@@ -59,3 +57,26 @@ class AthenaTableClient:
             rows.append(json.dumps(json_utils.to_json(list(row))))
 
         return {'rows': rows, 'fields': fields}
+
+    @staticmethod
+    def preview_sql(table: DatasetTable) -> str:
+        return 'select * from {table_identifier} limit 50'.format(
+            table_identifier=sql_utils.Identifier(table.GlueDatabaseName, table.GlueTableName)
+        )
+
+    def _get_work_group_name(self):
+        env = self._env
+        key = (env.AwsAccountId, env.region, env.EnvironmentDefaultAthenaWorkGroup)
+        return self._work_groups.get_or_load(key, self._find_work_group_name)
+
+    def _find_work_group_name(self):
+        env = self._env
+        try:
+            env_workgroup = self._client.get_work_group(WorkGroup=env.EnvironmentDefaultAthenaWorkGroup)
+            return env_workgroup.get('WorkGroup', {}).get('Name', 'primary')
+        except ClientError as e:
+            log.info(
+                f'Workgroup {env.EnvironmentDefaultAthenaWorkGroup} can not be found'
+                f'due to: {e}'
+            )
+            return 'primary'
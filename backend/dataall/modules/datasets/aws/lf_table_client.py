@@ -1,6 +1,7 @@
 import logging
 from botocore.exceptions import ClientError
 
+from dataall.base.aws.lakeformation_batch import LakeFormationBatchClient
 from dataall.base.aws.sts import SessionHelper
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable
 
@@ -11,9 +12,10 @@ class LakeFormationTableClient:
     """Requests to AWS LakeFormation"""
 
     def __init__(self, table: DatasetTable, aws_session=None):
-        if not aws_session:
-            aws_session = SessionHelper.remote_session(table.AWSAccountId)
-        self._client = aws_session.client('lakeformation', region_name=table.region)
+        if aws_session:
+            self._client = aws_session.client('lakeformation', region_name=table.region)
+        else:
+            self._client = SessionHelper.remote_client(table.AWSAccountId, 'lakeformation', region_name=table.region)
         self._table = table
 
     def grant_pivot_role_all_table_permissions(self):
@@ -33,11 +35,44 @@ class LakeFormationTableClient:
         :return:
         """
 
-        for principal in principals:
-            try:
-                self._grant_permissions_to_table(principal, ['ALL'])
-            except ClientError:
-                pass  # ignore the error to continue with other requests
+        LakeFormationTableClient.grant_principals_all_tables_permissions([self._table], principals, self._client)
+
+    @staticmethod
+    def grant_principals_all_tables_permissions(tables: [DatasetTable], principals: [str], client=None):
+        """
+        Grants ALL permissions to the principals on the tables (all in the same account and region)
+        with batched requests. A failed grant is logged and doesn't stop the other grants
+        :param tables:
+        :param principals:
+        :param client: lakeformation client, the pivot role client of the tables account is used by default
+        :return: the failed entries
+        """
+        if not tables:
+            return []
+
+        first = tables[0]
+        if client is None:
+            client = SessionHelper.remote_client(first.AWSAccountId, 'lakeformation', region_name=first.region)
+
+        entries = [
+            LakeFormationBatchClient.table_entry(principal, table.GlueDatabaseName, table.name, ['ALL'])
+            for table in tables
+            for principal in principals
+        ]
+        try:
+            failures = LakeFormationBatchClient(client, first.AWSAccountId).grant(entries)
+        except ClientError as e:
+            log.error(f'Failed to grant table permissions to {principals} on aws://{first.AWSAccountId}: {e}')
+            return entries
+
+        for failure in failures:
+            entry = failure['RequestEntry']
+            log.error(
+                f'Failed to grant all table permissions to {entry["Principal"]["DataLakePrincipalIdentifier"]} on '
+                f'aws://{first.AWSAccountId}/{entry["Resource"]["Table"]["DatabaseName"]}/'
+                f'{entry["Resource"]["Table"]["Name"]}: {failure.get("Error")}'
+            )
+        return failures
 
     def _grant_permissions_to_table(self, principal, permissions):
         table = self._table
@@ -1,6 +1,6 @@
 import logging
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func
 
 from dataall.base.db import paginate, exceptions
 from dataall.modules.datasets_base.db.dataset_models import DatasetStorageLocation, Dataset
@@ -96,6 +96,34 @@ class DatasetLocationRepository:
             logging.info(f'Found location {location.locationUri}|{location.S3Prefix}')
             return location
 
+    @staticmethod
+    def list_s3_prefixes(session, since=None):
+        """Returns the S3 prefix rows of all the folders, or of the folders changed after `since`"""
+        query = session.query(
+            DatasetStorageLocation.locationUri,
+            DatasetStorageLocation.S3Prefix,
+            DatasetStorageLocation.AWSAccountId,
+            DatasetStorageLocation.region,
+            DatasetStorageLocation.created,
+            DatasetStorageLocation.updated,
+            DatasetStorageLocation.deleted,
+        )
+        if since:
+            query = query.filter(
+                or_(DatasetStorageLocation.created > since, DatasetStorageLocation.updated > since, DatasetStorageLocation.deleted > since)
+            )
+        return query.all()
+
+    @staticmethod
+    def get_locations_by_uris(session, location_uris):
+        if not location_uris:
+            return []
+        return (
+            session.query(DatasetStorageLocation)
+            .filter(DatasetStorageLocation.locationUri.in_(list(location_uris)))
+            .all()
+        )
+
     @staticmethod
     def count_dataset_locations(session, dataset_uri):
         return (
@@ -104,6 +132,15 @@ class DatasetLocationRepository:
             .count()
         )
 
+    @staticmethod
+    def count_locations_by_datasets(session, dataset_uris) -> dict:
+        return dict(
+            session.query(DatasetStorageLocation.datasetUri, func.count(DatasetStorageLocation.locationUri))
+            .filter(DatasetStorageLocation.datasetUri.in_(dataset_uris))
+            .group_by(DatasetStorageLocation.datasetUri)
+            .all()
+        )
+
     @staticmethod
     def delete_dataset_locations(session, dataset_uri) -> bool:
         locations = (
@@ -124,6 +161,22 @@ class DatasetLocationRepository:
             .all()
         )
 
+    @staticmethod
+    def get_folders_by_datasets(session, dataset_uris):
+        return (
+            session.query(DatasetStorageLocation)
+            .filter(DatasetStorageLocation.datasetUri.in_(dataset_uris))
+            .all()
+        )
+
+    @staticmethod
+    def find_folders_changed_since(session, since, folder_uris=()):
+        """Returns folders created, updated or deleted after `since` and the folders with the given URIs"""
+        conditions = [DatasetStorageLocation.created > since, DatasetStorageLocation.updated > since, DatasetStorageLocation.deleted > since]
+        if folder_uris:
+            conditions.append(DatasetStorageLocation.locationUri.in_(list(folder_uris)))
+        return session.query(DatasetStorageLocation).filter(or_(*conditions)).all()
+
     @staticmethod
     def paginated_dataset_locations(session, uri, data=None) -> dict:
         query = session.query(DatasetStorageLocation).filter(
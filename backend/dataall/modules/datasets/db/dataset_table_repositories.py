@@ -1,3 +1,5 @@
+import hashlib
+import json
 import logging
 from datetime import datetime
 
@@ -109,6 +111,27 @@ class DatasetTableRepository:
             .all()
         )
 
+    @staticmethod
+    def find_all_active_tables_by_datasets(session, dataset_uris):
+        return (
+            session.query(DatasetTable)
+            .filter(
+                and_(
+                    DatasetTable.datasetUri.in_(dataset_uris),
+                    DatasetTable.LastGlueTableStatus != 'Deleted',
+                )
+            )
+            .all()
+        )
+
+    @staticmethod
+    def find_tables_changed_since(session, since, table_uris=()):
+        """Returns tables created, updated or deleted after `since` and the tables with the given URIs"""
+        conditions = [DatasetTable.created > since, DatasetTable.updated > since, DatasetTable.deleted > since]
+        if table_uris:
+            conditions.append(DatasetTable.tableUri.in_(list(table_uris)))
+        return session.query(DatasetTable).filter(or_(*conditions)).all()
+
     @staticmethod
     def find_all_deleted_tables(session, dataset_uri):
         return (
@@ -123,10 +146,13 @@ class DatasetTableRepository:
         )
 
     @staticmethod
-    def sync_table_columns(session, dataset_table, glue_table):
-
-        DatasetTableRepository.delete_all_table_columns(session, dataset_table)
-
+    def sync_table_columns(session, dataset_table, glue_table, force=False) -> bool:
+        """
+        Applies the Glue schema to the columns of the table.
+        A table whose schema fingerprint didn't change is skipped (unless forced),
+        otherwise only the added, changed and removed columns are written with bulk statements.
+        Returns True if the columns were synchronized
+        """
         columns = [
             {**item, **{'columnType': 'column'}}
             for item in glue_table.get('StorageDescriptor', {}).get('Columns', [])
@@ -139,22 +165,77 @@ class DatasetTableRepository:
         logger.debug(f'Found columns {columns} for table {dataset_table}')
         logger.debug(f'Found partitions {partitions} for table {dataset_table}')
 
+        fingerprint = DatasetTableRepository.schema_fingerprint(columns + partitions)
+        if not force and dataset_table.schemaFingerprint == fingerprint:
+            logger.debug(f'Schema of table {dataset_table.tableUri} did not change')
+            return False
+
+        existing = {}
+        duplicates = []
+        for column in session.query(DatasetTableColumn).filter(DatasetTableColumn.tableUri == dataset_table.tableUri):
+            if column.name in existing:
+                duplicates.append(column.columnUri)
+            else:
+                existing[column.name] = column
+
+        inserts, updates, updated_columns = [], [], []
         for col in columns + partitions:
-            table_col = DatasetTableColumn(
-                name=col['Name'],
-                description=col.get('Comment', 'No description provided'),
-                label=col['Name'],
-                owner=dataset_table.owner,
-                datasetUri=dataset_table.datasetUri,
-                tableUri=dataset_table.tableUri,
-                AWSAccountId=dataset_table.AWSAccountId,
-                GlueDatabaseName=dataset_table.GlueDatabaseName,
-                GlueTableName=dataset_table.GlueTableName,
-                region=dataset_table.region,
-                typeName=col['Type'],
-                columnType=col['columnType'],
+            description = col.get('Comment', 'No description provided')
+            current = existing.pop(col['Name'], None)
+            if current is None:
+                inserts.append({
+                    'name': col['Name'],
+                    'description': description,
+                    'label': col['Name'],
+                    'owner': dataset_table.owner,
+                    'datasetUri': dataset_table.datasetUri,
+                    'tableUri': dataset_table.tableUri,
+                    'AWSAccountId': dataset_table.AWSAccountId,
+                    'GlueDatabaseName': dataset_table.GlueDatabaseName,
+                    'GlueTableName': dataset_table.GlueTableName,
+                    'region': dataset_table.region,
+                    'typeName': col['Type'],
+                    'columnType': col['columnType'],
+                })
+            elif (current.typeName, current.columnType, current.description, current.deleted) != (
+                col['Type'], col['columnType'], description, None
+            ):
+                updates.append({
+                    'columnUri': current.columnUri,
+                    'typeName': col['Type'],
+                    'columnType': col['columnType'],
+                    'description': description,
+                    'deleted': None,
+                    'updated': datetime.now(),
+                })
+                updated_columns.append(current)
+
+        deletes = duplicates + [column.columnUri for column in existing.values()]
+        if deletes:
+            session.query(DatasetTableColumn).filter(DatasetTableColumn.columnUri.in_(deletes)).delete(
+                synchronize_session=False
             )
-            session.add(table_col)
+        if updates:
+            session.bulk_update_mappings(DatasetTableColumn, updates)
+            for column in updated_columns:
+                session.expire(column)
+        if inserts:
+            session.bulk_insert_mappings(DatasetTableColumn, inserts)
+
+        dataset_table.schemaFingerprint = fingerprint
+        logger.info(
+            f'Synchronized columns of table {dataset_table.tableUri}: '
+            f'{len(inserts)} added, {len(updates)} updated, {len(deletes)} removed'
+        )
+        return True
+
+    @staticmethod
+    def schema_fingerprint(columns) -> str:
+        """Hash of the columns definition, used to detect schema changes between two syncs"""
+        schema = [
+            [col['Name'], col['Type'], col.get('Comment'), col['columnType']] for col in columns
+        ]
+        return hashlib.sha256(json.dumps(schema).encode()).hexdigest()
 
     @staticmethod
     def delete_all_table_columns(session, dataset_table):
@@ -187,6 +268,30 @@ class DatasetTableRepository:
             )
             return table
 
+    @staticmethod
+    def list_s3_prefixes(session, since=None):
+        """Returns the S3 prefix rows of all the tables, or of the tables changed after `since`"""
+        query = session.query(
+            DatasetTable.tableUri,
+            DatasetTable.S3Prefix,
+            DatasetTable.AWSAccountId,
+            DatasetTable.region,
+            DatasetTable.created,
+            DatasetTable.updated,
+            DatasetTable.deleted,
+        )
+        if since:
+            query = query.filter(
+                or_(DatasetTable.created > since, DatasetTable.updated > since, DatasetTable.deleted > since)
+            )
+        return query.all()
+
+    @staticmethod
+    def get_tables_by_uris(session, table_uris):
+        if not table_uris:
+            return []
+        return session.query(DatasetTable).filter(DatasetTable.tableUri.in_(list(table_uris))).all()
+
     @staticmethod
     def find_dataset_tables(session, dataset_uri):
         return (
@@ -1,26 +1,92 @@
 import logging
+from datetime import datetime
 
-from dataall.modules.datasets.indexers.location_indexer import DatasetLocationIndexer
-from dataall.modules.datasets.indexers.table_indexer import DatasetTableIndexer
+from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.datasets.db.dataset_location_repositories import DatasetLocationRepository
+from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
+from dataall.modules.datasets.indexers.dataset_documents import DatasetDocumentBuilder
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
 from dataall.modules.datasets_base.db.dataset_models import Dataset
 from dataall.modules.catalog.indexers.catalog_indexer import CatalogIndexer
 
 log = logging.getLogger(__name__)
 
+_DATASETS_PER_BATCH = 100
+
 
 class DatasetCatalogIndexer(CatalogIndexer):
     """
-       Dataset indexer for the catalog. Indexes all tables and folders of datasets
+       Dataset indexer for the catalog. Indexes all datasets with their tables and folders
+       The documents are built for batches of datasets to avoid per-row lookups
        Register automatically itself when CatalogIndexer instance is created
     """
 
     def index(self, session) -> int:
         all_datasets: [Dataset] = DatasetRepository.list_all_active_datasets(session)
         log.info(f'Found {len(all_datasets)} datasets')
+        return self._index_datasets(session, all_datasets)
+
+    def index_changes(self, session, since: datetime) -> int:
+        """
+        Reindexes the datasets, tables and folders changed after `since` (including their glossary terms).
+        A changed dataset is reindexed with all its tables and folders, a changed table or folder with its dataset.
+        """
+        glossary_targets = GlossaryRepository.find_targets_with_glossary_changes(session, since)
+        datasets = DatasetRepository.find_datasets_changed_since(session, since, glossary_targets)
+        tables = DatasetTableRepository.find_tables_changed_since(session, since, glossary_targets)
+        folders = DatasetLocationRepository.find_folders_changed_since(session, since, glossary_targets)
+        log.info(
+            f'Found {len(datasets)} datasets, {len(tables)} tables and {len(folders)} folders changed since {since}'
+        )
+
+        changed_datasets = {}
+        deleted = 0
+        for dataset in datasets:
+            if dataset.deleted:
+                deleted += self._delete_dataset_docs(session, dataset.datasetUri)
+            else:
+                changed_datasets[dataset.datasetUri] = dataset
+
+        parent_uris = set()
+        child_uris = set()
+        for table in tables:
+            if table.deleted or table.LastGlueTableStatus == 'Deleted':
+                BaseIndexer.delete_doc(doc_id=table.tableUri)
+                deleted += 1
+            else:
+                child_uris.add(table.tableUri)
+            parent_uris.add(table.datasetUri)
+
+        for folder in folders:
+            if folder.deleted:
+                BaseIndexer.delete_doc(doc_id=folder.locationUri)
+                deleted += 1
+            else:
+                child_uris.add(folder.locationUri)
+            parent_uris.add(folder.datasetUri)
+
+        parents = DatasetRepository.list_active_datasets_by_uris(session, parent_uris - changed_datasets.keys())
+        indexed = self._index_datasets(session, list(changed_datasets.values()))
+        indexed += self._index_datasets(session, parents, child_uris)
+        log.info(f'Indexed {indexed} changed documents, deleted {deleted} documents')
+        return indexed
+
+    @staticmethod
+    def _index_datasets(session, datasets, child_uris=None) -> int:
         indexed = 0
-        for dataset in all_datasets:
-            tables = DatasetTableIndexer.upsert_all(session, dataset.datasetUri)
-            folders = DatasetLocationIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
-            indexed += len(tables) + len(folders) + 1
+        for i in range(0, len(datasets), _DATASETS_PER_BATCH):
+            batch = datasets[i:i + _DATASETS_PER_BATCH]
+            for _, doc_id, doc in DatasetDocumentBuilder.build(session, batch, child_uris):
+                BaseIndexer._index(doc_id=doc_id, doc=doc)
+                indexed += 1
         return indexed
+
+    @staticmethod
+    def _delete_dataset_docs(session, dataset_uri) -> int:
+        doc_ids = [dataset_uri]
+        doc_ids += [table.tableUri for table in DatasetTableRepository.find_all_active_tables(session, dataset_uri)]
+        doc_ids += [folder.locationUri for folder in DatasetLocationRepository.get_dataset_folders(session, dataset_uri)]
+        for doc_id in doc_ids:
+            BaseIndexer.delete_doc(doc_id=doc_id)
+        return len(doc_ids)
@@ -0,0 +1,176 @@
+"""
+Builds the OpenSearch documents of datasets, tables and folders.
+The same document functions are used when a single object is upserted and when the catalog is reindexed.
+DatasetDocumentBuilder loads everything needed for a list of datasets with a few grouped queries
+instead of looking up the dataset, environment, organization, glossary and counts for every row.
+"""
+import logging
+from typing import Iterator, List, Optional, Set, Tuple
+
+from dataall.core.environment.db.environment_repositories import EnvironmentRepository
+from dataall.core.organizations.db.organization_repositories import Organization
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.vote.db.vote_repositories import VoteRepository
+from dataall.modules.datasets.db.dataset_location_repositories import DatasetLocationRepository
+from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
+from dataall.modules.datasets_base.db.dataset_models import Dataset, DatasetTable, DatasetStorageLocation
+from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
+
+log = logging.getLogger(__name__)
+
+
+def dataset_document(dataset: Dataset, env, org, glossary, count_tables, count_folders, count_upvotes) -> dict:
+    return {
+        'name': dataset.name,
+        'owner': dataset.owner,
+        'label': dataset.label,
+        'admins': dataset.SamlAdminGroupName,
+        'database': dataset.GlueDatabaseName,
+        'source': dataset.S3BucketName,
+        'resourceKind': 'dataset',
+        'description': dataset.description,
+        'classification': dataset.confidentiality,
+        'tags': [t.replace('-', '') for t in dataset.tags or []],
+        'topics': dataset.topics,
+        'region': dataset.region.replace('-', ''),
+        'environmentUri': env.environmentUri,
+        'environmentName': env.name,
+        'organizationUri': org.organizationUri,
+        'organizationName': org.name,
+        'created': dataset.created,
+        'updated': dataset.updated,
+        'deleted': dataset.deleted,
+        'glossary': glossary,
+        'tables': count_tables,
+        'folders': count_folders,
+        'upvotes': count_upvotes,
+    }
+
+
+def table_document(table: DatasetTable, dataset: Dataset, env, org, glossary) -> dict:
+    return {
+        'name': table.name,
+        'admins': dataset.SamlAdminGroupName,
+        'owner': table.owner,
+        'label': table.label,
+        'resourceKind': 'table',
+        'description': table.description,
+        'database': table.GlueDatabaseName,
+        'source': table.S3BucketName,
+        'classification': dataset.confidentiality,
+        'tags': [t.replace('-', '') for t in table.tags or []],
+        'topics': dataset.topics,
+        'region': dataset.region.replace('-', ''),
+        'datasetUri': table.datasetUri,
+        'environmentUri': env.environmentUri,
+        'environmentName': env.name,
+        'organizationUri': org.organizationUri,
+        'organizationName': org.name,
+        'created': table.created,
+        'updated': table.updated,
+        'deleted': table.deleted,
+        'glossary': glossary,
+    }
+
+
+def folder_document(folder: DatasetStorageLocation, dataset: Dataset, env, org, glossary) -> dict:
+    return {
+        'name': folder.name,
+        'admins': dataset.SamlAdminGroupName,
+        'owner': folder.owner,
+        'label': folder.label,
+        'resourceKind': 'folder',
+        'description': folder.description,
+        'source': dataset.S3BucketName,
+        'classification': dataset.confidentiality,
+        'tags': [f.replace('-', '') for f in folder.tags or []],
+        'topics': dataset.topics,
+        'region': folder.region.replace('-', ''),
+        'datasetUri': folder.datasetUri,
+        'environmentUri': env.environmentUri,
+        'environmentName': env.name,
+        'organizationUri': org.organizationUri,
+        'organizationName': org.name,
+        'created': folder.created,
+        'updated': folder.updated,
+        'deleted': folder.deleted,
+        'glossary': glossary,
+    }
+
+
+class DatasetDocumentBuilder:
+    """Set-oriented builder of the documents of datasets and their active tables and folders"""
+
+    @staticmethod
+    def build(
+        session, datasets: List[Dataset], child_uris: Optional[Set[str]] = None
+    ) -> Iterator[Tuple[str, str, dict]]:
+        """
+        Yields (resource kind, document id, document) for every dataset and its tables and folders.
+        If child_uris is provided, only the tables and folders with these URIs are yielded
+        """
+        if not datasets:
+            return
+
+        dataset_uris = [dataset.datasetUri for dataset in datasets]
+        environments = {
+            env.environmentUri: env
+            for env in EnvironmentRepository.list_environments_by_uris(
+                session, {dataset.environmentUri for dataset in datasets}
+            )
+        }
+        organizations = {
+            org.organizationUri: org
+            for org in Organization.list_organizations_by_uris(
+                session, {dataset.organizationUri for dataset in datasets}
+            )
+        }
+
+        tables = DatasetTableRepository.find_all_active_tables_by_datasets(session, dataset_uris)
+        folders = DatasetLocationRepository.get_folders_by_datasets(session, dataset_uris)
+        if child_uris is not None:
+            tables = [table for table in tables if table.tableUri in child_uris]
+            folders = [folder for folder in folders if folder.locationUri in child_uris]
+
+        count_tables = DatasetRepository.count_tables_by_datasets(session, dataset_uris)
+        count_folders = DatasetLocationRepository.count_locations_by_datasets(session, dataset_uris)
+        count_upvotes = VoteRepository.count_upvotes_by_targets(session, dataset_uris, target_type='dataset')
+        glossary = BaseIndexer._get_targets_glossary_terms(
+            session,
+            dataset_uris + [table.tableUri for table in tables] + [folder.locationUri for folder in folders],
+        )
+
+        by_uri = {dataset.datasetUri: dataset for dataset in datasets}
+        for dataset in datasets:
+            env = environments.get(dataset.environmentUri)
+            org = organizations.get(dataset.organizationUri)
+            if env is None or org is None:
+                log.warning(f'Skipping dataset {dataset.datasetUri} without environment or organization')
+                by_uri.pop(dataset.datasetUri)
+                continue
+
+            yield 'dataset', dataset.datasetUri, dataset_document(
+                dataset,
+                env,
+                org,
+                glossary.get(dataset.datasetUri, []),
+                count_tables.get(dataset.datasetUri, 0),
+                count_folders.get(dataset.datasetUri, 0),
+                count_upvotes.get(dataset.datasetUri, 0),
+            )
+
+        for table in tables:
+            dataset = by_uri.get(table.datasetUri)
+            if dataset:
+                env, org = environments[dataset.environmentUri], organizations[dataset.organizationUri]
+                yield 'table', table.tableUri, table_document(
+                    table, dataset, env, org, glossary.get(table.tableUri, [])
+                )
+
+        for folder in folders:
+            dataset = by_uri.get(folder.datasetUri)
+            if dataset:
+                env, org = environments[dataset.environmentUri], organizations[dataset.organizationUri]
+                yield 'folder', folder.locationUri, folder_document(
+                    folder, dataset, env, org, glossary.get(folder.locationUri, [])
+                )
@@ -5,6 +5,7 @@ from dataall.modules.vote.db.vote_repositories import VoteRepository
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
 from dataall.modules.datasets.db.dataset_location_repositories import DatasetLocationRepository
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.datasets.indexers.dataset_documents import dataset_document
 
 
 class DatasetIndexer(BaseIndexer):
@@ -25,30 +26,6 @@ class DatasetIndexer(BaseIndexer):
             glossary = BaseIndexer._get_target_glossary_terms(session, dataset_uri)
             BaseIndexer._index(
                 doc_id=dataset_uri,
-                doc={
-                    'name': dataset.name,
-                    'owner': dataset.owner,
-                    'label': dataset.label,
-                    'admins': dataset.SamlAdminGroupName,
-                    'database': dataset.GlueDatabaseName,
-                    'source': dataset.S3BucketName,
-                    'resourceKind': 'dataset',
-                    'description': dataset.description,
-                    'classification': dataset.confidentiality,
-                    'tags': [t.replace('-', '') for t in dataset.tags or []],
-                    'topics': dataset.topics,
-                    'region': dataset.region.replace('-', ''),
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': dataset.created,
-                    'updated': dataset.updated,
-                    'deleted': dataset.deleted,
-                    'glossary': glossary,
-                    'tables': count_tables,
-                    'folders': count_folders,
-                    'upvotes': count_upvotes,
-                },
+                doc=dataset_document(dataset, env, org, glossary, count_tables, count_folders, count_upvotes),
             )
         return dataset
@@ -4,6 +4,7 @@ from dataall.core.organizations.db.organization_repositories import Organization
 from dataall.modules.datasets.db.dataset_location_repositories import DatasetLocationRepository
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
 from dataall.modules.datasets.indexers.dataset_indexer import DatasetIndexer
+from dataall.modules.datasets.indexers.dataset_documents import folder_document
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
 
@@ -21,30 +22,10 @@ class DatasetLocationIndexer(BaseIndexer):
 
             BaseIndexer._index(
                 doc_id=folder_uri,
-                doc={
-                    'name': folder.name,
-                    'admins': dataset.SamlAdminGroupName,
-                    'owner': folder.owner,
-                    'label': folder.label,
-                    'resourceKind': 'folder',
-                    'description': folder.description,
-                    'source': dataset.S3BucketName,
-                    'classification': dataset.confidentiality,
-                    'tags': [f.replace('-', '') for f in folder.tags or []],
-                    'topics': dataset.topics,
-                    'region': folder.region.replace('-', ''),
-                    'datasetUri': folder.datasetUri,
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': folder.created,
-                    'updated': folder.updated,
-                    'deleted': folder.deleted,
-                    'glossary': glossary,
-                },
+                doc=folder_document(folder, dataset, env, org, glossary),
             )
-            DatasetIndexer.upsert(session=session, dataset_uri=folder.datasetUri)
+            if not BaseIndexer.indexed_in_bulk(folder.datasetUri):
+                DatasetIndexer.upsert(session=session, dataset_uri=folder.datasetUri)
         return folder
 
     @classmethod
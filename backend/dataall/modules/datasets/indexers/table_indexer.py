@@ -5,6 +5,7 @@ from dataall.core.organizations.db.organization_repositories import Organization
 from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
 from dataall.modules.datasets.indexers.dataset_indexer import DatasetIndexer
+from dataall.modules.datasets.indexers.dataset_documents import table_document
 from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
 
 
@@ -20,34 +21,12 @@ class DatasetTableIndexer(BaseIndexer):
             org = Organization.get_organization_by_uri(session, dataset.organizationUri)
             glossary = BaseIndexer._get_target_glossary_terms(session, table_uri)
 
-            tags = table.tags if table.tags else []
             BaseIndexer._index(
                 doc_id=table_uri,
-                doc={
-                    'name': table.name,
-                    'admins': dataset.SamlAdminGroupName,
-                    'owner': table.owner,
-                    'label': table.label,
-                    'resourceKind': 'table',
-                    'description': table.description,
-                    'database': table.GlueDatabaseName,
-                    'source': table.S3BucketName,
-                    'classification': dataset.confidentiality,
-                    'tags': [t.replace('-', '') for t in tags or []],
-                    'topics': dataset.topics,
-                    'region': dataset.region.replace('-', ''),
-                    'datasetUri': table.datasetUri,
-                    'environmentUri': env.environmentUri,
-                    'environmentName': env.name,
-                    'organizationUri': org.organizationUri,
-                    'organizationName': org.name,
-                    'created': table.created,
-                    'updated': table.updated,
-                    'deleted': table.deleted,
-                    'glossary': glossary,
-                },
+                doc=table_document(table, dataset, env, org, glossary),
             )
-            DatasetIndexer.upsert(session=session, dataset_uri=table.datasetUri)
+            if not BaseIndexer.indexed_in_bulk(table.datasetUri):
+                DatasetIndexer.upsert(session=session, dataset_uri=table.datasetUri)
         return table
 
     @classmethod
@@ -54,7 +54,7 @@ class DatasetColumnService:
             glue_table = GlueTableClient(aws, table).get_table()
 
             DatasetTableRepository.sync_table_columns(
-                session, table, glue_table['Table']
+                session, table, glue_table['Table'], force=True
             )
         return cls.paginate_active_columns_for_table(uri=table_uri, filter={})
 
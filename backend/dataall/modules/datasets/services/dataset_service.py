@@ -229,17 +229,20 @@ class DatasetService:
     @staticmethod
     def get_dataset_statistics(dataset: Dataset):
         with get_context().db_engine.scoped_session() as session:
-            count_tables = DatasetRepository.count_dataset_tables(session, dataset.datasetUri)
-            count_locations = DatasetLocationRepository.count_dataset_locations(
-                session, dataset.datasetUri
-            )
-            count_upvotes = VoteRepository.count_upvotes(
-                session, dataset.datasetUri, target_type='dataset'
-            )
+            return DatasetService.get_datasets_statistics(session, [dataset.datasetUri])[dataset.datasetUri]
+
+    @staticmethod
+    def get_datasets_statistics(session, dataset_uris):
+        count_tables = DatasetRepository.count_tables_by_datasets(session, dataset_uris)
+        count_locations = DatasetLocationRepository.count_locations_by_datasets(session, dataset_uris)
+        count_upvotes = VoteRepository.count_upvotes_by_targets(session, dataset_uris, target_type='dataset')
         return {
-            'tables': count_tables or 0,
-            'locations': count_locations or 0,
-            'upvotes': count_upvotes or 0,
+            uri: {
+                'tables': count_tables.get(uri, 0),
+                'locations': count_locations.get(uri, 0),
+                'upvotes': count_upvotes.get(uri, 0),
+            }
+            for uri in dataset_uris
         }
 
     @staticmethod
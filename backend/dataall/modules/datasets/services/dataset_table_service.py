@@ -1,4 +1,5 @@
 import logging
+import os
 
 from dataall.base.context import get_context
 from dataall.modules.catalog.db.glossary_repositories import GlossaryRepository
@@ -19,9 +20,17 @@ from dataall.modules.datasets_base.db.dataset_models import DatasetTable, Datase
 from dataall.modules.datasets_base.services.permissions import PREVIEW_DATASET_TABLE, DATASET_TABLE_READ, \
     GET_DATASET_TABLE
 from dataall.base.utils import json_utils
+from dataall.base.utils.ttl_cache import TTLCache
 
 log = logging.getLogger(__name__)
 
+# Previews are kept by warm Lambdas, keyed by (table URI, schema fingerprint, query)
+_PREVIEW_CACHE = TTLCache(
+    ttl=int(os.getenv('table_preview_cache_ttl', '300')),
+    name='table_previews',
+    max_size=int(os.getenv('table_preview_cache_size', '200')),
+)
+
 
 class DatasetTableService:
     @staticmethod
@@ -74,6 +83,7 @@ class DatasetTableService:
                 session, target_uri=table.tableUri, target_type='DatasetTable'
             )
         DatasetTableIndexer.delete_doc(doc_id=uri)
+        DatasetTableService.invalidate_previews([uri])
         return True
 
     @staticmethod
@@ -95,7 +105,16 @@ class DatasetTableService:
                     permission_name=PREVIEW_DATASET_TABLE,
                 )
             env = EnvironmentService.get_environment_by_uri(session, dataset.environmentUri)
-            return AthenaTableClient(env, table).get_table(dataset_uri=dataset.datasetUri)
+            key = (table.tableUri, table.schemaFingerprint, AthenaTableClient.preview_sql(table))
+            return _PREVIEW_CACHE.get_or_load(
+                key, lambda: AthenaTableClient(env, table).get_table(dataset_uri=dataset.datasetUri)
+            )
+
+    @staticmethod
+    def invalidate_previews(table_uris):
+        table_uris = set(table_uris)
+        if table_uris:
+            _PREVIEW_CACHE.invalidate_matching(lambda key: key[0] in table_uris)
 
     @staticmethod
     @has_resource_permission(GET_DATASET_TABLE)
@@ -166,6 +185,8 @@ class DatasetTableService:
 
                 DatasetTableRepository.sync_table_columns(session, updated_table, table)
 
+            DatasetTableService.invalidate_previews([t.tableUri for t in existing_tables])
+
         return True
 
     @staticmethod
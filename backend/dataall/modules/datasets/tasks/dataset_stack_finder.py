@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import Dict, List
 
 from dataall.core.environment.services.env_stack_finder import StackFinder
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
@@ -17,3 +17,8 @@ class DatasetStackFinder(StackFinder):
         all_datasets: [Dataset] = DatasetRepository.list_all_active_datasets(session)
         log.info(f'Found {len(all_datasets)} datasets')
         return [dataset.datasetUri for dataset in all_datasets]
+
+    def find_stack_environments(self, session) -> Dict[str, str]:
+        all_datasets: [Dataset] = DatasetRepository.list_all_active_datasets(session)
+        log.info(f'Found {len(all_datasets)} datasets')
+        return {dataset.datasetUri: dataset.environmentUri for dataset in all_datasets}
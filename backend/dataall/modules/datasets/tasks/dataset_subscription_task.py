@@ -15,7 +15,7 @@ from dataall.modules.dataset_sharing.services.share_notification_service import
 from dataall.modules.datasets.aws.sns_dataset_client import SnsDatasetClient
 from dataall.modules.datasets.db.dataset_location_repositories import DatasetLocationRepository
 from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
-from dataall.modules.datasets.tasks.subscriptions import poll_queues
+from dataall.modules.datasets.tasks.subscriptions import DatasetPrefixResolver, poll_queues
 from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
 from dataall.modules.datasets_base.db.dataset_models import DatasetStorageLocation, DatasetTable, Dataset
 
@@ -31,6 +31,7 @@ log = logging.getLogger(__name__)
 class DatasetSubscriptionService:
     def __init__(self, engine):
         self.engine = engine
+        self.prefix_resolver = DatasetPrefixResolver()
 
     @staticmethod
     def get_environments(engine):
@@ -56,9 +57,27 @@ class DatasetSubscriptionService:
         log.info(f'Notifying consumers with messages {messages}')
 
         with engine.scoped_session() as session:
-            for message in messages:
-                self.publish_table_update_message(session, message)
-                self.publish_location_update_message(session, message)
+            resolved = self.prefix_resolver.resolve(session, messages)
+            share_items = ShareObjectRepository.find_share_items_by_item_uris(
+                session,
+                {table.tableUri for _, table, _ in resolved if table}
+                | {location.locationUri for _, _, location in resolved if location},
+            )
+            for message, table, location in resolved:
+                if not table:
+                    log.info(f'No table for message {message}')
+                else:
+                    log.info(f'Found table {table.tableUri}|{table.GlueTableName}|{table.S3Prefix}')
+                    message['table'] = table.GlueTableName
+                    self._publish_update_message(session, message, table, table, share_items[table.tableUri])
+
+                if not location:
+                    log.info(f'No location found for message {message}')
+                else:
+                    log.info(f'Found location {location.locationUri}|{location.S3Prefix}')
+                    self._publish_update_message(
+                        session, message, location, share_items=share_items[location.locationUri]
+                    )
 
         return True
 
@@ -95,13 +114,14 @@ class DatasetSubscriptionService:
             log.info(f'Found location {location.locationUri}|{location.S3Prefix}')
             self._publish_update_message(session, message, location)
 
-    def _publish_update_message(self, session, message, entity, table: DatasetTable = None):
+    def _publish_update_message(self, session, message, entity, table: DatasetTable = None, share_items=None):
         dataset: Dataset = DatasetRepository.get_dataset_by_uri(session, entity.datasetUri)
 
         log.info(
             f'Found dataset {dataset.datasetUri}|{dataset.environmentUri}|{dataset.AwsAccountId}'
         )
-        share_items: [ShareObjectItem] = ShareObjectRepository.find_share_items_by_item_uri(session, entity.uri())
+        if share_items is None:
+            share_items: [ShareObjectItem] = ShareObjectRepository.find_share_items_by_item_uri(session, entity.uri())
         log.info(f'Found shared items for location {share_items}')
 
         return self.publish_sns_message(
@@ -169,6 +189,5 @@ if __name__ == '__main__':
     log.info('Polling datasets updates...')
     service = DatasetSubscriptionService(ENGINE)
     queues = service.get_queues(service.get_environments(ENGINE))
-    messages = poll_queues(queues)
-    service.notify_consumers(ENGINE, messages)
+    poll_queues(queues, handler=lambda messages: service.notify_consumers(ENGINE, messages))
     log.info('Datasets updates shared successfully')
@@ -1 +1,2 @@
 from .sqs_poller import poll_queues
+from .prefix_index import DatasetPrefixResolver, S3PrefixIndex
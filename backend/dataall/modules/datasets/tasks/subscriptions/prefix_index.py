@@ -0,0 +1,134 @@
+"""In-memory index of the S3 prefixes of the dataset tables and folders, used to resolve the producer messages."""
+import bisect
+import logging
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+from dataall.modules.datasets.db.dataset_location_repositories import DatasetLocationRepository
+from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
+
+log = logging.getLogger(__name__)
+
+# Rows committed by transactions that started before the previous refresh may carry older timestamps
+HIGH_WATER_MARK_OVERLAP = timedelta(minutes=5)
+
+
+class S3PrefixIndex:
+    """Sorted S3 prefixes per (account, region) mapped to the URI of the object they belong to"""
+
+    def __init__(self):
+        self._prefixes: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        self._entries: Dict[str, Tuple[Tuple[str, str], str]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, uri: str, s3_prefix: str, accountid: str, region: str) -> None:
+        self.remove(uri)
+        if not s3_prefix:
+            return
+        key = (accountid, region)
+        bisect.insort(self._prefixes.setdefault(key, []), (s3_prefix, uri))
+        self._entries[uri] = (key, s3_prefix)
+
+    def remove(self, uri: str) -> None:
+        entry = self._entries.pop(uri, None)
+        if entry is None:
+            return
+        key, s3_prefix = entry
+        prefixes = self._prefixes[key]
+        position = bisect.bisect_left(prefixes, (s3_prefix, uri))
+        if position < len(prefixes) and prefixes[position] == (s3_prefix, uri):
+            prefixes.pop(position)
+
+    def find(self, s3_prefix: str, accountid: str, region: str) -> Optional[str]:
+        """Returns the URI of the first object whose S3 prefix starts with the given prefix"""
+        if not s3_prefix:
+            return None
+        prefixes = self._prefixes.get((accountid, region))
+        if not prefixes:
+            return None
+        position = bisect.bisect_left(prefixes, (s3_prefix, ''))
+        if position < len(prefixes) and prefixes[position][0].startswith(s3_prefix):
+            return prefixes[position][1]
+        return None
+
+
+class DatasetPrefixResolver:
+    """
+    Keeps the prefix indexes of the tables and folders, built once per task run with a full load
+    and then refreshed with the rows created, updated or deleted since the previous refresh.
+    The refreshes overlap by HIGH_WATER_MARK_OVERLAP, re-adding the rows of the overlap is idempotent
+    """
+
+    def __init__(self):
+        self.tables = S3PrefixIndex()
+        self.locations = S3PrefixIndex()
+        self._since = None
+        self.fallbacks = 0
+
+    def refresh(self, session) -> None:
+        since = self._since - HIGH_WATER_MARK_OVERLAP if self._since else None
+        table_rows = DatasetTableRepository.list_s3_prefixes(session, since=since)
+        location_rows = DatasetLocationRepository.list_s3_prefixes(session, since=since)
+        for index, rows in ((self.tables, table_rows), (self.locations, location_rows)):
+            for uri, s3_prefix, accountid, region, created, updated, deleted in rows:
+                index.add(uri, s3_prefix, accountid, region)
+                self._since = max(t for t in (self._since, created, updated, deleted) if t is not None)
+
+        log.info(
+            f'Refreshed S3 prefix index with {len(table_rows)} tables and {len(location_rows)} folders '
+            f'(indexed: {len(self.tables)} tables, {len(self.locations)} folders)'
+        )
+
+    def resolve(self, session, messages: List[dict]) -> List[tuple]:
+        """
+        Returns (message, table, location) for every message of the batch.
+        The table or the folder is None if no object of the account and region starts with the message prefix
+        """
+        self.refresh(session)
+
+        table_uris = [self._find(self.tables, message) for message in messages]
+        location_uris = [self._find(self.locations, message) for message in messages]
+        tables = {
+            table.tableUri: table
+            for table in DatasetTableRepository.get_tables_by_uris(session, {uri for uri in table_uris if uri})
+        }
+        locations = {
+            location.locationUri: location
+            for location in DatasetLocationRepository.get_locations_by_uris(
+                session, {uri for uri in location_uris if uri}
+            )
+        }
+
+        resolved = []
+        for message, table_uri, location_uri in zip(messages, table_uris, location_uris):
+            table = self._get(session, self.tables, tables, table_uri, message)
+            location = self._get(session, self.locations, locations, location_uri, message)
+            resolved.append((message, table, location))
+        return resolved
+
+    @staticmethod
+    def _find(index: S3PrefixIndex, message: dict) -> Optional[str]:
+        return index.find(message.get('prefix'), message.get('accountid'), message.get('region'))
+
+    def _get(self, session, index: S3PrefixIndex, loaded: dict, uri: Optional[str], message: dict):
+        if uri is None:
+            return None
+        entity = loaded.get(uri)
+        if entity is not None:
+            return entity
+
+        # the object was removed from the database: the prefix might match another object
+        index.remove(uri)
+        self.fallbacks += 1
+        prefix, accountid, region = message.get('prefix'), message.get('accountid'), message.get('region')
+        if index is self.tables:
+            entity = DatasetTableRepository.get_table_by_s3_prefix(session, prefix, accountid, region)
+            if entity is not None:
+                index.add(entity.tableUri, entity.S3Prefix, entity.AWSAccountId, entity.region)
+        else:
+            entity = DatasetLocationRepository.get_location_by_s3_prefix(session, prefix, accountid, region)
+            if entity is not None:
+                index.add(entity.locationUri, entity.S3Prefix, entity.AWSAccountId, entity.region)
+        return entity
@@ -1,7 +1,11 @@
 import json
 import logging
 import os
+import queue as queue_lib
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
 
 import boto3
 from botocore.exceptions import ClientError
@@ -15,61 +19,150 @@ log = logging.getLogger(__name__)
 ENVNAME = os.getenv('envname', 'local')
 region = os.getenv('AWS_REGION', 'eu-west-1')
 
-
-def poll_queues(queues):
-    log.debug(f'Received Queues URL: {queues}')
-
-    messages = []
-
-    for queue in queues:
-
-        sqs = boto3.client(
+DEFAULT_MAX_WORKERS = int(os.getenv('subscriptions_poller_max_workers', '8'))
+DEFAULT_WAIT_TIME_SECONDS = int(os.getenv('subscriptions_poller_wait_seconds', '5'))
+DEFAULT_MAX_RECEIVES_PER_QUEUE = int(os.getenv('subscriptions_poller_max_receives', '100'))
+# Maximum number of messages of receive_message and of entries of delete_message_batch
+SQS_MAX_MESSAGES = 10
+_PENDING_BATCHES = 20
+_DONE = object()
+
+
+class SqsPoller:
+    """
+    Drains the producers queues of the environments concurrently.
+    Every queue is polled with long polling until it's empty, and the messages are handed to the handler
+    (in the calling thread) as soon as a batch is received. A batch is deleted from its queue with
+    delete_message_batch only once the handler processed it, otherwise it becomes visible again.
+    """
+
+    def __init__(
+        self,
+        queues: List[dict],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        wait_time_seconds: int = DEFAULT_WAIT_TIME_SECONDS,
+        max_receives_per_queue: int = DEFAULT_MAX_RECEIVES_PER_QUEUE,
+    ):
+        self.queues = queues
+        self.max_workers = max(max_workers, 1)
+        self.wait_time_seconds = wait_time_seconds
+        self.max_receives_per_queue = max_receives_per_queue
+        # boto3 clients are thread-safe but their creation is not: one client per region, created upfront
+        self._clients = {q['region']: self._create_client(q['region']) for q in queues}
+        self.stats = {'received': 0, 'processed': 0, 'deleted': 0, 'failed': 0}
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def _create_client(queue_region):
+        return boto3.client(
             'sqs',
-            region_name=queue['region'],
-            endpoint_url=f"https://sqs.{queue['region']}.amazonaws.com"
+            region_name=queue_region,
+            endpoint_url=f'https://sqs.{queue_region}.amazonaws.com'
         )
-        try:
 
-            response = sqs.receive_message(
-                QueueUrl=queue['url'],
-                AttributeNames=['SentTimestamp'],
-                MaxNumberOfMessages=10,
-                MessageAttributeNames=['All'],
-            )
-
-            if not response or not response.get('Messages'):
-                log.info(f"No new messages available from queue: {queue['url']}")
-
-            if response and response.get('Messages'):
-
-                log.info(f"Available messages from queue: {response['Messages']}")
-                for message in response['Messages']:
-                    if message.get('Body'):
-                        log.info('Consumed message from queue: %s' % message)
-                        producer_message = json.loads(
-                            json.loads(message.get('Body')).get('Message')
-                        )
-                        log.info(f'Extracted Message: {producer_message}')
-
-                        messages.append(producer_message)
-
-                        try:
-                            log.info(
-                                f'Deleting the original message from the Queue: {message}'
-                            )
-                            delete_response = sqs.delete_message(
-                                QueueUrl=queue['url'],
-                                ReceiptHandle=message.get('ReceiptHandle'),
-                            )
-                            log.info(
-                                f'Deleted message from the Queue response: {delete_response}'
-                            )
-                        except ClientError as e:
-                            log.error(
-                                f'Failed to delete the original message from queue {queue} due to: {e}'
-                            )
+    def stream(self, handler: Callable[[List[dict]], None]) -> Dict[str, int]:
+        """Polls all the queues and calls the handler with every batch of producer messages"""
+        if not self.queues:
+            return self.stats
+
+        batches = queue_lib.Queue(maxsize=_PENDING_BATCHES)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.queues))) as executor:
+            futures = [executor.submit(self._drain, q, batches) for q in self.queues]
+            running = len(futures)
+            while running:
+                batch = batches.get()
+                if batch is _DONE:
+                    running -= 1
+                    continue
+                try:
+                    self._process(handler, *batch)
+                except Exception as e:
+                    # keep consuming, the workers would be blocked on the full queue otherwise
+                    log.exception(f'Failed to process a batch of queue {batch[0]["url"]}: {e}')
+
+        log.info(f'Polled {len(self.queues)} queues: {self.stats}')
+        return self.stats
+
+    def _drain(self, q: dict, batches: queue_lib.Queue):
+        sqs = self._clients[q['region']]
+        try:
+            for _ in range(self.max_receives_per_queue):
+                response = sqs.receive_message(
+                    QueueUrl=q['url'],
+                    AttributeNames=['SentTimestamp'],
+                    MaxNumberOfMessages=SQS_MAX_MESSAGES,
+                    MessageAttributeNames=['All'],
+                    WaitTimeSeconds=self.wait_time_seconds,
+                )
+                received = (response or {}).get('Messages')
+                if not received:
+                    log.info(f"No new messages available from queue: {q['url']}")
+                    break
+
+                log.info(f"Received {len(received)} messages from queue: {q['url']}")
+                with self._stats_lock:
+                    self.stats['received'] += len(received)
+                batches.put((q, received))
+        except ClientError as e:
+            log.error(f'Failed to get messages from queue {q} due to: {e}')
+        except Exception as e:
+            log.exception(f'Unexpected error while polling queue {q}: {e}')
+        finally:
+            batches.put(_DONE)
+
+    def _process(self, handler, q: dict, received: List[dict]):
+        messages = []
+        for message in received:
+            if not message.get('Body'):
+                continue
+            try:
+                producer_message = json.loads(json.loads(message['Body']).get('Message'))
+            except (TypeError, ValueError) as e:
+                # an invalid message would be received again forever, it's deleted
+                log.error(f'Skipping invalid message {message} from queue {q["url"]}: {e}')
+                continue
+            log.info(f'Extracted Message: {producer_message}')
+            messages.append(producer_message)
 
+        try:
+            if messages:
+                handler(messages)
+        except Exception as e:
+            log.exception(f'Failed to process {len(messages)} messages from queue {q["url"]}, they will be retried: {e}')
+            with self._stats_lock:
+                self.stats['failed'] += len(messages)
+            return
+
+        with self._stats_lock:
+            self.stats['processed'] += len(messages)
+        self._delete(q, received)
+
+    def _delete(self, q: dict, received: List[dict]):
+        entries = [
+            {'Id': str(index), 'ReceiptHandle': message['ReceiptHandle']}
+            for index, message in enumerate(received)
+            if message.get('ReceiptHandle')
+        ]
+        if not entries:
+            return
+        try:
+            response = self._clients[q['region']].delete_message_batch(QueueUrl=q['url'], Entries=entries)
+            failed = response.get('Failed') or []
+            if failed:
+                log.error(f'Failed to delete messages from queue {q["url"]}: {failed}')
+            with self._stats_lock:
+                self.stats['deleted'] += len(entries) - len(failed)
         except ClientError as e:
-            log.error(f'Failed to get messages from queue {queue} due to: {e}')
+            log.error(f'Failed to delete the original messages from queue {q} due to: {e}')
+
 
+def poll_queues(queues, handler: Callable[[List[dict]], None] = None):
+    """
+    Polls the queues. The messages are handed to the handler as they are received,
+    or returned all together if no handler is provided
+    """
+    log.debug(f'Received Queues URL: {queues}')
+
+    messages = []
+    SqsPoller(queues).stream(handler or messages.extend)
     return messages
@@ -1,6 +1,9 @@
 import logging
 import os
 import sys
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from operator import and_
 
 from dataall.base.aws.sts import SessionHelper
@@ -22,18 +25,97 @@ if not root.hasHandlers():
 log = logging.getLogger(__name__)
 
 
-def sync_tables(engine):
+MAX_WORKERS = int(os.getenv('tables_sync_max_workers', '1'))
+MAX_WORKERS_PER_ACCOUNT = int(os.getenv('tables_sync_max_workers_per_account', '2'))
+
+
+def sync_tables(engine, max_workers: int = None, max_workers_per_account: int = None):
+    """
+    Synchronizes the tables of all the active datasets with their Glue databases.
+    Every dataset is synchronized in its own session, a failure only affects the dataset.
+    With more than one worker the datasets are processed concurrently, with at most
+    max_workers_per_account datasets of the same AWS account at a time to avoid the throttling of AWS APIs
+    """
+    max_workers = max_workers or MAX_WORKERS
+    max_workers_per_account = max_workers_per_account or MAX_WORKERS_PER_ACCOUNT
+
     with engine.scoped_session() as session:
-        processed_tables = []
         all_datasets: [Dataset] = DatasetRepository.list_all_active_datasets(
             session
         )
-        log.info(f'Found {len(all_datasets)} datasets for tables sync')
-        dataset: Dataset
-        for dataset in all_datasets:
-            log.info(
-                f'Synchronizing dataset {dataset.name}|{dataset.datasetUri} tables'
-            )
+        datasets = [(dataset.datasetUri, dataset.AwsAccountId) for dataset in all_datasets]
+    log.info(f'Found {len(datasets)} datasets for tables sync')
+
+    def sync(dataset_uri, account):
+        try:
+            return sync_dataset_tables(engine, dataset_uri)
+        except Exception as e:
+            log.exception(f'Failed to sync tables for dataset {dataset_uri} due to: {e}')
+            return {'datasetUri': dataset_uri, 'account': account, 'status': 'failed', 'tables': [], 'seconds': 0}
+
+    start = time.perf_counter()
+    if max_workers <= 1:
+        results = [sync(dataset_uri, account) for dataset_uri, account in datasets]
+    else:
+        results = run_by_account(datasets, sync, max_workers, max_workers_per_account)
+
+    _log_summary(results, time.perf_counter() - start)
+    processed_tables = []
+    for result in results:
+        processed_tables.extend(result['tables'])
+    return processed_tables
+
+
+def run_by_account(datasets, sync, max_workers: int, max_workers_per_account: int) -> list:
+    """
+    Calls sync(dataset_uri, account) for every dataset with at most max_workers calls at a time, and at most
+    max_workers_per_account for the same account. A dataset is only submitted when a worker and a slot of its
+    account are free, and the accounts take turns: the workers never wait on a busy account while the datasets
+    of other accounts are pending. The results are returned in the order of the datasets
+    """
+    pending = {}
+    for index, (dataset_uri, account) in enumerate(datasets):
+        pending.setdefault(account, deque()).append((index, dataset_uri))
+
+    results = [None] * len(datasets)
+    running = Counter()
+    futures = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tables-sync') as executor:
+        while pending or futures:
+            submitted = True
+            while submitted and len(futures) < max_workers:
+                submitted = False
+                for account in list(pending):
+                    if len(futures) >= max_workers:
+                        break
+                    if running[account] >= max_workers_per_account:
+                        continue
+                    index, dataset_uri = pending[account].popleft()
+                    if not pending[account]:
+                        del pending[account]
+                    running[account] += 1
+                    futures[executor.submit(sync, dataset_uri, account)] = (index, account)
+                    submitted = True
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, account = futures.pop(future)
+                running[account] -= 1
+                results[index] = future.result()
+    return results
+
+
+def sync_dataset_tables(engine, dataset_uri: str) -> dict:
+    """Synchronizes the tables of a dataset and returns the timing and the processed tables"""
+    start = time.perf_counter()
+    result = {'datasetUri': dataset_uri, 'status': 'skipped', 'tables': []}
+    with engine.scoped_session() as session:
+        dataset = DatasetRepository.get_dataset_by_uri(session, dataset_uri)
+        result['account'] = dataset.AwsAccountId
+        log.info(
+            f'Synchronizing dataset {dataset.name}|{dataset.datasetUri} tables'
+        )
+        try:
             env: Environment = (
                 session.query(Environment)
                 .filter(
@@ -44,55 +126,70 @@ def sync_tables(engine):
                 )
                 .first()
             )
-            env_group: EnvironmentGroup = (
-                EnvironmentService.get_environment_group(
-                    session, dataset.SamlAdminGroupName, env.environmentUri
+            if not env or not is_assumable_pivot_role(env):
+                log.info(
+                    f'Dataset {dataset.GlueDatabaseName} has an invalid environment'
                 )
-            )
-            try:
-                if not env or not is_assumable_pivot_role(env):
-                    log.info(
-                        f'Dataset {dataset.GlueDatabaseName} has an invalid environment'
-                    )
-                else:
-
-                    tables = DatasetCrawler(dataset).list_glue_database_tables(dataset.S3BucketName)
-
-                    log.info(
-                        f'Found {len(tables)} tables on Glue database {dataset.GlueDatabaseName}'
+            else:
+                env_group: EnvironmentGroup = (
+                    EnvironmentService.get_environment_group(
+                        session, dataset.SamlAdminGroupName, env.environmentUri
                     )
+                )
 
-                    DatasetTableService.sync_existing_tables(
-                        session, dataset.datasetUri, glue_tables=tables
-                    )
+                tables = DatasetCrawler(dataset).list_glue_database_tables(dataset.S3BucketName)
 
-                    tables = (
-                        session.query(DatasetTable)
-                        .filter(DatasetTable.datasetUri == dataset.datasetUri)
-                        .all()
-                    )
+                log.info(
+                    f'Found {len(tables)} tables on Glue database {dataset.GlueDatabaseName}'
+                )
 
-                    log.info('Updating tables permissions on Lake Formation...')
+                DatasetTableService.sync_existing_tables(
+                    session, dataset.datasetUri, glue_tables=tables
+                )
 
-                    for table in tables:
-                        LakeFormationTableClient(table).grant_principals_all_table_permissions(
-                            principals=[
-                                SessionHelper.get_delegation_role_arn(env.AwsAccountId),
-                                env_group.environmentIAMRoleArn,
-                            ],
-                        )
+                tables = (
+                    session.query(DatasetTable)
+                    .filter(DatasetTable.datasetUri == dataset.datasetUri)
+                    .all()
+                )
 
-                    processed_tables.extend(tables)
+                log.info('Updating tables permissions on Lake Formation...')
 
-                    DatasetTableIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
-            except Exception as e:
-                log.error(
-                    f'Failed to sync tables for dataset '
-                    f'{dataset.AwsAccountId}/{dataset.GlueDatabaseName} '
-                    f'due to: {e}'
+                LakeFormationTableClient.grant_principals_all_tables_permissions(
+                    tables,
+                    principals=[
+                        SessionHelper.get_delegation_role_arn(env.AwsAccountId),
+                        env_group.environmentIAMRoleArn,
+                    ],
                 )
-                DatasetAlarmService().trigger_dataset_sync_failure_alarm(dataset, str(e))
-        return processed_tables
+
+                DatasetTableIndexer.upsert_all(session, dataset_uri=dataset.datasetUri)
+                result['tables'] = tables
+                result['status'] = 'synced'
+        except Exception as e:
+            log.error(
+                f'Failed to sync tables for dataset '
+                f'{dataset.AwsAccountId}/{dataset.GlueDatabaseName} '
+                f'due to: {e}'
+            )
+            session.rollback()
+            result['status'] = 'failed'
+            DatasetAlarmService().trigger_dataset_sync_failure_alarm(dataset, str(e))
+
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def _log_summary(results, elapsed):
+    by_status = defaultdict(int)
+    for result in results:
+        by_status[result['status']] += 1
+    log.info(f'Synchronized {len(results)} datasets in {elapsed:.3f}s: {dict(by_status)}')
+    for result in sorted(results, key=lambda r: r['seconds'], reverse=True):
+        log.info(
+            f"Dataset {result['datasetUri']} ({result.get('account')}): {result['status']}, "
+            f"{len(result['tables'])} tables in {result['seconds']}s"
+        )
 
 
 def is_assumable_pivot_role(env: Environment):
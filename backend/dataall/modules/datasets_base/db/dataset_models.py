@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, String, Text, ForeignKey
+from sqlalchemy import Boolean, Column, String, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSON, ARRAY
 from sqlalchemy.orm import query_expression
 from dataall.base.db import Base, Resource, utils
@@ -54,6 +54,17 @@ class DatasetStorageLocation(Resource, Base):
     projectPermission = query_expression()
     environmentEndPoint = query_expression()
 
+    __table_args__ = (
+        # S3 prefix lookups (S3Prefix LIKE 'prefix%') of the dataset subscriptions
+        Index(
+            'ix_dataset_storage_location_s3_prefix',
+            'AWSAccountId',
+            'region',
+            'S3Prefix',
+            postgresql_ops={'S3Prefix': 'text_pattern_ops'},
+        ),
+    )
+
     @classmethod
     def uri(cls):
         return cls.locationUri
@@ -71,6 +82,7 @@ class DatasetTable(Resource, Base):
     GlueTableConfig = Column(Text)
     GlueTableProperties = Column(JSON, default={})
     LastGlueTableStatus = Column(String, default='InSync')
+    schemaFingerprint = Column(String, nullable=True)
     region = Column(String, default='eu-west-1')
     # LastGeneratedPreviewDate= Column(DateTime, default=None)
     confidentiality = Column(String, nullable=True)
@@ -80,6 +92,17 @@ class DatasetTable(Resource, Base):
     topics = Column(ARRAY(String), nullable=True)
     confidentiality = Column(String, nullable=False, default='C1')
 
+    __table_args__ = (
+        # S3 prefix lookups (S3Prefix LIKE 'prefix%') of the dataset subscriptions
+        Index(
+            'ix_dataset_table_s3_prefix',
+            'AWSAccountId',
+            'region',
+            'S3Prefix',
+            postgresql_ops={'S3Prefix': 'text_pattern_ops'},
+        ),
+    )
+
     @classmethod
     def uri(cls):
         return cls.tableUri
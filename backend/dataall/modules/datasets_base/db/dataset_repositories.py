@@ -1,6 +1,6 @@
 import logging
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func
 from sqlalchemy.orm import Query
 
 from dataall.core.activity.db.activity_models import Activity
@@ -233,6 +233,22 @@ class DatasetRepository(EnvironmentResource):
             session.query(Dataset).filter(Dataset.deleted.is_(None)).all()
         )
 
+    @staticmethod
+    def list_active_datasets_by_uris(session, dataset_uris) -> [Dataset]:
+        return (
+            session.query(Dataset)
+            .filter(Dataset.datasetUri.in_(dataset_uris), Dataset.deleted.is_(None))
+            .all()
+        )
+
+    @staticmethod
+    def find_datasets_changed_since(session, since, dataset_uris=()) -> [Dataset]:
+        """Returns datasets created, updated or deleted after `since` and the datasets with the given URIs"""
+        conditions = [Dataset.created > since, Dataset.updated > since, Dataset.deleted > since]
+        if dataset_uris:
+            conditions.append(Dataset.datasetUri.in_(list(dataset_uris)))
+        return session.query(Dataset).filter(or_(*conditions)).all()
+
     @staticmethod
     def get_dataset_by_bucket_name(session, bucket) -> [Dataset]:
         return (
@@ -249,6 +265,15 @@ class DatasetRepository(EnvironmentResource):
             .count()
         )
 
+    @staticmethod
+    def count_tables_by_datasets(session, dataset_uris) -> dict:
+        return dict(
+            session.query(DatasetTable.datasetUri, func.count(DatasetTable.tableUri))
+            .filter(DatasetTable.datasetUri.in_(dataset_uris))
+            .group_by(DatasetTable.datasetUri)
+            .all()
+        )
+
     @staticmethod
     def query_environment_group_datasets(session, env_uri, group_uri, filter) -> Query:
         query = session.query(Dataset).filter(
@@ -10,5 +10,9 @@ NotificationFilter = gql.InputType(
         gql.Argument(name='type', type=gql.String),
         gql.Argument(name='page', type=gql.Integer),
         gql.Argument(name='pageSize', type=gql.Integer),
+        gql.Argument(name='after', type=gql.String),
+        gql.Argument(name='before', type=gql.String),
+        gql.Argument(name='cursorPagination', type=gql.Boolean),
+        gql.Argument(name='withCount', type=gql.Boolean),
     ],
 )
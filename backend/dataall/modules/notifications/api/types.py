@@ -25,5 +25,7 @@ NotificationSearchResult = gql.ObjectType(
         gql.Field(name='hasNext', type=gql.Boolean),
         gql.Field(name='hasPrevious', type=gql.Boolean),
         gql.Field(name='nodes', type=gql.ArrayType(Notification)),
+        gql.Field(name='startCursor', type=gql.String),
+        gql.Field(name='endCursor', type=gql.String),
     ],
 )
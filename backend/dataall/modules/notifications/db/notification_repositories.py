@@ -3,7 +3,7 @@ from datetime import datetime
 from sqlalchemy import func, and_, or_
 
 from dataall.modules.notifications.db import notification_models as models
-from dataall.base.db import paginate
+from dataall.base.db import paginate, paginate_keyset, is_cursor_request
 
 
 class NotificationRepository:
@@ -52,6 +52,16 @@ class NotificationRepository:
             )
         if filter.get('archived'):
             q = q.filter(models.Notification.deleted.isnot(None))
+        if is_cursor_request(filter):
+            return paginate_keyset(
+                q,
+                sort_keys=[models.Notification.created, models.Notification.notificationUri],
+                page_size=filter.get('pageSize', 20),
+                after=filter.get('after'),
+                before=filter.get('before'),
+                descending=True,
+                with_total=filter.get('withCount', False),
+            ).to_dict()
         return paginate(
             q, page=filter.get('page', 1), page_size=filter.get('pageSize', 20)
         ).to_dict()
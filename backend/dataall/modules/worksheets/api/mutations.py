@@ -27,3 +27,26 @@ deleteWorksheet = gql.MutationField(
     ],
     type=gql.Boolean,
 )
+
+
+startWorksheetQuery = gql.MutationField(
+    name='startWorksheetQuery',
+    resolver=start_worksheet_query,
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='sqlQuery', type=gql.NonNullableType(gql.String)),
+    ],
+    type=gql.Ref('WorksheetQueryResult'),
+)
+
+cancelWorksheetQuery = gql.MutationField(
+    name='cancelWorksheetQuery',
+    resolver=cancel_worksheet_query,
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='athenaQueryId', type=gql.NonNullableType(gql.String)),
+    ],
+    type=gql.Ref('WorksheetQueryResult'),
+)
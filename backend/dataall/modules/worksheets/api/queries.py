@@ -25,6 +25,33 @@ runAthenaSqlQuery = gql.QueryField(
         gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
         gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
         gql.Argument(name='sqlQuery', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='maxRows', type=gql.Integer),
     ],
     resolver=run_sql_query,
 )
+
+
+getAthenaQueryResults = gql.QueryField(
+    name='getAthenaQueryResults',
+    type=gql.Ref('AthenaQueryResultPage'),
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='athenaQueryId', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='nextToken', type=gql.String),
+        gql.Argument(name='pageSize', type=gql.Integer),
+    ],
+    resolver=get_query_results,
+)
+
+
+getWorksheetQueryStatus = gql.QueryField(
+    name='getWorksheetQueryStatus',
+    type=gql.Ref('WorksheetQueryResult'),
+    args=[
+        gql.Argument(name='environmentUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='worksheetUri', type=gql.NonNullableType(gql.String)),
+        gql.Argument(name='athenaQueryId', type=gql.NonNullableType(gql.String)),
+    ],
+    resolver=get_worksheet_query_status,
+)
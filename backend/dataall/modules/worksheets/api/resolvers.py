@@ -51,6 +51,13 @@ def resolve_user_role(context: Context, source: Worksheet):
     return WorksheetRole.NoPermission.value
 
 
+def resolve_query_history(context: Context, source: Worksheet, limit: int = None):
+    if not source:
+        return None
+    with context.engine.scoped_session() as session:
+        return WorksheetService.list_query_history(session, source.worksheetUri, limit=limit)
+
+
 def list_worksheets(context, source, filter: dict = None):
     if not filter:
         filter = {}
@@ -66,14 +73,76 @@ def list_worksheets(context, source, filter: dict = None):
 
 
 def run_sql_query(
-    context: Context, source, environmentUri: str = None, worksheetUri: str = None, sqlQuery: str = None
+    context: Context,
+    source,
+    environmentUri: str = None,
+    worksheetUri: str = None,
+    sqlQuery: str = None,
+    maxRows: int = None,
 ):
     with context.engine.scoped_session() as session:
         return WorksheetService.run_sql_query(
             session=session,
             uri=environmentUri,
             worksheetUri=worksheetUri,
-            sqlQuery=sqlQuery
+            sqlQuery=sqlQuery,
+            maxRows=maxRows,
+        )
+
+
+def get_query_results(
+    context: Context,
+    source,
+    environmentUri: str = None,
+    worksheetUri: str = None,
+    athenaQueryId: str = None,
+    nextToken: str = None,
+    pageSize: int = None,
+):
+    with context.engine.scoped_session() as session:
+        return WorksheetService.get_query_results(
+            session=session,
+            uri=environmentUri,
+            worksheetUri=worksheetUri,
+            athenaQueryId=athenaQueryId,
+            nextToken=nextToken,
+            pageSize=pageSize,
+        )
+
+
+def start_worksheet_query(
+    context: Context, source, environmentUri: str = None, worksheetUri: str = None, sqlQuery: str = None
+):
+    with context.engine.scoped_session() as session:
+        return WorksheetService.start_query(
+            session=session,
+            uri=environmentUri,
+            worksheetUri=worksheetUri,
+            sqlQuery=sqlQuery,
+        )
+
+
+def get_worksheet_query_status(
+    context: Context, source, environmentUri: str = None, worksheetUri: str = None, athenaQueryId: str = None
+):
+    with context.engine.scoped_session() as session:
+        return WorksheetService.get_query_status(
+            session=session,
+            uri=environmentUri,
+            worksheetUri=worksheetUri,
+            athenaQueryId=athenaQueryId,
+        )
+
+
+def cancel_worksheet_query(
+    context: Context, source, environmentUri: str = None, worksheetUri: str = None, athenaQueryId: str = None
+):
+    with context.engine.scoped_session() as session:
+        return WorksheetService.cancel_query(
+            session=session,
+            uri=environmentUri,
+            worksheetUri=worksheetUri,
+            athenaQueryId=athenaQueryId,
         )
 
 
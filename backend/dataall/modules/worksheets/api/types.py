@@ -1,5 +1,5 @@
 from dataall.base.api import gql
-from dataall.modules.worksheets.api.resolvers import resolve_user_role
+from dataall.modules.worksheets.api.resolvers import resolve_user_role, resolve_query_history
 
 AthenaResultColumnDescriptor = gql.ObjectType(
     name='AthenaResultColumnDescriptor',
@@ -36,7 +36,7 @@ AthenaQueryResult = gql.ObjectType(
         gql.Field(name='AwsAccountId', type=gql.String),
         gql.Field(name='region', type=gql.String),
         gql.Field(name='ElapsedTimeInMs', type=gql.Integer),
-        gql.Field(name='DataScannedInBytes', type=gql.Integer),
+        gql.Field(name='DataScannedInBytes', type=gql.Float),
         gql.Field(name='Status', type=gql.String),
         gql.Field(
             name='columns', type=gql.ArrayType(gql.Ref('AthenaResultColumnDescriptor'))
@@ -46,6 +46,19 @@ AthenaQueryResult = gql.ObjectType(
 )
 
 
+AthenaQueryResultPage = gql.ObjectType(
+    name='AthenaQueryResultPage',
+    fields=[
+        gql.Field(name='AthenaQueryId', type=gql.String),
+        gql.Field(
+            name='columns', type=gql.ArrayType(gql.Ref('AthenaResultColumnDescriptor'))
+        ),
+        gql.Field(name='rows', type=gql.ArrayType(gql.ArrayType(gql.String))),
+        gql.Field(name='nextToken', type=gql.String),
+    ],
+)
+
+
 Worksheet = gql.ObjectType(
     name='Worksheet',
     fields=[
@@ -69,6 +82,12 @@ Worksheet = gql.ObjectType(
             type=gql.Ref('WorksheetRole'),
             resolver=resolve_user_role,
         ),
+        gql.Field(
+            name='queryHistory',
+            args=[gql.Argument(name='limit', type=gql.Integer)],
+            type=gql.ArrayType(gql.Ref('WorksheetQueryResult')),
+            resolver=resolve_query_history,
+        ),
     ],
 )
 
@@ -89,15 +108,16 @@ Worksheets = gql.ObjectType(
 WorksheetQueryResult = gql.ObjectType(
     name='WorksheetQueryResult',
     fields=[
-        gql.Field(name='worksheetQueryResultUri', type=gql.ID),
-        gql.Field(name='queryType', type=gql.NonNullableType(gql.String)),
-        gql.Field(name='sqlBody', type=gql.NonNullableType(gql.String)),
+        gql.Field(name='worksheetUri', type=gql.NonNullableType(gql.String)),
         gql.Field(name='AthenaQueryId', type=gql.NonNullableType(gql.String)),
+        gql.Field(name='status', type=gql.String),
+        gql.Field(name='sqlBody', type=gql.NonNullableType(gql.String)),
         gql.Field(name='region', type=gql.NonNullableType(gql.String)),
         gql.Field(name='AwsAccountId', type=gql.NonNullableType(gql.String)),
-        gql.Field(name='AthenaOutputBucketName', type=gql.NonNullableType(gql.String)),
-        gql.Field(name='AthenaOutputKey', type=gql.NonNullableType(gql.String)),
-        gql.Field(name='timeElapsedInSecond', type=gql.NonNullableType(gql.Integer)),
+        gql.Field(name='OutputLocation', type=gql.String),
+        gql.Field(name='error', type=gql.String),
+        gql.Field(name='ElapsedTimeInMs', type=gql.Integer),
+        gql.Field(name='DataScannedInBytes', type=gql.Float),
         gql.Field(name='created', type=gql.NonNullableType(gql.String)),
     ],
 )
@@ -1,6 +1,19 @@
+import os
+
 from pyathena import connect
 from dataall.base.aws.sts import SessionHelper
 
+# Maximum number of rows returned by a query, the next rows are fetched page by page with the query id
+DEFAULT_MAX_ROWS = int(os.getenv('worksheet_query_max_rows', '1000'))
+# Maximum number of rows accepted by get_query_results
+MAX_PAGE_SIZE = 1000
+
+# States of a query execution that will not change anymore
+FINISHED_STATES = {'SUCCEEDED', 'FAILED', 'CANCELLED'}
+
+_INTEGER_TYPES = {'tinyint', 'smallint', 'integer', 'int', 'bigint'}
+_FLOAT_TYPES = {'float', 'real', 'double'}
+
 
 class AthenaClient:
     """ Makes requests to AWS Athena """
@@ -24,25 +37,131 @@ class AthenaClient:
         return cursor
 
     @staticmethod
-    def convert_query_output(cursor):
+    def client(aws_account_id, env_group, region):
+        """Returns an Athena client of the environment group role"""
+        base_session = SessionHelper.remote_session(accountid=aws_account_id)
+        boto3_session = SessionHelper.get_session(base_session=base_session, role_arn=env_group.environmentIAMRoleArn)
+        return boto3_session.client('athena', region_name=region)
+
+    @staticmethod
+    def start_query(client, sql, work_group, output_location):
+        """Submits the query and returns its QueryExecutionId without waiting for the query to finish"""
+        response = client.start_query_execution(
+            QueryString=sql,
+            WorkGroup=work_group,
+            ResultConfiguration={'OutputLocation': output_location},
+        )
+        return response['QueryExecutionId']
+
+    @staticmethod
+    def get_query_execution(client, query_id):
+        """Returns {'Status', 'Error', 'OutputLocation', 'ElapsedTimeInMs', 'DataScannedInBytes'} of the query"""
+        execution = client.get_query_execution(QueryExecutionId=query_id)['QueryExecution']
+        status = execution.get('Status', {})
+        statistics = execution.get('Statistics', {})
+        return {
+            'Status': status.get('State'),
+            'Error': status.get('StateChangeReason') if status.get('State') == 'FAILED' else None,
+            'OutputLocation': execution.get('ResultConfiguration', {}).get('OutputLocation'),
+            'ElapsedTimeInMs': statistics.get('TotalExecutionTimeInMillis'),
+            'DataScannedInBytes': statistics.get('DataScannedInBytes'),
+        }
+
+    @staticmethod
+    def stop_query(client, query_id):
+        client.stop_query_execution(QueryExecutionId=query_id)
+
+    @staticmethod
+    def convert_query_output(cursor, max_rows=DEFAULT_MAX_ROWS):
+        """Converts at most max_rows rows of the cursor, the cells keep the Athena type of their column"""
         columns = []
         for f in cursor.description:
-            columns.append({'columnName': f[0], 'typeName': 'String'})
+            columns.append({'columnName': f[0], 'typeName': f[1] or 'varchar'})
 
         rows = []
-        for row in cursor:
+        for row in cursor.fetchmany(max_rows):
             record = {'cells': []}
             for col_position, column in enumerate(columns):
                 cell = {}
                 cell['columnName'] = column['columnName']
                 cell['typeName'] = column['typeName']
-                cell['value'] = str(row[col_position])
+                value = row[col_position]
+                cell['value'] = None if value is None else str(value)
                 record['cells'].append(cell)
             rows.append(record)
         return {
             'error': None,
             'AthenaQueryId': cursor.query_id,
-            'ElapsedTime': cursor.total_execution_time_in_millis,
+            'ElapsedTimeInMs': cursor.total_execution_time_in_millis,
+            'DataScannedInBytes': cursor.data_scanned_in_bytes,
             'rows': rows,
             'columns': columns,
         }
+
+    @staticmethod
+    def get_query_results_page(client, query_id, page_size=MAX_PAGE_SIZE, next_token=None):
+        """
+        Returns one page of the results of a finished query as columns and row arrays:
+        {'AthenaQueryId', 'columns': [{'columnName', 'typeName'}], 'rows': [[value, ...]], 'nextToken'}
+        The integer, floating point and boolean values are converted to Python types, the others are kept as strings
+        """
+        kwargs = dict(QueryExecutionId=query_id, MaxResults=min(max(page_size, 1), MAX_PAGE_SIZE))
+        if next_token:
+            kwargs['NextToken'] = next_token
+        response = client.get_query_results(**kwargs)
+
+        columns = [
+            {'columnName': info['Name'], 'typeName': info['Type']}
+            for info in response['ResultSet']['ResultSetMetadata']['ColumnInfo']
+        ]
+        rows = response['ResultSet']['Rows']
+        if not next_token and rows and AthenaClient._is_header(rows[0], columns):
+            # the first row of the results of a SELECT contains the column labels
+            rows = rows[1:]
+
+        return {
+            'AthenaQueryId': query_id,
+            'columns': columns,
+            'rows': [
+                [AthenaClient._convert(datum.get('VarCharValue'), column['typeName'])
+                 for datum, column in zip(row['Data'], columns)]
+                for row in rows
+            ],
+            'nextToken': response.get('NextToken'),
+        }
+
+    @staticmethod
+    def iter_query_results(client, query_id, page_size=MAX_PAGE_SIZE, max_rows=None):
+        """Yields the result pages of a query one after the other, only one page is held in memory"""
+        next_token = None
+        remaining = max_rows
+        while True:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page = AthenaClient.get_query_results_page(client, query_id, size, next_token)
+            if remaining is not None:
+                page['rows'] = page['rows'][:remaining]
+                remaining -= len(page['rows'])
+            yield page
+            next_token = page['nextToken']
+            if not next_token or remaining == 0:
+                return
+
+    @staticmethod
+    def _is_header(row, columns):
+        return [datum.get('VarCharValue') for datum in row['Data']] == [c['columnName'] for c in columns]
+
+    @staticmethod
+    def _convert(value, type_name):
+        if value is None:
+            return None
+        type_name = type_name.lower()
+        try:
+            if type_name in _INTEGER_TYPES:
+                return int(value)
+            if type_name in _FLOAT_TYPES:
+                return float(value)
+        except ValueError:
+            return value
+        if type_name == 'boolean':
+            return value.lower() == 'true'
+        return value
@@ -1,7 +1,7 @@
 import datetime
 import enum
 
-from sqlalchemy import Column, DateTime, Integer, Enum, String
+from sqlalchemy import BigInteger, Column, DateTime, Integer, Enum, String
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import query_expression
 
@@ -27,7 +27,7 @@ class Worksheet(Resource, Base):
 
 class WorksheetQueryResult(Base):
     __tablename__ = 'worksheet_query_result'
-    worksheetUri = Column(String, nullable=False)
+    worksheetUri = Column(String, nullable=False, index=True)
     AthenaQueryId = Column(String, primary_key=True)
     status = Column(String, nullable=False)
     queryType = Column(Enum(QueryType), nullable=False, default=True)
@@ -37,5 +37,5 @@ class WorksheetQueryResult(Base):
     OutputLocation = Column(String, nullable=False)
     error = Column(String, nullable=True)
     ElapsedTimeInMs = Column(Integer, nullable=True)
-    DataScannedInBytes = Column(Integer, nullable=True)
+    DataScannedInBytes = Column(BigInteger, nullable=True)
     created = Column(DateTime, default=datetime.datetime.now)
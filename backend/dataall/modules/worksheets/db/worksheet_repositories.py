@@ -55,3 +55,44 @@ class WorksheetRepository(EnvironmentResource):
             page=data.get('page', WorksheetRepository._DEFAULT_PAGE),
             page_size=data.get('pageSize', WorksheetRepository._DEFAULT_PAGE_SIZE),
         ).to_dict()
+
+    @staticmethod
+    def find_query_result(session, worksheet_uri, athena_query_id) -> WorksheetQueryResult:
+        return (
+            session.query(WorksheetQueryResult)
+            .filter(
+                WorksheetQueryResult.worksheetUri == worksheet_uri,
+                WorksheetQueryResult.AthenaQueryId == athena_query_id,
+            )
+            .first()
+        )
+
+    @staticmethod
+    def list_query_results(session, worksheet_uri, limit=None):
+        """Returns the query history of the worksheet, most recent first"""
+        query = (
+            session.query(WorksheetQueryResult)
+            .filter(WorksheetQueryResult.worksheetUri == worksheet_uri)
+            .order_by(WorksheetQueryResult.created.desc())
+        )
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def delete_old_query_results(session, worksheet_uri, keep) -> int:
+        """Deletes the query history of the worksheet except the `keep` most recent queries"""
+        recent = (
+            session.query(WorksheetQueryResult.AthenaQueryId)
+            .filter(WorksheetQueryResult.worksheetUri == worksheet_uri)
+            .order_by(WorksheetQueryResult.created.desc())
+            .limit(keep)
+        )
+        return (
+            session.query(WorksheetQueryResult)
+            .filter(
+                WorksheetQueryResult.worksheetUri == worksheet_uri,
+                WorksheetQueryResult.AthenaQueryId.notin_(recent.subquery()),
+            )
+            .delete(synchronize_session=False)
+        )
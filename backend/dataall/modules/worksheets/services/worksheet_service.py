@@ -1,12 +1,14 @@
 import logging
+import os
 
 from dataall.core.activity.db.activity_models import Activity
 from dataall.core.environment.services.environment_service import EnvironmentService
 from dataall.core.permissions.db.resource_policy_repositories import ResourcePolicy
 from dataall.core.permissions.permission_checker import has_tenant_permission, has_resource_permission
 from dataall.base.db import exceptions
-from dataall.modules.worksheets.aws.athena_client import AthenaClient
-from dataall.modules.worksheets.db.worksheet_models import Worksheet
+from dataall.base.utils.ttl_cache import TTLCache
+from dataall.modules.worksheets.aws.athena_client import AthenaClient, DEFAULT_MAX_ROWS, FINISHED_STATES, MAX_PAGE_SIZE
+from dataall.modules.worksheets.db.worksheet_models import QueryType, Worksheet, WorksheetQueryResult
 from dataall.modules.worksheets.db.worksheet_repositories import WorksheetRepository
 from dataall.modules.worksheets.services.worksheet_permissions import MANAGE_WORKSHEETS, UPDATE_WORKSHEET, \
     WORKSHEET_ALL, GET_WORKSHEET, DELETE_WORKSHEET, RUN_ATHENA_QUERY
@@ -14,6 +16,23 @@ from dataall.modules.worksheets.services.worksheet_permissions import MANAGE_WOR
 
 logger = logging.getLogger(__name__)
 
+# Number of queries kept in the history of a worksheet
+QUERY_HISTORY_SIZE = int(os.getenv('worksheet_query_history_size', '50'))
+
+# Results of the read-only queries, keyed by (environment, work group, worksheet, query, max rows)
+_QUERY_CACHE = TTLCache(
+    ttl=int(os.getenv('worksheet_query_cache_ttl', '60')),
+    name='worksheet_queries',
+    max_size=int(os.getenv('worksheet_query_cache_size', '50')),
+)
+# The results of a finished query don't change, the pages are kept longer
+_RESULT_PAGE_CACHE = TTLCache(
+    ttl=int(os.getenv('worksheet_result_page_cache_ttl', '900')),
+    name='worksheet_result_pages',
+    max_size=int(os.getenv('worksheet_query_cache_size', '50')),
+)
+_READ_ONLY_STATEMENTS = ('select', 'with')
+
 
 class WorksheetService:
     @staticmethod
@@ -99,7 +118,7 @@ class WorksheetService:
 
     @staticmethod
     @has_resource_permission(RUN_ATHENA_QUERY)
-    def run_sql_query(session, uri, worksheetUri, sqlQuery):
+    def run_sql_query(session, uri, worksheetUri, sqlQuery, maxRows=None):
         environment = EnvironmentService.get_environment_by_uri(session, uri)
         worksheet = WorksheetService.get_worksheet_by_uri(session, worksheetUri)
 
@@ -107,12 +126,171 @@ class WorksheetService:
             session, worksheet.SamlAdminGroupName, environment.environmentUri
         )
 
-        cursor = AthenaClient.run_athena_query(
-            aws_account_id=environment.AwsAccountId,
-            env_group=env_group,
-            s3_staging_dir=f's3://{environment.EnvironmentDefaultBucketName}/athenaqueries/{env_group.environmentAthenaWorkGroup}/',
+        if maxRows is not None and maxRows < 1:
+            raise exceptions.InvalidInput('maxRows', maxRows, 'a number of rows >= 1')
+        max_rows = min(maxRows or DEFAULT_MAX_ROWS, DEFAULT_MAX_ROWS)
+        s3_staging_dir = (
+            f's3://{environment.EnvironmentDefaultBucketName}/athenaqueries/{env_group.environmentAthenaWorkGroup}/'
+        )
+
+        def run_query():
+            cursor = AthenaClient.run_athena_query(
+                aws_account_id=environment.AwsAccountId,
+                env_group=env_group,
+                s3_staging_dir=s3_staging_dir,
+                region=environment.region,
+                sql=sqlQuery
+            )
+            return AthenaClient.convert_query_output(cursor, max_rows=max_rows)
+
+        if not sqlQuery or not sqlQuery.lstrip().lower().startswith(_READ_ONLY_STATEMENTS):
+            result = run_query()
+        else:
+            key = (
+                environment.environmentUri,
+                env_group.environmentAthenaWorkGroup,
+                worksheet.worksheetUri,
+                sqlQuery.strip(),
+                max_rows,
+            )
+            result = _QUERY_CACHE.get_or_load(key, run_query)
+
+        # the next pages of the results are only served for the queries of the worksheet history
+        WorksheetService._record_query_result(session, worksheet, environment, sqlQuery, s3_staging_dir, result)
+        return result
+
+    @staticmethod
+    @has_resource_permission(RUN_ATHENA_QUERY)
+    def get_query_results(session, uri, worksheetUri, athenaQueryId, nextToken=None, pageSize=None):
+        """Returns one page of the results of a finished query of the worksheet as columns and row arrays"""
+        if not athenaQueryId:
+            raise exceptions.RequiredParameter(param_name='athenaQueryId')
+        if pageSize is not None and pageSize < 1:
+            raise exceptions.InvalidInput('pageSize', pageSize, 'a page size >= 1')
+        environment, worksheet, env_group = WorksheetService._get_query_context(session, uri, worksheetUri)
+
+        query_result = WorksheetService._get_query_result(session, worksheet.worksheetUri, athenaQueryId)
+        if query_result.status != 'SUCCEEDED':
+            raise exceptions.InvalidInput('athenaQueryId', athenaQueryId, 'a query that succeeded')
+
+        page_size = min(pageSize or MAX_PAGE_SIZE, MAX_PAGE_SIZE)
+
+        def fetch_page():
+            client = AthenaClient.client(environment.AwsAccountId, env_group, environment.region)
+            return AthenaClient.get_query_results_page(client, athenaQueryId, page_size=page_size, next_token=nextToken)
+
+        # the pages are read with the role of the team of the worksheet, they are only shared within the team
+        return _RESULT_PAGE_CACHE.get_or_load(
+            (environment.environmentUri, env_group.groupUri, athenaQueryId, nextToken, page_size), fetch_page
+        )
+
+    @staticmethod
+    @has_resource_permission(RUN_ATHENA_QUERY)
+    def start_query(session, uri, worksheetUri, sqlQuery) -> WorksheetQueryResult:
+        """Submits the query to Athena and records it in the history of the worksheet without waiting for it"""
+        if not sqlQuery:
+            raise exceptions.RequiredParameter(param_name='sqlQuery')
+        environment, worksheet, env_group = WorksheetService._get_query_context(session, uri, worksheetUri)
+        client = AthenaClient.client(environment.AwsAccountId, env_group, environment.region)
+        output_location = (
+            f's3://{environment.EnvironmentDefaultBucketName}/athenaqueries/{env_group.environmentAthenaWorkGroup}/'
+        )
+
+        query_id = AthenaClient.start_query(client, sqlQuery, env_group.environmentAthenaWorkGroup, output_location)
+        query_result = WorksheetQueryResult(
+            worksheetUri=worksheet.worksheetUri,
+            AthenaQueryId=query_id,
+            status='QUEUED',
+            queryType=QueryType.data,
+            sqlBody=sqlQuery,
+            AwsAccountId=environment.AwsAccountId,
             region=environment.region,
-            sql=sqlQuery
+            OutputLocation=output_location,
+        )
+        session.add(query_result)
+        worksheet.lastSavedAthenaQueryIdForQuery = query_id
+        session.commit()
+
+        WorksheetRepository.delete_old_query_results(session, worksheet.worksheetUri, keep=QUERY_HISTORY_SIZE)
+        return query_result
+
+    @staticmethod
+    @has_resource_permission(RUN_ATHENA_QUERY)
+    def get_query_status(session, uri, worksheetUri, athenaQueryId) -> WorksheetQueryResult:
+        """Returns the query of the history, its state is read from Athena until the query finishes"""
+        query_result = WorksheetService._get_query_result(session, worksheetUri, athenaQueryId)
+        if query_result.status in FINISHED_STATES:
+            return query_result
+
+        environment, _, env_group = WorksheetService._get_query_context(session, uri, worksheetUri)
+        client = AthenaClient.client(environment.AwsAccountId, env_group, environment.region)
+        execution = AthenaClient.get_query_execution(client, athenaQueryId)
+        query_result.status = execution['Status']
+        query_result.error = execution['Error']
+        query_result.ElapsedTimeInMs = execution['ElapsedTimeInMs']
+        query_result.DataScannedInBytes = execution['DataScannedInBytes']
+        if execution['OutputLocation']:
+            query_result.OutputLocation = execution['OutputLocation']
+        session.commit()
+        return query_result
+
+    @staticmethod
+    @has_resource_permission(RUN_ATHENA_QUERY)
+    def cancel_query(session, uri, worksheetUri, athenaQueryId) -> WorksheetQueryResult:
+        query_result = WorksheetService._get_query_result(session, worksheetUri, athenaQueryId)
+        if query_result.status in FINISHED_STATES:
+            return query_result
+
+        environment, _, env_group = WorksheetService._get_query_context(session, uri, worksheetUri)
+        client = AthenaClient.client(environment.AwsAccountId, env_group, environment.region)
+        AthenaClient.stop_query(client, athenaQueryId)
+        query_result.status = 'CANCELLED'
+        session.commit()
+        return query_result
+
+    @staticmethod
+    def list_query_history(session, worksheet_uri, limit=None):
+        return WorksheetRepository.list_query_results(session, worksheet_uri, limit=limit or QUERY_HISTORY_SIZE)
+
+    @staticmethod
+    def _record_query_result(session, worksheet, environment, sql_query, output_location, result):
+        query_id = result.get('AthenaQueryId')
+        if not query_id or result.get('error'):
+            return
+        if session.query(WorksheetQueryResult).get(query_id):
+            return
+        session.add(
+            WorksheetQueryResult(
+                worksheetUri=worksheet.worksheetUri,
+                AthenaQueryId=query_id,
+                status='SUCCEEDED',
+                queryType=QueryType.data,
+                sqlBody=sql_query,
+                AwsAccountId=environment.AwsAccountId,
+                region=environment.region,
+                OutputLocation=output_location,
+                ElapsedTimeInMs=result.get('ElapsedTimeInMs'),
+                DataScannedInBytes=result.get('DataScannedInBytes'),
+            )
         )
+        session.commit()
+        WorksheetRepository.delete_old_query_results(session, worksheet.worksheetUri, keep=QUERY_HISTORY_SIZE)
+
+    @staticmethod
+    def _get_query_result(session, worksheet_uri, athena_query_id) -> WorksheetQueryResult:
+        if not athena_query_id:
+            raise exceptions.RequiredParameter(param_name='athenaQueryId')
+        query_result = WorksheetRepository.find_query_result(session, worksheet_uri, athena_query_id)
+        if not query_result:
+            raise exceptions.ObjectNotFound('WorksheetQueryResult', athena_query_id)
+        return query_result
 
-        return AthenaClient.convert_query_output(cursor)
+    @staticmethod
+    def _get_query_context(session, environment_uri, worksheet_uri):
+        environment = EnvironmentService.get_environment_by_uri(session, environment_uri)
+        worksheet = WorksheetService.get_worksheet_by_uri(session, worksheet_uri)
+
+        env_group = EnvironmentService.get_environment_group(
+            session, worksheet.SamlAdminGroupName, environment.environmentUri
+        )
+        return environment, worksheet, env_group
@@ -0,0 +1,29 @@
+"""add catalog indexer state
+
+Revision ID: a4ba8f1e2c7d
+Revises: 8c79fb896983
+Create Date: 2026-10-18 10:12:41.520147
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'a4ba8f1e2c7d'
+down_revision = '8c79fb896983'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'catalog_indexer_state',
+        sa.Column('indexerName', sa.String(), nullable=False),
+        sa.Column('highWaterMark', sa.DateTime(), nullable=True),
+        sa.Column('updated', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('indexerName'),
+    )
+
+
+def downgrade():
+    op.drop_table('catalog_indexer_state')
@@ -0,0 +1,25 @@
+"""add stack refresh timestamps
+
+Revision ID: a7d3e9f0c482
+Revises: f6a2c8d1b947
+Create Date: 2026-10-18 18:10:37.901256
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3e9f0c482'
+down_revision = 'f6a2c8d1b947'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('stack', sa.Column('lastRefreshed', sa.DateTime(), nullable=True))
+    op.add_column('stack', sa.Column('refreshRequested', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('stack', 'refreshRequested')
+    op.drop_column('stack', 'lastRefreshed')
@@ -0,0 +1,38 @@
+"""add stack events
+
+Revision ID: b2c8f4e1d376
+Revises: a7d3e9f0c482
+Create Date: 2026-10-18 19:02:14.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b2c8f4e1d376'
+down_revision = 'a7d3e9f0c482'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'stack_event',
+        sa.Column('EventId', sa.String(), nullable=False),
+        sa.Column('stackUri', sa.String(), nullable=False),
+        sa.Column('Timestamp', sa.DateTime(), nullable=False),
+        sa.Column('ResourceStatus', sa.String(), nullable=True),
+        sa.Column('ResourceStatusReason', sa.String(), nullable=True),
+        sa.Column('LogicalResourceId', sa.String(), nullable=True),
+        sa.Column('PhysicalResourceId', sa.String(), nullable=True),
+        sa.Column('ResourceType', sa.String(), nullable=True),
+        sa.Column('StackName', sa.String(), nullable=True),
+        sa.Column('StackId', sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint('EventId'),
+    )
+    op.create_index(op.f('ix_stack_event_stackUri'), 'stack_event', ['stackUri'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_stack_event_stackUri'), table_name='stack_event')
+    op.drop_table('stack_event')
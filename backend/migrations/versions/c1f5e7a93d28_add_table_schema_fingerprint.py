@@ -0,0 +1,23 @@
+"""add table schema fingerprint
+
+Revision ID: c1f5e7a93d28
+Revises: a4ba8f1e2c7d
+Create Date: 2026-10-18 14:03:27.114820
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c1f5e7a93d28'
+down_revision = 'a4ba8f1e2c7d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('dataset_table', sa.Column('schemaFingerprint', sa.String(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('dataset_table', 'schemaFingerprint')
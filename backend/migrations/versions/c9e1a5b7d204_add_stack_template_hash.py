@@ -0,0 +1,23 @@
+"""add stack template hash
+
+Revision ID: c9e1a5b7d204
+Revises: b2c8f4e1d376
+Create Date: 2026-10-18 19:48:51.330617
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c9e1a5b7d204'
+down_revision = 'b2c8f4e1d376'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('stack', sa.Column('templateHash', sa.String(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('stack', 'templateHash')
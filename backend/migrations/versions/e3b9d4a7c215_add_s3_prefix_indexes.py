@@ -0,0 +1,37 @@
+"""add s3 prefix indexes
+
+Revision ID: e3b9d4a7c215
+Revises: c1f5e7a93d28
+Create Date: 2026-10-18 16:21:45.307912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'e3b9d4a7c215'
+down_revision = 'c1f5e7a93d28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_dataset_table_s3_prefix',
+        'dataset_table',
+        ['AWSAccountId', 'region', 'S3Prefix'],
+        unique=False,
+        postgresql_ops={'S3Prefix': 'text_pattern_ops'},
+    )
+    op.create_index(
+        'ix_dataset_storage_location_s3_prefix',
+        'dataset_storage_location',
+        ['AWSAccountId', 'region', 'S3Prefix'],
+        unique=False,
+        postgresql_ops={'S3Prefix': 'text_pattern_ops'},
+    )
+
+
+def downgrade():
+    op.drop_index('ix_dataset_storage_location_s3_prefix', table_name='dataset_storage_location')
+    op.drop_index('ix_dataset_table_s3_prefix', table_name='dataset_table')
@@ -0,0 +1,39 @@
+"""worksheet query history
+
+Revision ID: f6a2c8d1b947
+Revises: e3b9d4a7c215
+Create Date: 2026-10-18 17:02:11.648203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'f6a2c8d1b947'
+down_revision = 'e3b9d4a7c215'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        'worksheet_query_result',
+        'DataScannedInBytes',
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=True,
+    )
+    op.create_index(
+        op.f('ix_worksheet_query_result_worksheetUri'), 'worksheet_query_result', ['worksheetUri'], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index(op.f('ix_worksheet_query_result_worksheetUri'), table_name='worksheet_query_result')
+    op.alter_column(
+        'worksheet_query_result',
+        'DataScannedInBytes',
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=True,
+    )
@@ -0,0 +1,29 @@
+import { gql } from 'apollo-boost';
+
+export const cancelWorksheetQuery = ({
+  environmentUri,
+  worksheetUri,
+  athenaQueryId
+}) => ({
+  variables: {
+    environmentUri,
+    worksheetUri,
+    athenaQueryId
+  },
+  mutation: gql`
+    mutation cancelWorksheetQuery(
+      $environmentUri: String!
+      $worksheetUri: String!
+      $athenaQueryId: String!
+    ) {
+      cancelWorksheetQuery(
+        environmentUri: $environmentUri
+        worksheetUri: $worksheetUri
+        athenaQueryId: $athenaQueryId
+      ) {
+        AthenaQueryId
+        status
+      }
+    }
+  `
+});
@@ -0,0 +1,42 @@
+import { gql } from 'apollo-boost';
+
+export const getAthenaQueryResults = ({
+  environmentUri,
+  worksheetUri,
+  athenaQueryId,
+  nextToken,
+  pageSize
+}) => ({
+  variables: {
+    environmentUri,
+    worksheetUri,
+    athenaQueryId,
+    nextToken,
+    pageSize
+  },
+  query: gql`
+    query getAthenaQueryResults(
+      $environmentUri: String!
+      $worksheetUri: String!
+      $athenaQueryId: String!
+      $nextToken: String
+      $pageSize: Int
+    ) {
+      getAthenaQueryResults(
+        environmentUri: $environmentUri
+        worksheetUri: $worksheetUri
+        athenaQueryId: $athenaQueryId
+        nextToken: $nextToken
+        pageSize: $pageSize
+      ) {
+        AthenaQueryId
+        columns {
+          columnName
+          typeName
+        }
+        rows
+        nextToken
+      }
+    }
+  `
+});
@@ -0,0 +1,32 @@
+import { gql } from 'apollo-boost';
+
+export const getWorksheetQueryStatus = ({
+  environmentUri,
+  worksheetUri,
+  athenaQueryId
+}) => ({
+  variables: {
+    environmentUri,
+    worksheetUri,
+    athenaQueryId
+  },
+  query: gql`
+    query getWorksheetQueryStatus(
+      $environmentUri: String!
+      $worksheetUri: String!
+      $athenaQueryId: String!
+    ) {
+      getWorksheetQueryStatus(
+        environmentUri: $environmentUri
+        worksheetUri: $worksheetUri
+        athenaQueryId: $athenaQueryId
+      ) {
+        AthenaQueryId
+        status
+        error
+        ElapsedTimeInMs
+        DataScannedInBytes
+      }
+    }
+  `
+});
@@ -1,6 +1,10 @@
+export * from './cancelWorksheetQuery';
 export * from './createWorksheet';
 export * from './deleteWorksheet';
+export * from './getAthenaQueryResults';
 export * from './getWorksheet';
+export * from './getWorksheetQueryStatus';
 export * from './listWorksheets';
 export * from './runAthenaSqlQuery';
+export * from './startWorksheetQuery';
 export * from './updateWorksheet';
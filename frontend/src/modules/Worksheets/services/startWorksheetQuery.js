@@ -0,0 +1,29 @@
+import { gql } from 'apollo-boost';
+
+export const startWorksheetQuery = ({
+  sqlQuery,
+  environmentUri,
+  worksheetUri
+}) => ({
+  variables: {
+    sqlQuery,
+    environmentUri,
+    worksheetUri
+  },
+  mutation: gql`
+    mutation startWorksheetQuery(
+      $environmentUri: String!
+      $worksheetUri: String!
+      $sqlQuery: String!
+    ) {
+      startWorksheetQuery(
+        environmentUri: $environmentUri
+        worksheetUri: $worksheetUri
+        sqlQuery: $sqlQuery
+      ) {
+        AthenaQueryId
+        status
+      }
+    }
+  `
+});
@@ -0,0 +1,22 @@
+from dataall.base.api.batch_loader import BatchLoader, register_siblings
+from dataall.base.context import RequestContext, set_context, dispose_context
+
+
+def test_batch_loader_coalesces_siblings(db):
+    calls = []
+
+    def batch_load(session, sources):
+        calls.append(sorted(sources.keys()))
+        return {uri: f'entity-{uri}' for uri in sources}
+
+    loader = BatchLoader('Entity', batch_load)
+    parents = [{'entityUri': 'a'}, {'entityUri': 'b'}, {'entityUri': 'a'}, {'entityUri': None}]
+
+    set_context(RequestContext(db, 'alice', ['group']))
+    try:
+        register_siblings({'nodes': parents})
+        assert [loader.load(parent, 'entityUri') for parent in parents] == ['entity-a', 'entity-b', 'entity-a', None]
+        assert loader.load({'entityUri': 'c'}, 'entityUri') == 'entity-c'
+        assert calls == [['a', 'b'], ['c']]
+    finally:
+        dispose_context()
@@ -0,0 +1,183 @@
+import json
+import os
+from types import SimpleNamespace
+
+import aws_cdk as cdk
+import pytest
+from aws_cdk import aws_ec2 as ec2
+
+import dataall.base.cdkproxy.cdk_cli_wrapper as wrapper
+from dataall.base.cdkproxy import warm_synth
+from dataall.base.cdkproxy.stacks import stack as cdk_stack
+from dataall.base.cdkproxy.stack_fingerprint import fingerprint_cloud_assembly
+from dataall.core.stacks.db.stack_models import Stack
+
+
+def write_assembly(out_dir, template, tags):
+    manifest = {
+        'artifacts': {
+            'stack': {
+                'type': 'aws:cloudformation:stack',
+                'environment': 'aws://111111111111/eu-west-1',
+                'properties': {'templateFile': 'stack.template.json', 'tags': tags},
+            },
+            'stack.assets': {
+                'type': 'cdk:asset-manifest',
+                'properties': {'file': 'stack.assets.json'},
+            },
+        }
+    }
+    files = {
+        'manifest.json': manifest,
+        'stack.template.json': template,
+        'stack.assets.json': {'files': {'abc123': {}}, 'dockerImages': {}},
+    }
+    for name, content in files.items():
+        with open(os.path.join(out_dir, name), 'w') as f:
+            json.dump(content, f)
+
+
+def test_fingerprint_cloud_assembly(tmp_path):
+    write_assembly(tmp_path, {'Resources': {'Bucket': {'Type': 'AWS::S3::Bucket'}}}, {'Team': 'a'})
+    fingerprint = fingerprint_cloud_assembly(tmp_path)
+    assert fingerprint == fingerprint_cloud_assembly(tmp_path)
+
+    write_assembly(tmp_path, {'Resources': {'Bucket': {'Type': 'AWS::S3::Bucket'}}}, {'Team': 'b'})
+    assert fingerprint_cloud_assembly(tmp_path) != fingerprint
+
+
+def test_deploy_is_skipped_when_stack_is_unchanged(db, mocker):
+    with db.scoped_session() as session:
+        stack = Stack(
+            targetUri='target', accountid='111111111111', region='eu-west-1', stack='environment', name='stack'
+        )
+        session.add(stack)
+        session.commit()
+        stack_uri = stack.stackUri
+
+    commands = []
+
+    def run_cdk_command(stack, action, app, env, cwd, extra_args=None):
+        commands.append(action)
+        if action.startswith('synth'):
+            write_assembly(extra_args[1].strip('"'), {'Resources': {}}, {'Team': 'a'})
+        return SimpleNamespace(returncode=0, stderr=None)
+
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.boto3')
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.run_cdk_command', side_effect=run_cdk_command)
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.update_stack_output')
+    mocker.patch(
+        'dataall.base.cdkproxy.cdk_cli_wrapper.describe_stack',
+        return_value={'StackId': 'arn:stack', 'StackStatus': 'UPDATE_COMPLETE'},
+    )
+    metrics = wrapper.DEPLOY_METRICS.to_dict()
+
+    wrapper.deploy_cdk_stack(db, stack_uri)
+    assert commands == ['synth --quiet', 'deploy --all --require-approval never']
+
+    wrapper.deploy_cdk_stack(db, stack_uri)
+    assert commands[2:] == ['synth --quiet']
+    with db.scoped_session() as session:
+        stack = session.query(Stack).get(stack_uri)
+        assert stack.status == 'UPDATE_COMPLETE'
+        assert stack.templateHash
+
+    assert wrapper.DEPLOY_METRICS.to_dict()['deployed'] == metrics['deployed'] + 1
+    assert wrapper.DEPLOY_METRICS.to_dict()['skipped'] == metrics['skipped'] + 1
+
+
+def test_warm_synthesis_only_runs_the_cli_to_deploy(db, mocker):
+    with db.scoped_session() as session:
+        stack = Stack(
+            targetUri='warm-target', accountid='111111111111', region='eu-west-1', stack='environment', name='warm'
+        )
+        session.add(stack)
+        session.commit()
+        stack_uri = stack.stackUri
+
+    pool = mocker.MagicMock()
+    pool.synthesize.side_effect = lambda stack, out_dir, env: write_assembly(out_dir, {'Resources': {}}, {})
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.warm_synth.get_pool', return_value=pool)
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.SKIP_UNCHANGED_DEPLOYS', False)
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.boto3')
+    run = mocker.patch(
+        'dataall.base.cdkproxy.cdk_cli_wrapper.run_cdk_command',
+        return_value=SimpleNamespace(returncode=0, stderr=None),
+    )
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.update_stack_output')
+    mocker.patch(
+        'dataall.base.cdkproxy.cdk_cli_wrapper.describe_stack',
+        return_value={'StackId': 'arn:stack', 'StackStatus': 'CREATE_COMPLETE'},
+    )
+
+    wrapper.deploy_cdk_stack(db, stack_uri)
+    pool.synthesize.assert_called_once()
+    run.assert_called_once()
+    action, app = run.call_args.args[1:3]
+    # the cloud assembly synthesized by the pool is deployed
+    assert action.startswith('deploy')
+    assert app == f'"{pool.synthesize.call_args.args[1]}"'
+
+
+def test_unchanged_stack_is_deployed_when_skipping_is_disabled(db, mocker):
+    with db.scoped_session() as session:
+        stack = Stack(
+            targetUri='always-target', accountid='111111111111', region='eu-west-1', stack='environment', name='always'
+        )
+        session.add(stack)
+        session.commit()
+        stack_uri = stack.stackUri
+
+    pool = mocker.MagicMock()
+    pool.synthesize.side_effect = lambda stack, out_dir, env: write_assembly(out_dir, {'Resources': {}}, {})
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.warm_synth.get_pool', return_value=pool)
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.SKIP_UNCHANGED_DEPLOYS', False)
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.boto3')
+    refresh = mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.refresh_unchanged_stack', return_value=True)
+    run = mocker.patch(
+        'dataall.base.cdkproxy.cdk_cli_wrapper.run_cdk_command',
+        return_value=SimpleNamespace(returncode=0, stderr=None),
+    )
+    mocker.patch('dataall.base.cdkproxy.cdk_cli_wrapper.update_stack_output')
+    mocker.patch(
+        'dataall.base.cdkproxy.cdk_cli_wrapper.describe_stack',
+        return_value={'StackId': 'arn:stack', 'StackStatus': 'UPDATE_COMPLETE'},
+    )
+
+    wrapper.deploy_cdk_stack(db, stack_uri)
+    wrapper.deploy_cdk_stack(db, stack_uri)
+    assert [call.args[1] for call in run.call_args_list] == ['deploy --all --require-approval never'] * 2
+    refresh.assert_not_called()
+
+
+@cdk_stack('lookup-test')
+class LookupStack(cdk.Stack):
+    module_name = __name__
+
+    def __init__(self, scope, id, target_uri=None, **kwargs):
+        super().__init__(scope, id, **kwargs)
+        ec2.Vpc.from_lookup(self, 'Vpc', vpc_id='vpc-12345678')
+
+
+def test_warm_synthesis_with_missing_lookup_falls_back_to_the_cli(tmp_path, mocker):
+    stack = SimpleNamespace(
+        name='lookup', accountid='111111111111', region='eu-west-1', stack='lookup-test', targetUri='target'
+    )
+    pool = mocker.MagicMock()
+    pool.synthesize.side_effect = lambda stack, out_dir, env: warm_synth._synth(
+        {'appid': stack.name, 'account': stack.accountid, 'region': stack.region, 'stack': stack.stack,
+         'target_uri': stack.targetUri, 'data': '{}'},
+        out_dir,
+        env,
+    )
+    mocker.patch('dataall.base.cdkproxy.warm_synth.CDK_CONTEXT_JSON', str(tmp_path / 'cdk.context.json'))
+    run = mocker.patch(
+        'dataall.base.cdkproxy.cdk_cli_wrapper.run_cdk_command',
+        return_value=SimpleNamespace(returncode=1, stderr=None),
+    )
+
+    assert wrapper.synth_fingerprint(stack, 'app', str(tmp_path / 'cdk.out'), {}, str(tmp_path), pool) is None
+    with pytest.raises(warm_synth.MissingContextError):
+        pool.synthesize.side_effect(stack, str(tmp_path / 'cdk.out'), {})
+    # the lookup is resolved by cdk synth
+    assert run.call_args.args[1] == 'synth --quiet'
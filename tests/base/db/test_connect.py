@@ -1,4 +1,5 @@
 import os
+import threading
 import dataall
 
 
@@ -17,3 +18,24 @@ def test(db: dataall.base.db.Engine):
                 assert nb == 0
     else:
         assert True
+
+
+def test_sessions_per_thread(db: dataall.base.db.Engine):
+    sessions = {}
+
+    def open_session(name):
+        with db.scoped_session() as session:
+            with db.scoped_session() as nested:
+                assert nested is session
+            session.execute('select 1')
+            sessions[name] = session
+
+    thread = threading.Thread(target=open_session, args=('thread',))
+    thread.start()
+    thread.join()
+    open_session('main')
+
+    assert sessions['thread'] is not sessions['main']
+    metrics = db.pool_metrics()
+    assert metrics['checked_out'] == 0
+    assert metrics['checkouts'] >= 2
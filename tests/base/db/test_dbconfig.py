@@ -56,3 +56,28 @@ def test_correct_config():
         db='dataall',
         schema='dev'
     )
+
+
+def test_pool_config():
+    config = DbConfig(
+        user='dataall',
+        pwd='q68rjdm_aX',
+        host="dataall.eu-west-1.rds.amazonaws.com",
+        db='dataall',
+        schema='dev',
+        pool_size=5,
+        pool_pre_ping=True,
+    )
+    assert config.pool_size == 5
+    assert config.max_overflow == 10
+    assert config.pool_pre_ping
+
+    with pytest.raises(ValueError):
+        DbConfig(
+            user='dataall',
+            pwd='q68rjdm_aX',
+            host="dataall.eu-west-1.rds.amazonaws.com",
+            db='dataall',
+            schema='dev',
+            pool_size=0,
+        )
@@ -0,0 +1,86 @@
+import pytest
+
+from dataall.base.db import exceptions, paginate_keyset
+from dataall.base.db.paginator import decode_cursor, encode_cursor
+from dataall.core.tasks.db.task_models import Task
+
+
+@pytest.fixture(scope='module')
+def tasks(db):
+    with db.scoped_session() as session:
+        tasks = [Task(taskUri=f'task{i:02d}', targetUri='target', action='paginator.test') for i in range(7)]
+        session.add_all(tasks)
+        session.commit()
+    yield [task.taskUri for task in tasks]
+
+
+def _walk(session, query, **kwargs):
+    pages = []
+    cursor = None
+    while True:
+        page = paginate_keyset(query, [Task.taskUri], page_size=3, after=cursor, **kwargs)
+        pages.append([task.taskUri for task in page.items])
+        if not page.has_next:
+            return pages
+        cursor = page.end_cursor
+
+
+def test_keyset_forward(db, tasks):
+    with db.scoped_session() as session:
+        query = session.query(Task).filter(Task.action == 'paginator.test')
+        assert _walk(session, query) == [tasks[0:3], tasks[3:6], tasks[6:7]]
+        assert _walk(session, query, descending=True) == [
+            tasks[6:3:-1], tasks[3:0:-1], tasks[0:1]
+        ]
+
+
+def test_keyset_backward(db, tasks):
+    with db.scoped_session() as session:
+        query = session.query(Task).filter(Task.action == 'paginator.test')
+        last = paginate_keyset(query, [Task.taskUri], page_size=3, after=encode_cursor(['task03']))
+        assert [task.taskUri for task in last.items] == tasks[4:7]
+        assert last.has_previous and not last.has_next
+
+        previous = paginate_keyset(query, [Task.taskUri], page_size=3, before=last.start_cursor)
+        assert [task.taskUri for task in previous.items] == tasks[1:4]
+        assert previous.has_previous and previous.has_next
+
+        # nothing after a before cursor that is past the last row
+        past_the_end = paginate_keyset(query, [Task.taskUri], page_size=3, before=encode_cursor(['task99']))
+        assert [task.taskUri for task in past_the_end.items] == tasks[4:7]
+        assert past_the_end.has_previous and not past_the_end.has_next
+
+        descending = paginate_keyset(
+            query, [Task.taskUri], page_size=3, before=encode_cursor(['task03']), descending=True
+        )
+        assert [task.taskUri for task in descending.items] == tasks[6:3:-1]
+        assert not descending.has_previous and descending.has_next
+
+
+def test_keyset_total(db, tasks):
+    with db.scoped_session() as session:
+        query = session.query(Task).filter(Task.action == 'paginator.test')
+        assert paginate_keyset(query, [Task.taskUri], page_size=3).to_dict()['count'] is None
+
+        page = paginate_keyset(query, [Task.taskUri], page_size=3, with_total=True, total_cache_key='tasks')
+        assert page.to_dict()['count'] == 7
+        assert page.to_dict()['pages'] == 3
+
+
+def test_invalid_cursor():
+    with pytest.raises(exceptions.InvalidInput):
+        decode_cursor('not-a-cursor', 1)
+    with pytest.raises(exceptions.InvalidInput):
+        decode_cursor(encode_cursor(['a', 'b']), 1)
+
+
+def test_keyset_composite_keys(db, tasks):
+    with db.scoped_session() as session:
+        query = session.query(Task).filter(Task.action == 'paginator.test')
+        first = paginate_keyset(query, [Task.created, Task.taskUri], page_size=4, descending=True)
+        second = paginate_keyset(
+            query, [Task.created, Task.taskUri], page_size=4, after=first.end_cursor, descending=True
+        )
+        uris = [task.taskUri for task in first.items + second.items]
+        assert sorted(uris) == tasks
+        assert len(uris) == 7
@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from dataall.base.aws.lakeformation_batch import LakeFormationBatchClient
+
+
+def _entries(count):
+    return [
+        LakeFormationBatchClient.table_entry('111111111111', 'db', f'table{i}', ['DESCRIBE', 'SELECT'])
+        for i in range(count)
+    ]
+
+
+def _failure(entry, code):
+    return {'RequestEntry': entry, 'Error': {'ErrorCode': code, 'ErrorMessage': code}}
+
+
+def test_grant_chunks_entries():
+    client = MagicMock()
+    client.batch_grant_permissions.return_value = {'Failures': []}
+
+    failures = LakeFormationBatchClient(client, '222222222222').grant(_entries(45))
+
+    assert failures == []
+    sizes = [len(call.kwargs['Entries']) for call in client.batch_grant_permissions.call_args_list]
+    assert sizes == [20, 20, 5]
+
+
+def test_grant_retries_only_transient_failures(mocker):
+    sleep = mocker.patch('dataall.base.aws.lakeformation_batch.time.sleep')
+    entries = _entries(3)
+    client = MagicMock()
+    client.batch_grant_permissions.side_effect = [
+        {'Failures': [_failure(entries[0], 'ConcurrentModificationException'), _failure(entries[1], 'InvalidInputException')]},
+        {'Failures': []},
+    ]
+
+    failures = LakeFormationBatchClient(client, '222222222222', backoff=0.1).grant(entries)
+
+    assert [f['RequestEntry']['Id'] for f in failures] == [entries[1]['Id']]
+    retried = client.batch_grant_permissions.call_args_list[1].kwargs['Entries']
+    assert retried == [entries[0]]
+    sleep.assert_called_once_with(0.1)
+
+
+def test_grant_raises_non_retryable_errors():
+    client = MagicMock()
+    client.batch_grant_permissions.side_effect = ClientError(
+        {'Error': {'Code': 'AccessDeniedException', 'Message': 'denied'}}, 'BatchGrantPermissions'
+    )
+    with pytest.raises(ClientError):
+        LakeFormationBatchClient(client, '222222222222').grant(_entries(1))
+
+
+def test_wait_for_table_permissions(mocker):
+    sleep = mocker.patch('dataall.base.aws.lakeformation_batch.time.sleep')
+    client = MagicMock()
+    client.list_permissions.side_effect = [
+        {'PrincipalResourcePermissions': []},
+        {'PrincipalResourcePermissions': [{'Permissions': ['DESCRIBE']}], 'NextToken': 'next'},
+        {'PrincipalResourcePermissions': [{'Permissions': ['SELECT']}]},
+    ]
+
+    batch = LakeFormationBatchClient(client, '222222222222', backoff=0.1)
+    assert batch.wait_for_table_permissions('111111111111', 'db', 'table', ['DESCRIBE', 'SELECT'])
+    assert sleep.call_count == 1
+    assert client.list_permissions.call_args.kwargs['NextToken'] == 'next'
@@ -0,0 +1,70 @@
+import datetime
+import threading
+from unittest.mock import MagicMock
+
+from dataall.base.aws.sts import SessionHelper
+
+
+def _credentials(expires_in):
+    return {
+        'AccessKeyId': 'key',
+        'SecretAccessKey': 'secret',
+        'SessionToken': 'token',
+        'Expiration': datetime.datetime.now(datetime.timezone.utc) + expires_in,
+    }
+
+
+def test_remote_session_is_reused_until_expiry(mocker):
+    SessionHelper.clear_cache()
+    sts = MagicMock()
+    sts.assume_role.side_effect = [
+        {'Credentials': _credentials(datetime.timedelta(hours=1))},
+        {'Credentials': _credentials(datetime.timedelta(minutes=1))},
+        {'Credentials': _credentials(datetime.timedelta(hours=1))},
+    ]
+    base_session = MagicMock()
+    base_session.client.return_value = sts
+    mocker.patch.object(SessionHelper, 'get_session', return_value=base_session)
+    mocker.patch.object(SessionHelper, 'get_external_id_secret', return_value=None)
+    mocker.patch.object(SessionHelper, 'get_delegation_role_name', return_value='dataallPivotRole')
+
+    session = SessionHelper.remote_session('111111111111')
+    assert SessionHelper.remote_session('111111111111') is session
+    assert SessionHelper.remote_client('111111111111', 'glue', 'eu-west-1') is \
+        SessionHelper.remote_client('111111111111', 'glue', 'eu-west-1')
+    assert sts.assume_role.call_count == 1
+
+    # credentials that are about to expire are refreshed
+    other_account = SessionHelper.remote_session('222222222222')
+    assert SessionHelper.remote_session('222222222222') is not other_account
+    assert sts.assume_role.call_count == 3
+    SessionHelper.clear_cache()
+
+
+def test_remote_sessions_are_not_shared_across_threads(mocker):
+    SessionHelper.clear_cache()
+    sts = MagicMock()
+    sts.assume_role.return_value = {'Credentials': _credentials(datetime.timedelta(hours=1))}
+    base_session = MagicMock()
+    base_session.client.return_value = sts
+    mocker.patch.object(SessionHelper, 'get_session', return_value=base_session)
+    mocker.patch.object(SessionHelper, 'get_external_id_secret', return_value=None)
+    mocker.patch.object(SessionHelper, 'get_delegation_role_name', return_value='dataallPivotRole')
+
+    session = SessionHelper.remote_session('111111111111')
+    client = SessionHelper.remote_client('111111111111', 'glue', 'eu-west-1')
+    in_thread = {}
+
+    def run():
+        in_thread['session'] = SessionHelper.remote_session('111111111111')
+        in_thread['client'] = SessionHelper.remote_client('111111111111', 'glue', 'eu-west-1')
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+
+    # the credentials are shared, the sessions and their clients are not
+    assert in_thread['session'] is not session
+    assert in_thread['client'] is not client
+    assert sts.assume_role.call_count == 1
+    SessionHelper.clear_cache()
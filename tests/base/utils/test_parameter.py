@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from dataall.base.utils import Parameter
+
+
+def _mock_ssm(mocker, get_parameter):
+    ssm = MagicMock()
+    ssm.get_parameter.side_effect = get_parameter
+    mocker.patch.object(Parameter, 'ssm', return_value=ssm)
+    Parameter.clear_cache()
+    return ssm
+
+
+def test_get_parameter_is_cached(mocker):
+    ssm = _mock_ssm(mocker, lambda Name: {'Parameter': {'Value': f'value of {Name}'}})
+
+    assert Parameter.get_parameter_by_name('/dataall/test/sqs/queue_url') == 'value of /dataall/test/sqs/queue_url'
+    assert Parameter.get_parameter_by_name('/dataall/test/sqs/queue_url') == 'value of /dataall/test/sqs/queue_url'
+    assert ssm.get_parameter.call_count == 1
+
+
+def test_missing_parameter_is_cached(mocker):
+    def not_found(Name):
+        raise ClientError({'Error': {'Code': 'ParameterNotFound'}}, 'GetParameter')
+
+    ssm = _mock_ssm(mocker, not_found)
+
+    assert Parameter.get_parameter_by_name('/dataall/test/missing') is None
+    assert Parameter.get_parameter_by_name('/dataall/test/missing') is None
+    assert ssm.get_parameter.call_count == 1
+
+
+def test_expired_parameter_is_fetched_again(mocker):
+    ssm = _mock_ssm(mocker, lambda Name: {'Parameter': {'Value': 'fetched'}})
+    Parameter._cache.put('/dataall/test/expired', 'stale', ttl=0)
+
+    assert Parameter.get_parameter_by_name('/dataall/test/expired') == 'fetched'
+    assert ssm.get_parameter.call_count == 1
+    Parameter.clear_cache()
+
+
+def test_prefetch_parameters(mocker):
+    ssm = _mock_ssm(mocker, lambda Name: {'Parameter': {'Value': 'fetched'}})
+    ssm.get_paginator.return_value.paginate.return_value = [
+        {'Parameters': [{'Name': '/dataall/test/ecs/cluster/name', 'Value': 'cluster'}]}
+    ]
+
+    assert Parameter.prefetch(env='test') == 1
+    assert Parameter.get_parameter_by_name('/dataall/test/ecs/cluster/name') == 'cluster'
+    ssm.get_parameter.assert_not_called()
+    Parameter.clear_cache()
@@ -0,0 +1,41 @@
+import time
+
+from dataall.base.utils.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(ttl=0.05, name='test')
+    cache.put('key', 'value')
+    assert cache.get('key') == 'value'
+
+    time.sleep(0.06)
+    assert cache.get('key') is None
+    assert cache.stats() == {'name': 'test', 'size': 0, 'hits': 1, 'misses': 1}
+
+
+def test_ttl_cache_get_or_load_caches_none():
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def load():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_load('missing', load) is None
+    assert cache.get_or_load('missing', load) is None
+    assert len(calls) == 1
+
+    cache.invalidate('missing')
+    assert not cache.contains('missing')
+
+
+def test_ttl_cache_max_size_and_invalidate_matching():
+    cache = TTLCache(ttl=60, max_size=2)
+    cache.put(('table1', 'q1'), 1)
+    cache.put(('table1', 'q2'), 2)
+    cache.put(('table2', 'q1'), 3)
+    assert not cache.contains(('table1', 'q1'))
+    assert cache.stats()['size'] == 2
+
+    assert cache.invalidate_matching(lambda key: key[0] == 'table1') == 1
+    assert cache.get(('table2', 'q1')) == 3
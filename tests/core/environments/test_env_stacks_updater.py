@@ -1,11 +1,38 @@
-from dataall.core.environment.tasks.env_stacks_updater import update_stacks
+from botocore.exceptions import ClientError
+
+from dataall.core.environment.tasks.env_stacks_updater import StackUpdateScheduler, update_stacks
 
 
 def test_stacks_update(db, org_fixture, env_fixture, mocker):
-    mocker.patch(
-        'dataall.core.environment.tasks.env_stacks_updater.update_stack',
-        return_value=True,
-    )
+    ecs = mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Ecs')
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.time.sleep')
+    ecs.list_running_tasks.return_value = {}
+    ecs.run_cdkproxy_task.return_value = 'arn:task/env'
+    ecs.describe_task_statuses.return_value = {'arn:task/env': 'STOPPED'}
     envs, others = update_stacks(engine=db, envname='local')
     assert envs == 1
     assert others == 0
+    ecs.run_cdkproxy_task.assert_called_once()
+    ecs.list_running_tasks.assert_called_once()
+
+
+def test_scheduler_waits_for_running_and_throttled_updates(db, env_fixture, mocker):
+    ecs = mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Ecs')
+    sleep = mocker.patch('dataall.core.environment.tasks.env_stacks_updater.time.sleep')
+    ecs.list_running_tasks.return_value = {}
+    throttled = ClientError({'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}}, 'RunTask')
+    ecs.run_cdkproxy_task.side_effect = [throttled, 'arn:task/env']
+    ecs.describe_task_statuses.side_effect = [{'arn:task/env': 'RUNNING'}, {'arn:task/env': 'STOPPED'}]
+
+    with db.scoped_session() as session:
+        scheduler = StackUpdateScheduler(session=session, envname='local', poll_interval=1)
+        scheduler.add(env_fixture.environmentUri)
+        scheduler.add('missing-target', depends_on=env_fixture.environmentUri)
+        stats = scheduler.run()
+
+    assert stats['started'] == 1
+    assert stats['completed'] == 1
+    assert ecs.run_cdkproxy_task.call_count == 2
+    # every poll describes all the running tasks at once
+    assert ecs.describe_task_statuses.call_count == 2
+    assert sleep.call_count == 3
@@ -1,7 +1,10 @@
 import pytest
 
+from dataall.base.context import RequestContext, set_context, dispose_context
+from dataall.core.permissions.db.permission_resolver import PermissionResolver
 from dataall.core.permissions.db.permission_repositories import Permission
 from dataall.core.permissions.db.permission_models import PermissionType
+from dataall.core.permissions.db.resource_policy_repositories import ResourcePolicy
 from dataall.core.permissions.db.tenant_policy_repositories import TenantPolicy
 from dataall.base.db import exceptions
 from dataall.core.permissions.permissions import MANAGE_GROUPS, ENVIRONMENT_ALL, ORGANIZATION_ALL, TENANT_ALL
@@ -60,3 +63,36 @@ def test_unauthorized_tenant_policy(db, group):
                 permission_name='UNKNOW_PERMISSION',
                 tenant_name='dataall',
             )
+
+
+def test_find_groups_with_tenant_policy(db, group, tenant):
+    with db.scoped_session() as session:
+        assert TenantPolicy.find_groups_with_tenant_policy(
+            session, [group.name, 'unknown-group'], 'dataall'
+        ) == {group.name}
+
+
+def test_permission_resolver_caches_and_invalidates(db, group, tenant):
+    resource_uri = 'resolver-test-uri'
+    context = RequestContext(db, 'alice', [group.name])
+    set_context(context)
+    try:
+        with db.scoped_session() as session:
+            resolver = PermissionResolver.for_context(context)
+            assert not resolver.has_resource_permission(session, resource_uri, ENVIRONMENT_ALL[0])
+
+            ResourcePolicy.attach_resource_policy(
+                session=session,
+                group=group.name,
+                permissions=[ENVIRONMENT_ALL[0]],
+                resource_uri=resource_uri,
+                resource_type='Environment',
+            )
+            assert PermissionResolver.for_context(context) is resolver
+            assert resolver.has_resource_permission(session, resource_uri, ENVIRONMENT_ALL[0])
+            assert not resolver.has_resource_permission(session, resource_uri, ENVIRONMENT_ALL[1])
+
+            ResourcePolicy.delete_resource_policy(session=session, group=group.name, resource_uri=resource_uri)
+            assert not resolver.has_resource_permission(session, resource_uri, ENVIRONMENT_ALL[0])
+    finally:
+        dispose_context()
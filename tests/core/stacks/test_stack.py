@@ -1,3 +1,9 @@
+import datetime
+
+from dataall.core.stacks.db.stack_event_repositories import StackEventRepository
+from dataall.core.stacks.db.stack_repositories import Stack
+
+
 def test_update_stack(
     client,
     tenant,
@@ -27,3 +33,107 @@ def update_stack_query(client, target_uri, target_type, group):
         groups=[group],
     )
     return response
+
+
+def test_get_stack_queues_a_single_refresh(client, db, group, env_fixture, mocker):
+    queue = mocker.patch('dataall.core.stacks.api.stack_helper.Worker.queue')
+    with db.scoped_session() as session:
+        stack_uri = Stack.get_stack_by_target_uri(session, env_fixture.environmentUri).stackUri
+
+    def get_stack():
+        return client.query(
+            """
+            query getStack($environmentUri:String!, $stackUri:String!){
+                getStack(environmentUri:$environmentUri, stackUri:$stackUri){
+                    stackUri
+                    status
+                    lastRefreshed
+                }
+            }
+            """,
+            environmentUri=env_fixture.environmentUri,
+            stackUri=stack_uri,
+            username='alice',
+            groups=[group.name],
+        )
+
+    assert get_stack().data.getStack.stackUri == stack_uri
+    assert get_stack().data.getStack.lastRefreshed is None
+    assert queue.call_count == 1
+
+    with db.scoped_session() as session:
+        stack = Stack.get_stack_by_uri(session, stack_uri)
+        stack.lastRefreshed = datetime.datetime.now()
+        session.commit()
+
+    assert get_stack().data.getStack.lastRefreshed
+    assert queue.call_count == 1
+
+
+def _event(event_id, minute):
+    return {
+        'EventId': event_id,
+        'StackName': 'stack',
+        'LogicalResourceId': event_id,
+        'ResourceStatus': 'CREATE_COMPLETE',
+        'Timestamp': datetime.datetime(2023, 1, 1, 0, minute, tzinfo=datetime.timezone.utc),
+    }
+
+
+def test_stack_events_are_ingested_incrementally(client, db, group, env_fixture, mocker):
+    with db.scoped_session() as session:
+        stack_uri = Stack.get_stack_by_target_uri(session, env_fixture.environmentUri).stackUri
+
+    cfn = mocker.MagicMock()
+    cfn.describe_stack_events.side_effect = [
+        {'StackEvents': [_event('e4', 4), _event('e3', 3)], 'NextToken': 'next'},
+        {'StackEvents': [_event('e2', 2), _event('e1', 1)]},
+    ]
+    with db.scoped_session() as session:
+        assert StackEventRepository.ingest_events(session, stack_uri, cfn, 'stack') == 4
+        session.commit()
+
+    # only the page with the new events is read
+    cfn.describe_stack_events.reset_mock()
+    cfn.describe_stack_events.side_effect = [
+        {'StackEvents': [_event('e6', 6), _event('e5', 5), _event('e4', 4)], 'NextToken': 'next'},
+    ]
+    with db.scoped_session() as session:
+        assert StackEventRepository.ingest_events(session, stack_uri, cfn, 'stack', max_events=4) == 2
+        session.commit()
+    cfn.describe_stack_events.assert_called_once_with(StackName='stack')
+
+    # an overlapping refresh that read the stored events before the previous one committed
+    mocker.patch.object(StackEventRepository, '_find_known_event_ids', return_value=set())
+    cfn.describe_stack_events.side_effect = [{'StackEvents': [_event('e6', 6), _event('e5', 5)]}]
+    with db.scoped_session() as session:
+        assert StackEventRepository.ingest_events(session, stack_uri, cfn, 'stack', max_events=4) == 0
+        session.commit()
+    mocker.stopall()
+
+    response = client.query(
+        """
+        query getStack($environmentUri:String!, $stackUri:String!, $filter:StackEventFilter){
+            getStack(environmentUri:$environmentUri, stackUri:$stackUri){
+                events
+                stackEvents(filter:$filter){
+                    count
+                    hasNext
+                    nodes {
+                        EventId
+                    }
+                }
+            }
+        }
+        """,
+        environmentUri=env_fixture.environmentUri,
+        stackUri=stack_uri,
+        filter={'page': 1, 'pageSize': 3},
+        username='alice',
+        groups=[group.name],
+    )
+    # the history is capped to the 4 most recent events
+    assert response.data.getStack.stackEvents.count == 4
+    assert response.data.getStack.stackEvents.hasNext
+    assert [e.EventId for e in response.data.getStack.stackEvents.nodes] == ['e6', 'e5', 'e4']
+    assert 'e6' in response.data.getStack.events
@@ -0,0 +1,57 @@
+import pytest
+
+from dataall.core.tasks.db.task_models import Task
+from dataall.core.tasks.service_handlers import WorkerHandler
+
+
+@pytest.fixture
+def worker():
+    worker = WorkerHandler()
+
+    @worker.handler(path='test.succeed')
+    def succeed(engine, task: Task):
+        return {'target': task.targetUri}
+
+    @worker.handler(path='test.fail')
+    def fail(engine, task: Task):
+        raise Exception('failure')
+
+    return worker
+
+
+def _create_tasks(db, *actions, status='pending'):
+    with db.scoped_session() as session:
+        tasks = [Task(targetUri=f'target{i}', action=action, status=status) for i, action in enumerate(actions)]
+        session.add_all(tasks)
+        session.commit()
+        return [task.taskUri for task in tasks]
+
+
+def _statuses(db, task_ids):
+    with db.scoped_session() as session:
+        return [session.query(Task).get(task_id).status for task_id in task_ids]
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_process_all_tasks(db, worker, max_workers):
+    worker.max_workers = max_workers
+    task_ids = _create_tasks(db, 'test.succeed', 'test.fail', 'test.succeed', 'test.unknown')
+
+    responses = worker.process(db, task_ids)
+
+    assert [r['taskUri'] for r in responses] == task_ids
+    assert [r['status'] for r in responses] == ['completed', 'failed', 'completed', 'failed']
+    assert responses[2]['response'] == {'target': 'target2'}
+    assert all(r['duration'] >= 0 for r in responses)
+    assert _statuses(db, task_ids) == ['completed', 'failed', 'completed', 'failed']
+
+
+def test_process_skips_claimed_tasks(db, worker):
+    started = _create_tasks(db, 'test.succeed', status='started')
+    pending = _create_tasks(db, 'test.succeed')
+
+    responses = worker.process(db, started + pending + ['missing'])
+
+    assert [r['taskUri'] for r in responses] == pending
+    assert _statuses(db, started + pending) == ['started', 'completed']
+    assert worker.process(db, pending) == []
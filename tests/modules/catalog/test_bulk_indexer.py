@@ -0,0 +1,93 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.modules.catalog.indexers.base_indexer import BaseIndexer
+from dataall.modules.catalog.indexers.bulk_indexer import BulkIndexer
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.bulk.return_value = {'errors': False, 'items': []}
+    return client
+
+
+def _sent_ids(client):
+    ids = []
+    for call in client.bulk.call_args_list:
+        for line in call.kwargs['body']:
+            action = next(iter(line.values()))
+            if isinstance(action, dict) and '_id' in action:
+                ids.append(action['_id'])
+    return ids
+
+
+def test_flushes_by_document_count(client):
+    bulk = BulkIndexer(lambda: client, 'index', max_docs=2)
+    for i in range(5):
+        bulk.index(f'doc{i}', {'name': i})
+    bulk.flush()
+
+    assert client.bulk.call_count == 3
+    assert _sent_ids(client) == ['doc0', 'doc1', 'doc2', 'doc3', 'doc4']
+    assert bulk.stats()['batches'] == 3
+    assert bulk.stats()['sent'] == 5
+
+
+def test_flushes_by_size(client):
+    bulk = BulkIndexer(lambda: client, 'index', max_bytes=100)
+    bulk.index('doc1', {'description': 'a' * 60})
+    bulk.index('doc2', {'description': 'b' * 60})
+    assert client.bulk.call_count == 1
+
+    bulk.flush()
+    assert client.bulk.call_count == 2
+
+
+def test_deduplicates_pending_documents(client):
+    bulk = BulkIndexer(lambda: client, 'index')
+    bulk.index('dataset', {'tables': 1})
+    bulk.index('dataset', {'tables': 2})
+    bulk.delete('table')
+    bulk.flush()
+
+    body = client.bulk.call_args.kwargs['body']
+    assert body == [
+        {'index': {'_index': 'index', '_id': 'dataset'}},
+        {'tables': 2},
+        {'delete': {'_index': 'index', '_id': 'table'}},
+    ]
+    assert bulk.deduplicated == 1
+    assert bulk.contains('dataset')
+
+
+def test_reports_failures(client):
+    client.bulk.return_value = {
+        'errors': True,
+        'items': [
+            {'index': {'_id': 'doc1', 'status': 201}},
+            {'index': {'_id': 'doc2', 'status': 400, 'error': {'type': 'mapper_parsing_exception'}}},
+        ],
+    }
+    bulk = BulkIndexer(lambda: client, 'index')
+    bulk.index('doc1', {})
+    bulk.index('doc2', {})
+    bulk.flush()
+
+    assert bulk.failed == 1
+    assert bulk.errors[0]['id'] == 'doc2'
+
+
+def test_bulk_mode(client, mocker):
+    mocker.patch.object(BaseIndexer, 'es', return_value=client)
+    with BaseIndexer.bulk() as bulk:
+        bulk.index('dataset', {})
+        assert BaseIndexer.indexed_in_bulk('dataset')
+        with BaseIndexer.bulk() as nested:
+            assert nested is bulk
+        assert client.bulk.call_count == 0
+
+    assert client.bulk.call_count == 1
+    assert BaseIndexer.current_bulk() is None
+    assert not BaseIndexer.indexed_in_bulk('dataset')
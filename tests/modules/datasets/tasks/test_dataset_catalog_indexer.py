@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import pytest
 
 from dataall.modules.catalog.tasks.catalog_indexer_task import index_objects
@@ -48,14 +50,34 @@ def table(org, env, db, sync_dataset):
 
 
 def test_catalog_indexer(db, org, env, sync_dataset, table, mocker):
-    mocker.patch(
-        'dataall.modules.datasets.indexers.table_indexer.DatasetTableIndexer.upsert_all',
-        return_value=[table]
-    )
-    mocker.patch(
-        'dataall.modules.datasets.indexers.dataset_indexer.DatasetIndexer.upsert', return_value=sync_dataset
-    )
+    index = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._index')
     indexed_objects_counter = index_objects(
         engine=db
     )
     assert indexed_objects_counter == 2
+    assert {call.kwargs['doc_id'] for call in index.call_args_list} == {sync_dataset.datasetUri, table.tableUri}
+
+
+def test_catalog_indexer_incremental(db, sync_dataset, table, mocker):
+    mocker.patch('dataall.modules.catalog.tasks.catalog_indexer_task.HIGH_WATER_MARK_OVERLAP', timedelta(0))
+    index_objects(engine=db)
+
+    index = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._index')
+    delete = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer.delete_doc')
+    assert index_objects(engine=db) == 0
+    index.assert_not_called()
+
+    with db.scoped_session() as session:
+        session.query(DatasetTable).get(table.tableUri).description = 'new description'
+    assert index_objects(engine=db) == 2
+    assert {call.kwargs['doc_id'] for call in index.call_args_list} == {sync_dataset.datasetUri, table.tableUri}
+
+    index.reset_mock()
+    with db.scoped_session() as session:
+        session.query(DatasetTable).get(table.tableUri).LastGlueTableStatus = 'Deleted'
+    assert index_objects(engine=db) == 1
+    assert [call.kwargs['doc_id'] for call in index.call_args_list] == [sync_dataset.datasetUri]
+    delete.assert_called_once_with(doc_id=table.tableUri)
+
+    index.reset_mock()
+    assert index_objects(engine=db, full=True) == 1
@@ -1,3 +1,5 @@
+import json
+from datetime import timedelta
 from unittest.mock import MagicMock
 
 import pytest
@@ -8,6 +10,8 @@ from dataall.modules.dataset_sharing.db.enums import ShareObjectStatus, ShareIte
 from dataall.modules.dataset_sharing.db.share_object_models import ShareObjectItem, ShareObject
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable, Dataset
 from dataall.modules.datasets.tasks.dataset_subscription_task import DatasetSubscriptionService
+from dataall.modules.datasets.tasks.subscriptions.prefix_index import DatasetPrefixResolver, S3PrefixIndex
+from dataall.modules.datasets.tasks.subscriptions.sqs_poller import SqsPoller
 
 
 @pytest.fixture(scope='module')
@@ -103,3 +107,116 @@ def test_subscriptions(org, env, otherenv, db, dataset, share, mocker):
     queues = subscriber.get_queues(envs)
     assert queues
     assert subscriber.notify_consumers(db, messages)
+
+
+def test_s3_prefix_index():
+    index = S3PrefixIndex()
+    index.add('table1', 's3://bucket/sales/csv/', '111', 'eu-west-1')
+    index.add('table2', 's3://bucket/orders/', '111', 'eu-west-1')
+    index.add('table3', 's3://bucket/sales/csv/', '222', 'eu-west-1')
+
+    assert index.find('s3://bucket/sales/', '111', 'eu-west-1') == 'table1'
+    assert index.find('s3://bucket/sales/', '222', 'eu-west-1') == 'table3'
+    assert index.find('s3://bucket/sales/', '111', 'us-east-1') is None
+    assert index.find('s3://bucket/sales/csv/file.csv', '111', 'eu-west-1') is None
+    assert index.find(None, '111', 'eu-west-1') is None
+
+    index.add('table1', 's3://bucket/customers/', '111', 'eu-west-1')
+    assert index.find('s3://bucket/sales/', '111', 'eu-west-1') is None
+    index.remove('table2')
+    assert index.find('s3://bucket/orders/', '111', 'eu-west-1') is None
+    assert len(index) == 2
+
+
+def test_prefix_resolver_resolves_batch(db, dataset, share):
+    resolver = DatasetPrefixResolver()
+    messages = [
+        {'prefix': 's3://dataset/testtable/', 'accountid': dataset.AwsAccountId, 'region': dataset.region},
+        {'prefix': 's3://dataset/unknown/', 'accountid': dataset.AwsAccountId, 'region': dataset.region},
+    ]
+    with db.scoped_session() as session:
+        resolved = resolver.resolve(session, messages)
+        assert [(table.tableUri if table else None) for _, table, _ in resolved] == ['foo', None]
+
+        # an indexed table that no longer exists falls back to the database lookup
+        resolver.tables.add('deleted', 's3://dataset/testtable/', dataset.AwsAccountId, dataset.region)
+        resolved = resolver.resolve(session, messages[:1])
+        assert resolved[0][1].tableUri == 'foo'
+        assert resolver.fallbacks == 1
+        assert resolver.tables.find('s3://dataset/testtable/', dataset.AwsAccountId, dataset.region) == 'foo'
+
+
+def test_prefix_resolver_indexes_rows_committed_late(db, dataset, share):
+    resolver = DatasetPrefixResolver()
+    with db.scoped_session() as session:
+        resolver.refresh(session)
+        # committed after the refresh by a transaction that started before it
+        session.add(
+            DatasetTable(
+                label='late',
+                name='late',
+                owner='alice',
+                datasetUri=dataset.datasetUri,
+                tableUri='late',
+                S3Prefix='s3://dataset/latetable/',
+                GlueDatabaseName=dataset.GlueDatabaseName,
+                GlueTableName='late',
+                S3BucketName=dataset.S3BucketName,
+                AWSAccountId=dataset.AwsAccountId,
+                region=dataset.region,
+                created=resolver._since - timedelta(minutes=1),
+                updated=resolver._since - timedelta(minutes=1),
+            )
+        )
+        session.commit()
+
+        message = {'prefix': 's3://dataset/latetable/', 'accountid': dataset.AwsAccountId, 'region': dataset.region}
+        resolved = resolver.resolve(session, [message])
+        assert resolved[0][1].tableUri == 'late'
+        assert resolver.fallbacks == 0
+
+
+def test_sqs_poller_streams_and_deletes_batches(mocker):
+    def sqs_message(index):
+        body = json.dumps({'Message': json.dumps({'prefix': f's3://bucket/table{index}'})})
+        return {'Body': body, 'ReceiptHandle': f'handle{index}'}
+
+    client = MagicMock()
+    client.receive_message.side_effect = [
+        {'Messages': [sqs_message(1), sqs_message(2)]},
+        {'Messages': [sqs_message(3), {'Body': 'not json', 'ReceiptHandle': 'invalid'}]},
+        {},
+    ]
+    client.delete_message_batch.return_value = {'Successful': [], 'Failed': []}
+    create_client = mocker.patch('dataall.modules.datasets.tasks.subscriptions.sqs_poller.boto3.client', return_value=client)
+    queues = [{'url': 'https://sqs.eu-west-1.amazonaws.com/111/queue', 'region': 'eu-west-1'}]
+
+    batches = []
+    stats = SqsPoller(queues, wait_time_seconds=1).stream(batches.append)
+
+    create_client.assert_called_once()
+    assert [[m['prefix'] for m in batch] for batch in batches] == [
+        ['s3://bucket/table1', 's3://bucket/table2'],
+        ['s3://bucket/table3'],
+    ]
+    assert client.receive_message.call_args.kwargs['WaitTimeSeconds'] == 1
+    assert client.delete_message_batch.call_count == 2
+    assert [e['ReceiptHandle'] for e in client.delete_message_batch.call_args.kwargs['Entries']] == ['handle3', 'invalid']
+    assert stats == {'received': 4, 'processed': 3, 'deleted': 4, 'failed': 0}
+
+
+def test_sqs_poller_keeps_messages_when_processing_fails(mocker):
+    client = MagicMock()
+    client.receive_message.side_effect = [
+        {'Messages': [{'Body': json.dumps({'Message': '{}'}), 'ReceiptHandle': 'handle'}]},
+        {},
+    ]
+    mocker.patch('dataall.modules.datasets.tasks.subscriptions.sqs_poller.boto3.client', return_value=client)
+
+    def handler(messages):
+        raise Exception('database unavailable')
+
+    stats = SqsPoller([{'url': 'queue', 'region': 'eu-west-1'}]).stream(handler)
+
+    client.delete_message_batch.assert_not_called()
+    assert stats['failed'] == 1
@@ -1,8 +1,9 @@
+import threading
 from unittest.mock import MagicMock
 
 import pytest
 from dataall.modules.datasets_base.db.dataset_models import DatasetTable
-from dataall.modules.datasets.tasks.tables_syncer import sync_tables
+from dataall.modules.datasets.tasks.tables_syncer import run_by_account, sync_tables
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -106,3 +107,47 @@ def test_tables_sync(db, org, env, sync_dataset, table_fixture, mocker):
         )
         assert saved_table
         assert saved_table.GlueTableName == 'table1'
+
+
+def test_tables_sync_concurrent(db, create_dataset, org_fixture, env_fixture, sync_dataset, mocker):
+    failing_dataset = create_dataset(org_fixture, env_fixture, 'failing')
+
+    def crawler(dataset):
+        client = MagicMock()
+        if dataset.datasetUri == failing_dataset.datasetUri:
+            client.list_glue_database_tables.side_effect = Exception('AccessDenied')
+        else:
+            client.list_glue_database_tables.return_value = []
+        return client
+
+    mocker.patch('dataall.modules.datasets.tasks.tables_syncer.DatasetCrawler', side_effect=crawler)
+    mocker.patch('dataall.modules.datasets.tasks.tables_syncer.is_assumable_pivot_role', return_value=True)
+    mocker.patch('dataall.modules.datasets.tasks.tables_syncer.LakeFormationTableClient')
+    mocker.patch('dataall.base.aws.sts.SessionHelper.get_delegation_role_arn', return_value='arn:role')
+    alarm = mocker.patch('dataall.modules.datasets.tasks.tables_syncer.DatasetAlarmService')
+
+    processed_tables = sync_tables(engine=db, max_workers=4, max_workers_per_account=1)
+
+    assert {table.datasetUri for table in processed_tables} == {sync_dataset.datasetUri}
+    alarm().trigger_dataset_sync_failure_alarm.assert_called_once()
+
+
+def test_tables_sync_does_not_block_on_clustered_accounts():
+    # the datasets of account A come first, A can only sync one dataset at a time
+    datasets = [(f'a{i}', 'A') for i in range(4)] + [('b0', 'B'), ('b1', 'B')]
+    other_account_started = threading.Event()
+    calls = []
+
+    def sync(dataset_uri, account):
+        calls.append(dataset_uri)
+        if account == 'B':
+            other_account_started.set()
+        elif dataset_uri == 'a0':
+            # a free worker must pick the dataset of B instead of waiting for a slot of A
+            assert other_account_started.wait(timeout=5)
+        return dataset_uri
+
+    results = run_by_account(datasets, sync, max_workers=2, max_workers_per_account=1)
+
+    assert results == [dataset_uri for dataset_uri, _ in datasets]
+    assert calls.index('b0') < calls.index('a1')
@@ -665,6 +665,43 @@ def test_revoke_external_account_access_on_source_account(
     lf_mock.assert_called_once()
 
 
+def test_share_tables_with_target_account(
+        db,
+        processor_cross_account: ProcessLFCrossAccountShare,
+        table1: DatasetTable,
+        table2: DatasetTable,
+        mocker,
+):
+    # Given
+    mocker.patch(
+        "dataall.base.aws.sts.SessionHelper.remote_session",
+        return_value=boto3.Session(),
+    )
+    revoke_mock = mocker.patch(f"{LF_CLIENT}.batch_revoke_permissions", return_value=True)
+
+    def grant(client, accountid, entries):
+        assert len(entries) == 2
+        return [{'RequestEntry': entries[1], 'Error': {'ErrorCode': 'InvalidInputException', 'ErrorMessage': 'denied'}}]
+
+    grant_mock = mocker.patch(f"{LF_CLIENT}.batch_grant_permissions", side_effect=grant)
+    wait_mock = mocker.patch(
+        "dataall.base.aws.lakeformation_batch.LakeFormationBatchClient.wait_for_table_permissions",
+        return_value=True,
+    )
+
+    # When
+    failed_tables = processor_cross_account.share_tables_with_target_account(
+        [processor_cross_account.build_share_data(table1), processor_cross_account.build_share_data(table2)]
+    )
+
+    # Then
+    revoke_mock.assert_called_once()
+    grant_mock.assert_called_once()
+    assert list(failed_tables.keys()) == [table2.GlueTableName]
+    wait_mock.assert_called_once()
+    assert wait_mock.call_args.args[2] == table1.GlueTableName
+
+
 def test_handle_share_failure(
         db,
         processor_same_account: ProcessLFSameAccountShare,
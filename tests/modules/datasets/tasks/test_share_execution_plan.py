@@ -0,0 +1,104 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataall.modules.dataset_sharing.services.share_execution_plan import ShareExecutionPlan
+
+
+@pytest.fixture
+def results():
+    return {'success': [], 'failure': {}}
+
+
+def _add_items(plan, results, *keys):
+    for key in keys:
+        plan.add_item(
+            key,
+            on_success=lambda key=key: results['success'].append(key),
+            on_failure=lambda error, key=key: results['failure'].update({key: error}),
+        )
+
+
+def _add_statement(sid):
+    def transform(policy):
+        if sid == 'broken':
+            raise ValueError('invalid statement')
+        policy['Statement'].append(sid)
+        return True
+    return transform
+
+
+def test_merges_updates_of_a_resource(results):
+    plan = ShareExecutionPlan()
+    _add_items(plan, results, 'folder1', 'folder2', 'bucket')
+    read = MagicMock(return_value={'Statement': []})
+    write = MagicMock()
+    plan.update('bucket_policy:bucket', ['folder1', 'folder2'], _add_statement('delegate'), read, write)
+    plan.update('bucket_policy:bucket', ['bucket'], _add_statement('read-only'), read, write)
+    role_policy = MagicMock()
+    plan.call('role_policy:role', ['bucket'], role_policy)
+
+    success, _ = plan.execute()
+
+    assert success
+    assert plan.resources() == []
+    read.assert_called_once()
+    write.assert_called_once_with({'Statement': ['delegate', 'read-only']})
+    role_policy.assert_called_once()
+    assert sorted(results['success']) == ['bucket', 'folder1', 'folder2']
+
+
+def test_failures_are_recorded_per_item(results):
+    plan = ShareExecutionPlan()
+    _add_items(plan, results, 'folder', 'bucket', 'other')
+    write = MagicMock()
+    plan.update('bucket_policy:bucket', ['folder'], _add_statement('broken'), lambda: {'Statement': []}, write)
+    plan.update('bucket_policy:bucket', ['bucket'], _add_statement('read-only'), lambda: {'Statement': []}, write)
+    plan.update(
+        'key_policy:key', ['other'], _add_statement('decrypt'),
+        lambda: {'Statement': []}, MagicMock(side_effect=Exception('AccessDenied')),
+    )
+
+    success, _ = plan.execute()
+
+    assert not success
+    write.assert_called_once_with({'Statement': ['read-only']})
+    assert results['success'] == ['bucket']
+    assert set(results['failure']) == {'folder', 'other'}
+
+
+def test_resources_run_concurrently_with_inline(results):
+    plan = ShareExecutionPlan(max_workers=2)
+    _add_items(plan, results, 'folder', 'bucket')
+    barrier = threading.Barrier(3, timeout=5)
+    plan.call('access_point:ap', ['folder'], barrier.wait)
+    plan.call('role_policy:role', ['bucket'], barrier.wait)
+
+    def tables():
+        barrier.wait()
+        return True
+
+    success, tables_succeed = plan.execute(inline=tables)
+
+    assert success and tables_succeed
+    assert sorted(results['success']) == ['bucket', 'folder']
+
+
+def test_items_are_recorded_when_inline_fails(results):
+    plan = ShareExecutionPlan()
+    _add_items(plan, results, 'folder', 'bucket')
+    write = MagicMock()
+    plan.update(
+        'bucket_policy:bucket', ['folder', 'bucket'], _add_statement('read-only'), lambda: {'Statement': []}, write
+    )
+
+    def inline():
+        raise RuntimeError('create_shared_database failed')
+
+    with pytest.raises(RuntimeError):
+        plan.execute(inline=inline)
+
+    write.assert_called_once_with({'Statement': ['read-only']})
+    assert sorted(results['success']) == ['bucket', 'folder']
+    assert plan.resources() == []
@@ -1,18 +1,28 @@
 import pytest
+from dataall.core.stacks.db.stack_repositories import Stack
 from dataall.modules.datasets_base.db.dataset_models import Dataset
 from dataall.core.environment.tasks.env_stacks_updater import update_stacks
 
 
 @pytest.fixture(scope='module', autouse=True)
 def sync_dataset(create_dataset, org_fixture, env_fixture, db):
-    yield create_dataset(org_fixture, env_fixture, 'dataset')
+    dataset = create_dataset(org_fixture, env_fixture, 'dataset')
+    with db.scoped_session() as session:
+        Stack.create_stack(session, env_fixture.environmentUri, 'dataset', dataset.datasetUri, 'dataset')
+    yield dataset
 
 
-def test_stacks_update(db, org, env, sync_dataset, mocker):
-    mocker.patch(
-        'dataall.core.environment.tasks.env_stacks_updater.update_stack',
-        return_value=True,
-    )
+def test_stacks_update(db, org, env, sync_dataset, env_fixture, mocker):
+    ecs = mocker.patch('dataall.core.environment.tasks.env_stacks_updater.Ecs')
+    mocker.patch('dataall.core.environment.tasks.env_stacks_updater.time.sleep')
+    ecs.list_running_tasks.return_value = {}
+    ecs.run_cdkproxy_task.side_effect = lambda stack_uri: f'arn:task/{stack_uri}'
+    ecs.describe_task_statuses.side_effect = lambda cluster_name, task_arns: {arn: 'STOPPED' for arn in task_arns}
     envs, datasets = update_stacks(engine=db, envname='local')
     assert envs == 1
     assert datasets == 1
+
+    # the dataset stack is updated once the environment stack update is finished
+    assert ecs.run_cdkproxy_task.call_count == 2
+    first_poll = ecs.describe_task_statuses.call_args_list[0].kwargs['task_arns']
+    assert len(first_poll) == 1
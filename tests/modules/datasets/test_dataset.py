@@ -80,6 +80,43 @@ def test_list_datasets(client, dataset1, group):
     assert response.data.listDatasets.nodes[0].datasetUri == dataset1.datasetUri
 
 
+def test_list_datasets_with_cursor(client, dataset1, group):
+    query = """
+        query ListDatasets($filter:DatasetFilter){
+            listDatasets(filter:$filter){
+                count
+                hasNext
+                hasPrevious
+                endCursor
+                nodes{
+                    datasetUri
+                }
+            }
+        }
+        """
+    response = client.query(
+        query,
+        filter={'cursorPagination': True, 'withCount': True, 'pageSize': 1},
+        username='alice',
+        groups=[group.name],
+    )
+    page = response.data.listDatasets
+    assert page.count == 1
+    assert page.nodes[0].datasetUri == dataset1.datasetUri
+    assert not page.hasNext
+    assert page.endCursor
+
+    response = client.query(
+        query,
+        filter={'after': page.endCursor, 'pageSize': 1},
+        username='alice',
+        groups=[group.name],
+    )
+    assert response.data.listDatasets.count is None
+    assert response.data.listDatasets.nodes == []
+    assert response.data.listDatasets.hasPrevious
+
+
 def test_update_dataset(dataset1, client, group, group2, module_mocker):
     response = client.query(
         """
@@ -1,6 +1,8 @@
 from dataall.modules.datasets.indexers.location_indexer import DatasetLocationIndexer
 from dataall.modules.datasets.indexers.table_indexer import DatasetTableIndexer
 from dataall.modules.datasets.indexers.dataset_indexer import DatasetIndexer
+from dataall.modules.datasets.indexers.dataset_documents import DatasetDocumentBuilder
+from dataall.modules.datasets_base.db.dataset_repositories import DatasetRepository
 
 
 def test_es_request():
@@ -48,3 +50,17 @@ def test_upsert_tables(db, dataset_fixture, folder_fixture):
             session, dataset_uri=dataset_fixture.datasetUri
         )
         assert len(tables) == 1
+
+
+def test_document_builder(db, dataset_fixture, table_fixture, folder_fixture, mocker):
+    index = mocker.patch('dataall.modules.catalog.indexers.base_indexer.BaseIndexer._index')
+    with db.scoped_session() as session:
+        DatasetIndexer.upsert(session, dataset_uri=dataset_fixture.datasetUri)
+        DatasetTableIndexer.upsert(session, table_uri=table_fixture.tableUri)
+        DatasetLocationIndexer.upsert(session, folder_uri=folder_fixture.locationUri)
+        expected = {call.kwargs['doc_id']: call.kwargs['doc'] for call in index.call_args_list}
+
+        dataset = DatasetRepository.get_dataset_by_uri(session, dataset_fixture.datasetUri)
+        built = {doc_id: doc for _, doc_id, doc in DatasetDocumentBuilder.build(session, [dataset])}
+
+    assert built == expected
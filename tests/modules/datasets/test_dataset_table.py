@@ -1,3 +1,4 @@
+from dataall.modules.datasets.db.dataset_table_repositories import DatasetTableRepository
 from dataall.modules.datasets.services.dataset_table_service import DatasetTableService
 from dataall.modules.datasets_base.db.dataset_models import DatasetTableColumn, DatasetTable, Dataset
 
@@ -265,6 +266,91 @@ def test_sync_tables_and_columns(client, table, dataset_fixture, db):
         assert deleted_table.LastGlueTableStatus == 'Deleted'
 
 
+def test_sync_table_columns_diff(table, dataset_fixture, db):
+    columns_table = table(dataset=dataset_fixture, name='columns_diff_table', username=dataset_fixture.owner)
+    with db.scoped_session() as session:
+        for name in ['col1', 'obsolete']:
+            session.add(
+                DatasetTableColumn(
+                    name=name,
+                    description='None',
+                    label=name,
+                    owner=columns_table.owner,
+                    datasetUri=columns_table.datasetUri,
+                    tableUri=columns_table.tableUri,
+                    AWSAccountId=columns_table.AWSAccountId,
+                    GlueDatabaseName=columns_table.GlueDatabaseName,
+                    GlueTableName=columns_table.GlueTableName,
+                    region=columns_table.region,
+                    typeName='string',
+                    columnType='column',
+                )
+            )
+        session.commit()
+
+        dataset_table = session.query(DatasetTable).get(columns_table.tableUri)
+        col1 = (
+            session.query(DatasetTableColumn)
+            .filter(DatasetTableColumn.tableUri == dataset_table.tableUri, DatasetTableColumn.name == 'col1')
+            .one()
+        )
+        glue_table = {
+            'Name': 'columns_diff_table',
+            'StorageDescriptor': {
+                'Columns': [
+                    {'Name': 'col1', 'Type': 'int', 'Comment': 'comment_col'},
+                    {'Name': 'col2', 'Type': 'string'},
+                ],
+            },
+        }
+
+        assert DatasetTableRepository.sync_table_columns(session, dataset_table, glue_table)
+        columns = {
+            c.name: c
+            for c in session.query(DatasetTableColumn).filter(DatasetTableColumn.tableUri == dataset_table.tableUri)
+        }
+        assert set(columns) == {'col1', 'col2'}
+        assert columns['col1'].columnUri == col1.columnUri
+        assert columns['col1'].typeName == 'int'
+        assert columns['col2'].description == 'No description provided'
+
+        assert not DatasetTableRepository.sync_table_columns(session, dataset_table, glue_table)
+
+
+def test_preview_table_cache(client, dataset_fixture, db, user, group, mocker):
+    mocker.patch('dataall.modules.datasets.services.dataset_table_service.AthenaTableClient.__init__', return_value=None)
+    get_table = mocker.patch(
+        'dataall.modules.datasets.services.dataset_table_service.AthenaTableClient.get_table',
+        return_value={'rows': ['["a"]'], 'fields': ['{"name": "col1"}']},
+    )
+    with db.scoped_session() as session:
+        table = session.query(DatasetTable).filter(DatasetTable.name == 'new_table').first()
+
+    def preview():
+        return client.query(
+            """
+            query PreviewTable($tableUri:String!){
+                previewTable(tableUri:$tableUri){
+                    rows
+                    fields
+                }
+            }
+            """,
+            username=user.username,
+            groups=[group.name],
+            tableUri=table.tableUri,
+        )
+
+    assert preview().data.previewTable.rows == ['["a"]']
+    assert preview().data.previewTable.rows == ['["a"]']
+    assert get_table.call_count == 1
+
+    with db.scoped_session() as session:
+        DatasetTableService.sync_existing_tables(session, dataset_fixture.datasetUri, [])
+    preview()
+    assert get_table.call_count == 2
+
+
 def test_delete_table(client, table, dataset_fixture, db, group):
     table_to_delete = table(
         dataset=dataset_fixture, name=f'table_to_update', username=dataset_fixture.owner
@@ -1,6 +1,9 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 from dataall.modules.worksheets.api.resolvers import WorksheetRole
+from dataall.modules.worksheets.aws.athena_client import AthenaClient
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -145,3 +148,261 @@ def test_update_worksheet(client, worksheet, group):
     )
 
     assert response.data.updateWorksheet.label == 'change label'
+
+
+def _results_page(rows, next_token=None):
+    return {
+        'ResultSet': {
+            'Rows': [{'Data': [{'VarCharValue': value} if value is not None else {} for value in row]} for row in rows],
+            'ResultSetMetadata': {
+                'ColumnInfo': [{'Name': 'name', 'Type': 'varchar'}, {'Name': 'total', 'Type': 'bigint'}]
+            },
+        },
+        'NextToken': next_token,
+    }
+
+
+def test_iter_query_results():
+    athena = MagicMock()
+    athena.get_query_results.side_effect = [
+        _results_page([['name', 'total'], ['a', '1'], ['b', None]], next_token='token'),
+        _results_page([['c', '3'], ['d', '4']], next_token='token2'),
+    ]
+
+    pages = list(AthenaClient.iter_query_results(athena, 'query-id', page_size=3, max_rows=3))
+
+    assert [page['rows'] for page in pages] == [[['a', 1], ['b', None]], [['c', 3]]]
+    assert pages[0]['columns'] == [
+        {'columnName': 'name', 'typeName': 'varchar'},
+        {'columnName': 'total', 'typeName': 'bigint'},
+    ]
+    assert athena.get_query_results.call_args.kwargs == {
+        'QueryExecutionId': 'query-id', 'MaxResults': 1, 'NextToken': 'token'
+    }
+
+
+def test_get_athena_query_results(client, worksheet, env_fixture, group, mocker):
+    athena = MagicMock()
+    athena.get_query_results.return_value = _results_page([['name', 'total'], ['a', '1']], next_token='token')
+    mocker.patch.object(AthenaClient, 'client', return_value=athena)
+    mocker.patch.object(AthenaClient, 'run_athena_query')
+    mocker.patch.object(
+        AthenaClient, 'convert_query_output',
+        return_value={'error': None, 'AthenaQueryId': 'query-id', 'rows': [], 'columns': []},
+    )
+    args = dict(
+        environmentUri=env_fixture.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        username='alice',
+        groups=[group.name],
+    )
+
+    def get_results(athena_query_id):
+        return client.query(
+            """
+            query GetAthenaQueryResults($environmentUri:String!, $worksheetUri:String!, $athenaQueryId:String!){
+                getAthenaQueryResults(
+                    environmentUri:$environmentUri, worksheetUri:$worksheetUri, athenaQueryId:$athenaQueryId
+                ){
+                    AthenaQueryId
+                    columns{
+                        columnName
+                        typeName
+                    }
+                    rows
+                    nextToken
+                }
+            }
+            """,
+            athenaQueryId=athena_query_id,
+            **args,
+        )
+
+    # the queries that are not in the history of the worksheet are not served
+    response = get_results('query-id')
+    assert 'query-id' in response.errors[0].message
+    athena.get_query_results.assert_not_called()
+
+    client.query(
+        """
+        query RunAthenaSqlQuery($environmentUri:String!, $worksheetUri:String!, $sqlQuery:String!){
+            runAthenaSqlQuery(environmentUri:$environmentUri, worksheetUri:$worksheetUri, sqlQuery:$sqlQuery){
+                AthenaQueryId
+            }
+        }
+        """,
+        sqlQuery='SELECT name, total FROM paged_table',
+        **args,
+    )
+
+    page = get_results('query-id').data.getAthenaQueryResults
+    assert page.rows == [['a', '1']]
+    assert page.columns[1].typeName == 'bigint'
+    assert page.nextToken == 'token'
+
+
+def test_async_worksheet_query(client, worksheet, env_fixture, group, mocker):
+    athena = MagicMock()
+    athena.start_query_execution.return_value = {'QueryExecutionId': 'async-query'}
+    athena.get_query_execution.return_value = {
+        'QueryExecution': {
+            'Status': {'State': 'RUNNING'},
+            # above the 32-bit GraphQL Int range
+            'Statistics': {'TotalExecutionTimeInMillis': 1200, 'DataScannedInBytes': 3 * 2**31},
+            'ResultConfiguration': {'OutputLocation': 's3://bucket/async-query.csv'},
+        }
+    }
+    mocker.patch.object(AthenaClient, 'client', return_value=athena)
+    args = dict(
+        environmentUri=env_fixture.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        username='alice',
+        groups=[group.name],
+    )
+
+    response = client.query(
+        """
+        mutation StartWorksheetQuery($environmentUri:String!, $worksheetUri:String!, $sqlQuery:String!){
+            startWorksheetQuery(environmentUri:$environmentUri, worksheetUri:$worksheetUri, sqlQuery:$sqlQuery){
+                AthenaQueryId
+                status
+            }
+        }
+        """,
+        sqlQuery='SELECT 1',
+        **args,
+    )
+    assert response.data.startWorksheetQuery.AthenaQueryId == 'async-query'
+    assert response.data.startWorksheetQuery.status == 'QUEUED'
+    assert athena.start_query_execution.call_args.kwargs['WorkGroup'] == 'workgroup'
+
+    status_query = """
+        query GetWorksheetQueryStatus($environmentUri:String!, $worksheetUri:String!, $athenaQueryId:String!){
+            getWorksheetQueryStatus(
+                environmentUri:$environmentUri, worksheetUri:$worksheetUri, athenaQueryId:$athenaQueryId
+            ){
+                status
+                ElapsedTimeInMs
+                DataScannedInBytes
+            }
+        }
+    """
+    response = client.query(status_query, athenaQueryId='async-query', **args)
+    assert response.data.getWorksheetQueryStatus.status == 'RUNNING'
+    assert response.data.getWorksheetQueryStatus.DataScannedInBytes == 3 * 2**31
+
+    response = client.query(
+        """
+        mutation CancelWorksheetQuery($environmentUri:String!, $worksheetUri:String!, $athenaQueryId:String!){
+            cancelWorksheetQuery(
+                environmentUri:$environmentUri, worksheetUri:$worksheetUri, athenaQueryId:$athenaQueryId
+            ){
+                status
+            }
+        }
+        """,
+        athenaQueryId='async-query',
+        **args,
+    )
+    assert response.data.cancelWorksheetQuery.status == 'CANCELLED'
+    athena.stop_query_execution.assert_called_once_with(QueryExecutionId='async-query')
+
+    # finished queries are not polled anymore
+    response = client.query(status_query, athenaQueryId='async-query', **args)
+    assert response.data.getWorksheetQueryStatus.status == 'CANCELLED'
+    assert athena.get_query_execution.call_count == 1
+
+    response = client.query(
+        """
+        query GetWorksheet($worksheetUri:String!){
+            getWorksheet(worksheetUri:$worksheetUri){
+                queryHistory{
+                    AthenaQueryId
+                    sqlBody
+                    status
+                }
+            }
+        }
+        """,
+        worksheetUri=worksheet.worksheetUri,
+        username='alice',
+        groups=[group.name],
+    )
+    # the most recent query comes first, the other tests of the module may have added theirs
+    latest = response.data.getWorksheet.queryHistory[0]
+    assert (latest.AthenaQueryId, latest.sqlBody, latest.status) == ('async-query', 'SELECT 1', 'CANCELLED')
+
+
+def test_run_sql_query_cache(client, worksheet, env_fixture, group, mocker):
+    run_query = mocker.patch.object(AthenaClient, 'run_athena_query')
+    mocker.patch.object(
+        AthenaClient, 'convert_query_output', return_value={'AthenaQueryId': 'cached', 'rows': [], 'columns': []}
+    )
+    query = """
+        query RunAthenaSqlQuery($environmentUri:String!, $worksheetUri:String!, $sqlQuery:String!){
+            runAthenaSqlQuery(environmentUri:$environmentUri, worksheetUri:$worksheetUri, sqlQuery:$sqlQuery){
+                AthenaQueryId
+            }
+        }
+    """
+    args = dict(
+        environmentUri=env_fixture.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        username='alice',
+        groups=[group.name],
+    )
+
+    for _ in range(2):
+        response = client.query(query, sqlQuery='SELECT * FROM cached_table', **args)
+        assert response.data.runAthenaSqlQuery.AthenaQueryId == 'cached'
+    assert run_query.call_count == 1
+
+    for _ in range(2):
+        client.query(query, sqlQuery='MSCK REPAIR TABLE cached_table', **args)
+    assert run_query.call_count == 3
+
+
+def test_run_sql_query_rejects_invalid_row_counts(client, worksheet, env_fixture, group, mocker):
+    run_query = mocker.patch.object(AthenaClient, 'run_athena_query')
+    args = dict(
+        environmentUri=env_fixture.environmentUri,
+        worksheetUri=worksheet.worksheetUri,
+        username='alice',
+        groups=[group.name],
+    )
+    for max_rows in [0, -1]:
+        response = client.query(
+            """
+            query RunAthenaSqlQuery($environmentUri:String!, $worksheetUri:String!, $sqlQuery:String!, $maxRows:Int){
+                runAthenaSqlQuery(
+                    environmentUri:$environmentUri, worksheetUri:$worksheetUri, sqlQuery:$sqlQuery, maxRows:$maxRows
+                ){
+                    AthenaQueryId
+                }
+            }
+            """,
+            sqlQuery='SELECT * FROM rows_table',
+            maxRows=max_rows,
+            **args,
+        )
+        assert 'maxRows' in response.errors[0].message
+    run_query.assert_not_called()
+
+    response = client.query(
+        """
+        query GetAthenaQueryResults(
+            $environmentUri:String!, $worksheetUri:String!, $athenaQueryId:String!, $pageSize:Int
+        ){
+            getAthenaQueryResults(
+                environmentUri:$environmentUri, worksheetUri:$worksheetUri, athenaQueryId:$athenaQueryId,
+                pageSize:$pageSize
+            ){
+                nextToken
+            }
+        }
+        """,
+        athenaQueryId='query-id',
+        pageSize=0,
+        **args,
+    )
+    assert 'pageSize' in response.errors[0].message